@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Almacenamiento
+===========================
+Compara el almacenamiento en CSV con el almacenamiento en SQLite para un
+conjunto sintético de países: carga completa, guardado completo,
+modificación de un único país y búsqueda filtrada.
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_almacenamiento.py [cantidad_de_paises]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+import contextlib
+import io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.carga_datos import cargar_datos_csv, guardar_datos_csv
+from modulos.almacenamiento import (
+    guardar_datos_sqlite, cargar_datos_sqlite, guardar_pais_sqlite, consultar_paises_sqlite
+)
+from modulos.consultas import buscar_paises_multiples_criterios
+
+CONTINENTES = ['África', 'América', 'Asia', 'Europa', 'Oceanía']
+
+
+def generar_paises(cantidad: int):
+    """Genera países sintéticos con nombres únicos."""
+    aleatorio = random.Random(42)
+    return [
+        {
+            'nombre': f"País {i}",
+            'poblacion': aleatorio.randint(1000, 1500000000),
+            'superficie': aleatorio.randint(1, 17000000),
+            'continente': aleatorio.choice(CONTINENTES),
+        }
+        for i in range(cantidad)
+    ]
+
+
+def medir(descripcion: str, funcion) -> float:
+    """Ejecuta una función sin mostrar su salida y devuelve los segundos transcurridos."""
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        funcion()
+    segundos = time.perf_counter() - inicio
+    print(f"   {descripcion:<45} {segundos * 1000:10.1f} ms")
+    return segundos
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    paises = generar_paises(cantidad)
+    pais_modificado = dict(paises[cantidad // 2], poblacion=123456)
+    filtros = {'continente': 'Asia', 'poblacion_min': 10000000, 'poblacion_max': 50000000}
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_csv = os.path.join(directorio, 'paises.csv')
+        ruta_db = os.path.join(directorio, 'paises.db')
+
+        print(f"\n📊 BENCHMARK DE ALMACENAMIENTO ({cantidad} países)")
+        print("=" * 60)
+
+        print("CSV:")
+        medir("Guardado completo", lambda: guardar_datos_csv(paises, ruta_csv))
+        medir("Carga completa", lambda: cargar_datos_csv(ruta_csv))
+        medir("Modificar un país (reescritura completa)",
+              lambda: guardar_datos_csv(paises, ruta_csv))
+        medir("Búsqueda filtrada (carga + filtro en memoria)",
+              lambda: buscar_paises_multiples_criterios(cargar_datos_csv(ruta_csv), **filtros))
+
+        print("SQLite:")
+        medir("Guardado completo", lambda: guardar_datos_sqlite(paises, ruta_db))
+        medir("Carga completa", lambda: cargar_datos_sqlite(ruta_db))
+        medir("Modificar un país (UPSERT de una fila)",
+              lambda: guardar_pais_sqlite(pais_modificado, ruta_db))
+        medir("Búsqueda filtrada (consulta SQL indexada)",
+              lambda: consultar_paises_sqlite(ruta_db, **filtros))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Arranque
+=====================
+Mide el arranque en frío de una consulta aislada desde la línea de comandos
+(`python main.py --buscar NOMBRE`), que no abre el menú:
+
+- Tiempo total de la consulta, comparado con el del intérprete vacío
+  (`python -c pass`) y con un presupuesto fijo (PRESUPUESTO_ARRANQUE_MS).
+- Tiempo de importación de cada módulo, según `python -X importtime`.
+- Que la consulta no importe los módulos que solo usa el menú.
+
+Termina con código 1 si se supera el presupuesto o si se importa alguno de
+esos módulos, para poder usarlo como control en la integración continua.
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_arranque.py [repeticiones] [nombre_a_buscar]
+"""
+
+import os
+import sys
+import time
+import statistics
+import subprocess
+from typing import List, Tuple
+
+CARPETA_APP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Mediana máxima aceptada para una consulta aislada, incluido el intérprete
+PRESUPUESTO_ARRANQUE_MS = 250
+
+# Módulos que una consulta aislada no debe importar
+MODULOS_DIFERIDOS = (
+    'modulos.historial', 'modulos.conjuntos', 'modulos.observador',
+    'modulos.estadisticas', 'modulos.cuantiles', 'modulos.indices', 'modulos.bitmaps',
+    'modulos.geografia', 'modulos.vistas_ordenadas', 'modulos.constructor_consultas',
+)
+
+MODULOS_A_MOSTRAR = 12
+
+
+def medir_ejecucion(argumentos: List[str], repeticiones: int) -> float:
+    """Devuelve la mediana, en milisegundos, de ejecutar un comando varias veces."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run(argumentos, cwd=CARPETA_APP, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) * 1000
+
+
+def medir_importaciones(argumentos: List[str]) -> List[Tuple[str, int, int, int]]:
+    """
+    Ejecuta un comando con -X importtime y lee los tiempos de importación.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: (módulo, propio en µs, acumulado en
+            µs, nivel de anidamiento) en el orden en que se importaron
+    """
+    salida = subprocess.run([sys.executable, '-X', 'importtime'] + argumentos[1:],
+                            cwd=CARPETA_APP, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True, check=False).stderr
+    importaciones = []
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:'):
+            continue
+        propio, acumulado, modulo = linea[len('import time:'):].split('|')
+        if not propio.strip().isdigit():
+            continue  # Encabezado
+        nivel = (len(modulo) - len(modulo.lstrip()) - 1) // 2
+        importaciones.append((modulo.strip(), int(propio), int(acumulado), nivel))
+    return importaciones
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    nombre = sys.argv[2] if len(sys.argv) > 2 else 'Argentina'
+    consulta = [sys.executable, 'main.py', '--buscar', nombre, '--plain']
+
+    # Una ejecución previa deja compilados los .pyc y registrado el checksum
+    subprocess.run(consulta, cwd=CARPETA_APP, stdout=subprocess.DEVNULL, check=False)
+
+    print(f"\n📊 BENCHMARK DE ARRANQUE (main.py --buscar {nombre!r}, {repeticiones} repeticiones)")
+    print("=" * 70)
+    interprete = medir_ejecucion([sys.executable, '-c', 'pass'], repeticiones)
+    total = medir_ejecucion(consulta, repeticiones)
+    print(f"   {'Intérprete vacío':<40} {interprete:10.1f} ms")
+    print(f"   {'Consulta aislada':<40} {total:10.1f} ms")
+    print(f"   {'Presupuesto':<40} {PRESUPUESTO_ARRANQUE_MS:10.1f} ms")
+
+    importaciones = medir_importaciones(consulta)
+    print("\n   Importaciones de primer nivel más lentas (acumulado)")
+    principales = sorted((entrada for entrada in importaciones if entrada[3] == 0),
+                         key=lambda entrada: entrada[2], reverse=True)
+    for modulo, _, acumulado, _ in principales[:MODULOS_A_MOSTRAR]:
+        print(f"   {modulo:<40} {acumulado / 1000:10.1f} ms")
+    print(f"   {'Total importado':<40} {sum(entrada[2] for entrada in principales) / 1000:10.1f} ms")
+
+    importados = {modulo for modulo, _, _, _ in importaciones}
+    print(f"\n   Módulos del paquete importados: "
+          f"{', '.join(sorted(m for m in importados if m.startswith('modulos.')))}")
+    diferidos = [modulo for modulo in MODULOS_DIFERIDOS if modulo in importados]
+
+    if diferidos:
+        print(f"\n❌ La consulta importó módulos que solo usa el menú: {', '.join(diferidos)}")
+    if total > PRESUPUESTO_ARRANQUE_MS:
+        print(f"\n❌ La consulta superó el presupuesto de {PRESUPUESTO_ARRANQUE_MS} ms")
+    if diferidos or total > PRESUPUESTO_ARRANQUE_MS:
+        sys.exit(1)
+    print(f"\n✅ Consulta dentro del presupuesto ({total / PRESUPUESTO_ARRANQUE_MS:.0%} usado)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Almacenamiento Comprimido
+======================================
+Compara una lista de diccionarios con la tabla comprimida de
+modulos/compresion.py sobre países sintéticos:
+
+- Memoria ocupada (medida con tracemalloc) y tiempo de construcción.
+- Latencia de leer filas al azar y de mostrarlas con mostrar_pais, donde la
+  tabla solo decodifica los campos que se muestran.
+- Tiempo de un recorrido completo, decodificando en orden.
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_compresion.py [cantidad_de_paises]
+"""
+
+import os
+import sys
+import time
+import random
+import tracemalloc
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.compresion import PaisesComprimidos, descomprimir_filas, memoria_tabla
+from modulos.presentacion import mostrar_pais
+
+CONTINENTES = ['África', 'América', 'Asia', 'Europa', 'Oceanía']
+LECTURAS = 20000
+
+
+def generar_paises(cantidad: int):
+    """Genera países sintéticos, de a uno (sin armar la lista)."""
+    aleatorio = random.Random(42)
+    for i in range(cantidad):
+        yield {
+            'nombre': f"República de {aleatorio.choice(CONTINENTES)} {i}",
+            'poblacion': aleatorio.randint(1000, 1500000000),
+            'superficie': aleatorio.randint(1, 17000000),
+            'continente': aleatorio.choice(CONTINENTES),
+        }
+
+
+def medir_memoria(construir):
+    """
+    Construye una estructura y devuelve (estructura, bytes ocupados, segundos).
+
+    El tiempo se mide en una segunda construcción, sin tracemalloc.
+    """
+    tracemalloc.start()
+    estructura = construir()
+    ocupados = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    inicio = time.perf_counter()
+    construir()
+    return estructura, ocupados, time.perf_counter() - inicio
+
+
+def medir(funcion) -> float:
+    """Devuelve el tiempo en segundos de una ejecución."""
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def leer_filas(paises, posiciones):
+    """Lee todos los campos principales de las filas indicadas."""
+    for posicion in posiciones:
+        pais = paises[posicion]
+        (pais['nombre'], pais['poblacion'], pais['superficie'], pais['continente'])
+
+
+def mostrar_filas(paises, posiciones):
+    """Muestra las filas indicadas con mostrar_pais (la salida se descarta)."""
+    with open(os.devnull, 'w', encoding='utf-8') as destino, contextlib.redirect_stdout(destino):
+        for posicion in posiciones:
+            mostrar_pais(paises[posicion])
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    lista, memoria_lista, construccion_lista = medir_memoria(lambda: list(generar_paises(cantidad)))
+    comprimidos, memoria_comprimida, construccion_comprimida = medir_memoria(
+        lambda: PaisesComprimidos(generar_paises(cantidad)))
+    assert comprimidos.descomprimir() == lista, "La tabla comprimida no coincide con la lista"
+
+    aleatorio = random.Random(7)
+    posiciones = [aleatorio.randrange(cantidad) for _ in range(min(LECTURAS, cantidad))]
+
+    print(f"\n📊 BENCHMARK DE ALMACENAMIENTO COMPRIMIDO ({cantidad} países)")
+    print("=" * 70)
+    print(f"   {'':<32} {'Diccionarios':>16} {'Comprimido':>16}")
+    print(f"   {'Memoria (MB)':<32} {memoria_lista / 2**20:16.1f} {memoria_comprimida / 2**20:16.1f}")
+    print(f"   {'Bytes por país':<32} {memoria_lista / cantidad:16.1f} {memoria_comprimida / cantidad:16.1f}")
+    print(f"   {'Construcción (ms)':<32} {construccion_lista * 1000:16.1f} {construccion_comprimida * 1000:16.1f}")
+
+    lectura_lista = medir(lambda: leer_filas(lista, posiciones))
+    lectura_comprimida = medir(lambda: leer_filas(comprimidos, posiciones))
+    print(f"   {'Lectura al azar (µs por fila)':<32} {lectura_lista / len(posiciones) * 1e6:16.2f} "
+          f"{lectura_comprimida / len(posiciones) * 1e6:16.2f}")
+
+    mostrar_lista = medir(lambda: mostrar_filas(lista, posiciones))
+    mostrar_comprimida = medir(lambda: mostrar_filas(comprimidos, posiciones))
+    print(f"   {'mostrar_pais (µs por fila)':<32} {mostrar_lista / len(posiciones) * 1e6:16.2f} "
+          f"{mostrar_comprimida / len(posiciones) * 1e6:16.2f}")
+
+    recorrido_lista = medir(lambda: sum(pais['poblacion'] for pais in lista))
+    recorrido_comprimido = medir(lambda: sum(pais['poblacion'] for pais in descomprimir_filas(comprimidos.tabla)))
+    print(f"   {'Recorrido completo (ms)':<32} {recorrido_lista * 1000:16.1f} {recorrido_comprimido * 1000:16.1f}")
+
+    print(f"\n   Datos de la tabla: {memoria_tabla(comprimidos.tabla) / 2**20:.1f} MB "
+          f"({memoria_lista / memoria_comprimida:.1f}x menos memoria que los diccionarios)")
+
+
+if __name__ == '__main__':
+    main()
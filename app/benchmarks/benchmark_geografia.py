@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Búsquedas Geográficas
+==================================
+Compara las consultas del árbol k-d (k vecinos más cercanos, radio y
+rectángulo) con un recorrido completo que calcula la distancia a cada país,
+sobre países sintéticos con coordenadas al azar. Antes de medir se verifica
+que ambos métodos devuelven los mismos países.
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_geografia.py [cantidad_de_paises] [cantidad_de_consultas]
+"""
+
+import os
+import sys
+import time
+import math
+import random
+import heapq
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.geografia import (
+    crear_indice_geografico, buscar_mas_cercanos, buscar_en_radio,
+    buscar_en_rectangulo, distancia_km, esta_en_rectangulo
+)
+
+CONTINENTES = ['África', 'América', 'Asia', 'Europa', 'Oceanía']
+VECINOS = 10
+RADIO_KM = 300
+LADO_RECTANGULO = 5  # Grados de latitud y longitud
+
+
+def generar_paises(cantidad: int):
+    """Genera países sintéticos repartidos uniformemente sobre la esfera."""
+    aleatorio = random.Random(42)
+    return [
+        {
+            'nombre': f"País {i}",
+            'poblacion': aleatorio.randint(1000, 1500000000),
+            'superficie': aleatorio.randint(1, 17000000),
+            'continente': aleatorio.choice(CONTINENTES),
+            'latitud': math.degrees(math.asin(aleatorio.uniform(-1, 1))),
+            'longitud': aleatorio.uniform(-180, 180),
+        }
+        for i in range(cantidad)
+    ]
+
+
+def generar_puntos(cantidad: int):
+    """Genera puntos de consulta al azar."""
+    aleatorio = random.Random(7)
+    return [(math.degrees(math.asin(aleatorio.uniform(-1, 1))), aleatorio.uniform(-180, 180))
+            for _ in range(cantidad)]
+
+
+def cercanos_recorrido(paises, latitud, longitud, cantidad):
+    """k vecinos más cercanos calculando la distancia a todos los países."""
+    return heapq.nsmallest(cantidad, ((pais, distancia_km(latitud, longitud, pais['latitud'], pais['longitud']))
+                                      for pais in paises), key=lambda par: par[1])
+
+
+def radio_recorrido(paises, latitud, longitud, radio_km):
+    """Países dentro de un radio calculando la distancia a todos los países."""
+    return [pais for pais in paises
+            if distancia_km(latitud, longitud, pais['latitud'], pais['longitud']) <= radio_km]
+
+
+def rectangulo_recorrido(paises, latitud, longitud):
+    """Países dentro de un rectángulo revisando todos los países."""
+    return [pais for pais in paises
+            if esta_en_rectangulo(pais, latitud, latitud + LADO_RECTANGULO,
+                                  longitud, longitud + LADO_RECTANGULO)]
+
+
+def medir(descripcion: str, funcion) -> float:
+    """Ejecuta una función y muestra el tiempo."""
+    inicio = time.perf_counter()
+    funcion()
+    segundos = time.perf_counter() - inicio
+    print(f"   {descripcion:<40} {segundos * 1000:10.1f} ms")
+    return segundos
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    paises = generar_paises(cantidad)
+    puntos = generar_puntos(consultas)
+
+    print(f"\n📊 BENCHMARK DE BÚSQUEDAS GEOGRÁFICAS ({cantidad} países, {consultas} consultas)")
+    print("=" * 60)
+    indice = {}
+    medir("Construcción del árbol k-d", lambda: indice.update(crear_indice_geografico(paises)))
+
+    # Los dos métodos deben encontrar los mismos países
+    for latitud, longitud in puntos[:20]:
+        arbol = [distancia for _, distancia in buscar_mas_cercanos(indice, latitud, longitud, VECINOS)]
+        recorrido = [distancia for _, distancia in cercanos_recorrido(paises, latitud, longitud, VECINOS)]
+        assert all(abs(a - b) < 1e-6 for a, b in zip(arbol, recorrido)), "Vecinos distintos"
+        assert ({id(pais) for pais, _ in buscar_en_radio(indice, latitud, longitud, RADIO_KM)}
+                == {id(pais) for pais in radio_recorrido(paises, latitud, longitud, RADIO_KM)}), "Radio distinto"
+        assert ({id(pais) for pais in buscar_en_rectangulo(indice, latitud, latitud + LADO_RECTANGULO,
+                                                           longitud, longitud + LADO_RECTANGULO)}
+                == {id(pais) for pais in rectangulo_recorrido(paises, latitud, longitud)}), "Rectángulo distinto"
+
+    pruebas = [
+        (f"{VECINOS} más cercanos",
+         lambda: [cercanos_recorrido(paises, lat, lon, VECINOS) for lat, lon in puntos],
+         lambda: [buscar_mas_cercanos(indice, lat, lon, VECINOS) for lat, lon in puntos]),
+        (f"Radio de {RADIO_KM} km",
+         lambda: [radio_recorrido(paises, lat, lon, RADIO_KM) for lat, lon in puntos],
+         lambda: [buscar_en_radio(indice, lat, lon, RADIO_KM) for lat, lon in puntos]),
+        (f"Rectángulo de {LADO_RECTANGULO}°x{LADO_RECTANGULO}°",
+         lambda: [rectangulo_recorrido(paises, lat, lon) for lat, lon in puntos],
+         lambda: [buscar_en_rectangulo(indice, lat, lat + LADO_RECTANGULO, lon, lon + LADO_RECTANGULO)
+                  for lat, lon in puntos]),
+    ]
+    for titulo, recorrido, arbol in pruebas:
+        print(f"\n   {titulo}")
+        lento = medir("Recorrido completo", recorrido)
+        rapido = medir("Árbol k-d", arbol)
+        print(f"   {'Aceleración':<40} {lento / rapido:10.2f}x")
+
+
+if __name__ == '__main__':
+    main()
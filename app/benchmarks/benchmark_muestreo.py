@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Estadísticas Aproximadas
+=====================================
+Compara las estadísticas exactas (todos los países) con las estimadas a
+partir de una muestra por continente de modulos/muestreo.py, sobre países
+sintéticos con población y superficie de distribución log-normal:
+
+- Costo de sortear la muestra mientras se recorren los países.
+- Tiempo del cálculo exacto frente al de las estimaciones.
+- Error de cada estadística y cobertura de sus intervalos de confianza:
+  la proporción de muestras, sorteadas con distintas semillas, cuyo
+  intervalo contiene el valor exacto (con un nivel del 95%, debería
+  rondar el 95%).
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_muestreo.py [cantidad_de_paises] [paises_por_continente] [semillas]
+"""
+
+import os
+import sys
+import time
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.muestreo import (
+    muestrear_paises, estimar_estadisticas_generales, calcular_estadisticas_exactas, contar_muestra
+)
+
+CONTINENTES = ['África', 'América', 'Asia', 'Europa', 'Oceanía']
+
+
+def generar_paises(cantidad: int):
+    """Genera países sintéticos con población y superficie correlacionadas."""
+    aleatorio = random.Random(42)
+    for i in range(cantidad):
+        continente = aleatorio.choice(CONTINENTES)
+        escala = 1 + CONTINENTES.index(continente)
+        poblacion = int(math.exp(aleatorio.gauss(14 + escala * 0.3, 1.0))) + 1
+        yield {
+            'nombre': f"País {i}",
+            'poblacion': poblacion,
+            'superficie': int(poblacion / (50 * escala) * math.exp(aleatorio.gauss(0, 0.7))) + 1,
+            'continente': continente,
+        }
+
+
+def medir(funcion):
+    """Devuelve (resultado, segundos) de una ejecución."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def filas_estadisticas(estadisticas):
+    """Pares (nombre, estimación) de las estadísticas que se comparan."""
+    filas = [(clave, estadisticas[clave]) for clave in (
+        'poblacion_promedio', 'superficie_promedio', 'desviacion_poblacion',
+        'desviacion_superficie', 'correlacion_poblacion_superficie')]
+    filas.extend((f"percentil_{percentil}_poblacion", estimacion)
+                 for percentil, estimacion in estadisticas['percentiles_poblacion'].items())
+    return filas
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    tamano = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    semillas = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    paises = list(generar_paises(cantidad))
+
+    print(f"\n📊 BENCHMARK DE ESTADÍSTICAS APROXIMADAS ({cantidad} países, "
+          f"{tamano} por continente, {semillas} muestras)")
+    print("=" * 78)
+    _, recorrido = medir(lambda: sum(1 for _ in paises))
+    muestra, muestreo = medir(lambda: muestrear_paises(paises, tamano, semilla=7))
+    exactas, tiempo_exacto = medir(lambda: calcular_estadisticas_exactas(paises))
+    estimadas, tiempo_estimado = medir(lambda: estimar_estadisticas_generales(muestra))
+
+    print(f"   {'Recorrido sin muestreo':<34} {recorrido * 1000:10.1f} ms")
+    print(f"   {'Recorrido sorteando la muestra':<34} {muestreo * 1000:10.1f} ms "
+          f"({contar_muestra(muestra)[0]} países en la muestra)")
+    print(f"   {'Estadísticas exactas':<34} {tiempo_exacto * 1000:10.1f} ms")
+    print(f"   {'Estadísticas estimadas':<34} {tiempo_estimado * 1000:10.1f} ms "
+          f"({tiempo_exacto / tiempo_estimado:.0f}x más rápido)")
+
+    # Una sola muestra no dice nada de la cobertura: se sortean varias
+    exactos = {nombre: exacta['valor'] for nombre, exacta in filas_estadisticas(exactas)}
+    errores = dict.fromkeys(exactos, 0.0)
+    cubiertos = dict.fromkeys(exactos, 0)
+    anchos = dict.fromkeys(exactos, 0.0)
+    for semilla in range(semillas):
+        estimadas = estimar_estadisticas_generales(muestrear_paises(paises, tamano, semilla=semilla))
+        for nombre, estimada in filas_estadisticas(estimadas):
+            valor = exactos[nombre]
+            escala = abs(valor) or 1.0
+            errores[nombre] += abs(estimada['valor'] - valor) / escala
+            cubiertos[nombre] += estimada['inferior'] <= valor <= estimada['superior']
+            anchos[nombre] += (estimada['superior'] - estimada['inferior']) / escala
+
+    print(f"\n   {'Estadística':<34} {'Exacto':>14} {'Error medio':>12} {'Ancho medio':>12} {'Cobertura':>10}")
+    for nombre, valor in exactos.items():
+        print(f"   {nombre:<34} {valor:14.4g} {errores[nombre] / semillas:12.2%} "
+              f"{anchos[nombre] / semillas:12.2%} {cubiertos[nombre] / semillas:10.0%}")
+    print(f"\n   Error y ancho relativos al valor exacto; cobertura con un nivel de "
+          f"{estimadas['nivel']:.0%}")
+
+
+if __name__ == '__main__':
+    main()
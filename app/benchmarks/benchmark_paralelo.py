@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Ejecución Paralela
+===============================
+Mide cómo escalan las estadísticas y el filtrado en paralelo al aumentar la
+cantidad de procesos, desde 1 hasta la cantidad de núcleos disponibles.
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_paralelo.py [cantidad_de_paises] [maximo_de_procesos]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.paralelo import (
+    crear_columnas_compartidas, liberar_columnas_compartidas,
+    calcular_estadisticas_paralelo, filtrar_paralelo, TRABAJADORES_POR_DEFECTO
+)
+
+CONTINENTES = ['África', 'América', 'Asia', 'Europa', 'Oceanía']
+
+
+def generar_paises(cantidad: int):
+    """Genera países sintéticos."""
+    aleatorio = random.Random(42)
+    return [
+        {
+            'nombre': f"País {i}",
+            'poblacion': aleatorio.randint(1000, 1500000000),
+            'superficie': aleatorio.randint(1, 17000000),
+            'continente': aleatorio.choice(CONTINENTES),
+        }
+        for i in range(cantidad)
+    ]
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    maximo = int(sys.argv[2]) if len(sys.argv) > 2 else TRABAJADORES_POR_DEFECTO
+    paises = generar_paises(cantidad)
+
+    print(f"\n📊 BENCHMARK DE EJECUCIÓN PARALELA ({cantidad} países, hasta {maximo} procesos)")
+    print("=" * 70)
+
+    inicio = time.perf_counter()
+    columnas = crear_columnas_compartidas(paises)
+    print(f"Copia a memoria compartida: {(time.perf_counter() - inicio) * 1000:.1f} ms\n")
+
+    try:
+        print(f"{'Procesos':>8} | {'Estadísticas (ms)':>18} | {'Filtro (ms)':>12} | {'Aceleración':>11}")
+        print("-" * 70)
+        base = None
+        for trabajadores in range(1, maximo + 1):
+            inicio = time.perf_counter()
+            calcular_estadisticas_paralelo(paises, trabajadores, columnas)
+            estadisticas = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            filtrar_paralelo(paises, continente='Asia', poblacion_min=10000000,
+                             superficie_max=5000000, trabajadores=trabajadores, columnas=columnas)
+            filtro = time.perf_counter() - inicio
+
+            total = estadisticas + filtro
+            base = base or total
+            print(f"{trabajadores:>8} | {estadisticas * 1000:>18.1f} | {filtro * 1000:>12.1f} | "
+                  f"{base / total:>10.2f}x")
+    finally:
+        liberar_columnas_compartidas(columnas)
+
+
+if __name__ == '__main__':
+    main()
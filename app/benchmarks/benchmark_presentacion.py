@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Presentación
+=========================
+Mide el tiempo de mostrar una lista grande de países con un print por línea
+(como lo hacía el módulo de presentación originalmente), con una escritura
+por país y armando la vista completa para escribirla de una sola vez. La
+salida va a un destino con buffer de línea, como cuando se usa una terminal.
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_presentacion.py [cantidad_de_paises]
+"""
+
+import os
+import sys
+import time
+import random
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.presentacion import mostrar_pais, mostrar_lista_paises, establecer_modo_plano
+from modulos.validacion import formatear_numero
+
+CONTINENTES = ['África', 'América', 'Asia', 'Europa', 'Oceanía']
+
+
+def generar_paises(cantidad: int):
+    """Genera países sintéticos."""
+    aleatorio = random.Random(42)
+    return [
+        {
+            'nombre': f"País {i}",
+            'poblacion': aleatorio.randint(1000, 1500000000),
+            'superficie': aleatorio.randint(1, 17000000),
+            'continente': aleatorio.choice(CONTINENTES),
+        }
+        for i in range(cantidad)
+    ]
+
+
+def mostrar_linea_por_linea(paises):
+    """Un print por línea, como la presentación antes de agrupar la salida."""
+    print(f"\n📋 Países ({len(paises)} países)")
+    print("-" * 50)
+    for i, pais in enumerate(paises, 1):
+        print(f"{i:3d}. ", end="")
+        print(f"🌍 {pais['nombre']}")
+        print(f"   📍 Continente: {pais['continente']}")
+        print(f"   👥 Población: {formatear_numero(pais['poblacion'])} habitantes")
+        print(f"   📏 Superficie: {formatear_numero(pais['superficie'])} km²")
+        print()
+    print(f"Total: {len(paises)} países")
+
+
+def mostrar_pais_por_pais(paises):
+    """Una escritura por país."""
+    print(f"\n📋 Países ({len(paises)} países)")
+    print("-" * 50)
+    for i, pais in enumerate(paises, 1):
+        mostrar_pais(pais, True, i)
+    print(f"Total: {len(paises)} países")
+
+
+def medir(descripcion: str, funcion) -> float:
+    """Ejecuta una función con la salida redirigida y muestra el tiempo."""
+    # Con buffer de línea, como cuando la salida es una terminal
+    with open(os.devnull, 'w', encoding='utf-8', buffering=1) as destino:
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(destino):
+            funcion()
+        segundos = time.perf_counter() - inicio
+    print(f"   {descripcion:<40} {segundos * 1000:10.1f} ms")
+    return segundos
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    paises = generar_paises(cantidad)
+
+    print(f"\n📊 BENCHMARK DE PRESENTACIÓN ({cantidad} países)")
+    print("=" * 60)
+    linea_por_linea = medir("Un print por línea", lambda: mostrar_linea_por_linea(paises))
+    medir("Una escritura por país", lambda: mostrar_pais_por_pais(paises))
+    agrupada = medir("Vista completa en una escritura", lambda: mostrar_lista_paises(paises, "Países"))
+    establecer_modo_plano(True)
+    medir("Vista completa, modo plano", lambda: mostrar_lista_paises(paises, "Países"))
+    establecer_modo_plano(False)
+    print(f"   {'Aceleración':<40} {linea_por_linea / agrupada:10.2f}x")
+
+
+if __name__ == '__main__':
+    main()
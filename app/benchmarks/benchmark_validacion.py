@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Validación de Filas
+================================
+Compara la carga fila por fila (csv.DictReader + validar_fila_pais) con la
+carga en lote (leer_filas_csv + validar_filas_paises) sobre un CSV sintético
+con un pequeño porcentaje de filas inválidas. Además de la carga completa,
+separa las dos etapas: la lectura del CSV y la validación de las filas ya
+leídas (un diccionario y una llamada por fila, contra la conversión columna
+por columna), y dentro de la validación, la conversión de una columna
+numérica valor por valor contra una sola pasada de map(int). También mide la
+carga en lote de un CSV con dos columnas adicionales (capital y pib).
+
+Uso (desde la carpeta app):
+    python benchmarks/benchmark_validacion.py [cantidad_de_filas]
+"""
+
+import os
+import sys
+import time
+import random
+import csv
+import io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.carga_datos import (
+    validar_fila_pais, validar_filas_paises, leer_filas_csv, COLUMNAS_REQUERIDAS,
+    TAMANO_BLOQUE_VALIDACION, _convertir_columna_entera
+)
+
+CONTINENTES = ['África', 'América', 'Asia', 'Europa', 'Oceanía']
+
+
+def generar_csv(cantidad: int, proporcion_invalidas: float = 0.001,
+                adicionales: bool = False) -> str:
+    """Genera el texto de un CSV de países, con algunas filas inválidas."""
+    aleatorio = random.Random(42)
+    filas = []
+    for i in range(cantidad):
+        fila = {
+            'nombre': f" País {i} ",
+            'poblacion': f"{aleatorio.randint(1000, 1500000000):,}",
+            'superficie': str(aleatorio.randint(1, 17000000)),
+            'continente': aleatorio.choice(CONTINENTES),
+        }
+        if aleatorio.random() < proporcion_invalidas:
+            fila[aleatorio.choice(['poblacion', 'superficie'])] = aleatorio.choice(['abc', '0', ''])
+        if adicionales:
+            fila['capital'] = f"Capital {i}"
+            fila['pib'] = f"{aleatorio.uniform(1, 20000):.2f}"
+        filas.append(fila)
+
+    salida = io.StringIO()
+    columnas = COLUMNAS_REQUERIDAS + ['capital', 'pib'] if adicionales else COLUMNAS_REQUERIDAS
+    escritor_csv = csv.DictWriter(salida, fieldnames=columnas)
+    escritor_csv.writeheader()
+    escritor_csv.writerows(filas)
+    return salida.getvalue()
+
+
+def cargar_fila_por_fila(texto: str):
+    """Carga original: un diccionario y una validación por fila."""
+    paises = []
+    errores = []
+    for numero_fila, fila in enumerate(csv.DictReader(io.StringIO(texto)), start=2):
+        try:
+            paises.append(validar_fila_pais(fila, numero_fila))
+        except ValueError as e:
+            errores.append({'fila': numero_fila, 'mensaje': str(e),
+                            'nombre': (fila.get('nombre') or '').strip()})
+    return paises, errores
+
+
+def cargar_en_lote(texto: str):
+    """Carga en lote: filas crudas convertidas por columnas."""
+    columnas = []
+    filas = leer_filas_csv(io.StringIO(texto), columnas)
+    _, paises, errores = validar_filas_paises(filas, columnas=columnas)
+    return paises, errores
+
+
+def validar_fila_por_fila(filas):
+    """Validación original sobre filas ya leídas como diccionarios."""
+    paises = []
+    for numero_fila, fila in enumerate(filas, start=2):
+        try:
+            paises.append(validar_fila_pais(fila, numero_fila))
+        except ValueError:
+            pass
+    return paises
+
+
+def convertir_valor_por_valor(valores):
+    """Conversión original de una columna numérica: replace e int por valor."""
+    numeros = []
+    for valor in valores:
+        try:
+            numeros.append(int(valor.replace(',', '').replace('.', '')))
+        except ValueError:
+            numeros.append(None)
+    return numeros
+
+
+def convertir_por_columna(valores):
+    """Conversión de la carga en lote, por bloques de TAMANO_BLOQUE_VALIDACION valores."""
+    numeros = []
+    for inicio in range(0, len(valores), TAMANO_BLOQUE_VALIDACION):
+        numeros.extend(_convertir_columna_entera(valores[inicio:inicio + TAMANO_BLOQUE_VALIDACION]))
+    return numeros
+
+
+def medir(funcion, repeticiones: int = 5) -> float:
+    """Devuelve el mejor tiempo en segundos de varias ejecuciones."""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    texto = generar_csv(cantidad)
+
+    esperado = cargar_fila_por_fila(texto)
+    obtenido = cargar_en_lote(texto)
+    assert obtenido == esperado, "La carga en lote no coincide con la carga fila por fila"
+
+    print(f"\n📊 BENCHMARK DE VALIDACIÓN ({cantidad} filas, {len(obtenido[1])} inválidas)")
+    print("=" * 60)
+    por_fila = medir(lambda: cargar_fila_por_fila(texto))
+    en_lote = medir(lambda: cargar_en_lote(texto))
+    print(f"   {'Fila por fila':<30} {por_fila * 1000:10.1f} ms")
+    print(f"   {'En lote por columnas':<30} {en_lote * 1000:10.1f} ms")
+    print(f"   {'Aceleración':<30} {por_fila / en_lote:10.2f}x")
+
+    print("\n   Por etapas:")
+    filas_diccionario = list(csv.DictReader(io.StringIO(texto)))
+    columnas = []
+    filas_crudas = leer_filas_csv(io.StringIO(texto), columnas)
+    lectura_diccionario = medir(lambda: list(csv.DictReader(io.StringIO(texto))))
+    lectura_cruda = medir(lambda: leer_filas_csv(io.StringIO(texto)))
+    validacion_por_fila = medir(lambda: validar_fila_por_fila(filas_diccionario))
+    validacion_en_lote = medir(lambda: validar_filas_paises(filas_crudas, columnas=columnas))
+    print(f"   {'Lectura (DictReader)':<30} {lectura_diccionario * 1000:10.1f} ms")
+    print(f"   {'Lectura (filas crudas)':<30} {lectura_cruda * 1000:10.1f} ms")
+    print(f"   {'Validación fila por fila':<30} {validacion_por_fila * 1000:10.1f} ms")
+    print(f"   {'Validación por columnas':<30} {validacion_en_lote * 1000:10.1f} ms "
+          f"({validacion_por_fila / validacion_en_lote:.2f}x)")
+
+    poblaciones = [fila[1] for fila in filas_crudas]
+    assert convertir_por_columna(poblaciones) == [
+        numero if numero and numero > 0 else None for numero in convertir_valor_por_valor(poblaciones)]
+    valor_por_valor = medir(lambda: convertir_valor_por_valor(poblaciones))
+    por_columna = medir(lambda: convertir_por_columna(poblaciones))
+    print(f"   {'Población valor por valor':<30} {valor_por_valor * 1000:10.1f} ms")
+    print(f"   {'Población con map(int)':<30} {por_columna * 1000:10.1f} ms "
+          f"({valor_por_valor / por_columna:.2f}x)")
+
+    texto_adicionales = generar_csv(cantidad, adicionales=True)
+    assert cargar_en_lote(texto_adicionales) == cargar_fila_por_fila(texto_adicionales), \
+        "La carga en lote no coincide con la carga fila por fila (columnas adicionales)"
+    con_adicionales = medir(lambda: cargar_en_lote(texto_adicionales))
+    print(f"   {'En lote, 2 columnas más':<30} {con_adicionales * 1000:10.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
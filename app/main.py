@@ -14,71 +14,133 @@ del sistema de gestión de datos de países.
 """
 
 import sys
-import os
-import io
+import time
+import argparse
+from typing import Optional, List, Dict, Any
 
 # Configurar la salida para usar UTF-8 (necesario en Windows)
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
-# Agregar el directorio de módulos al path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'modulos'))
-
-# Importar todos los módulos
-from modulos.carga_datos import cargar_datos_csv, verificar_integridad_datos, guardar_datos_csv
+# Módulos que usa cualquier ejecución, incluida una consulta aislada (--buscar).
+# Los índices, los bitmaps, la geografía, las vistas ordenadas, el historial, los
+# conjuntos, el observador, las estadísticas y el muestreo solo los usa el menú:
+# se importan recién al usarlos, como atributos del paquete (ver modulos/__init__.py).
+import modulos
+from modulos.almacenamiento import (
+    cargar_datos_con_reporte, guardar_pais, es_ruta_sqlite, consultar_claves_sqlite
+)
+from modulos.carga_datos import COLUMNAS_REQUERIDAS
+from modulos.columnas_derivadas import (
+    crear_columnas_derivadas, actualizar_columnas_derivadas, quitar_de_columnas_derivadas,
+    refrescar_porcentajes, COLUMNAS_DERIVADAS
+)
 from modulos.validacion import (
-    validar_entrada_numero, 
+    validar_entrada_numero, formatear_numero, normalizar_texto_busqueda,
     pausar_ejecucion, mostrar_separador
 )
 from modulos.consultas import (
-    buscar_pais_por_nombre, filtrar_por_continente,
-    filtrar_por_rango_poblacion, filtrar_por_rango_superficie,
-    obtener_continentes_disponibles, buscar_paises_multiples_criterios
+    buscar_pais_por_nombre, obtener_continentes_disponibles, buscar_paises_multiples_criterios
 )
-from modulos.ordenamiento import ordenar_personalizado
-from modulos.estadisticas import (
-    calcular_estadisticas_generales, calcular_estadisticas_continente)
 from modulos.presentacion import (
     mostrar_menu_principal, mostrar_submenu_ordenamiento,
     mostrar_continentes_disponibles, mostrar_resultados_busqueda,
     mostrar_lista_paises, mostrar_estadisticas_generales,
-    mostrar_estadisticas_continente, mostrar_pais
+    mostrar_estadisticas_continente, mostrar_pais, mostrar_histograma,
+    mostrar_reporte_integridad, establecer_modo_plano, mostrar_estimaciones,
+    mostrar_submenu_historial, mostrar_crecimientos, mostrar_submenu_geografia,
+    mostrar_paises_con_distancia
 )
 
 # Variables globales
 paises = []
 resultados_actuales = []
-RUTA_DATOS = 'data/paises.csv'
+vistas_ordenadas = {}  # Criterio -> vista ordenada de los datos que se están ordenando
+orden_actual = None    # (criterio, descendente) si resultados_actuales viene de una vista
+indice_difuso = {'raiz': None, 'paises': {}}
+trie_nombres = None          # Trie de nombres para el autocompletado, se arma al iniciar
+indice_bitmap = None         # Índice bitmap por continente y rangos, se arma al iniciar
+indice_geografico = None     # Árbol k-d de los países con coordenadas, se arma al iniciar
+columnas_derivadas = crear_columnas_derivadas([])
+estadisticas_continentes = None  # Estadísticas de cada continente; None si hay que recalcularlas
+historial = None              # Historial de población, se carga al iniciar
+coleccion = None              # Conjuntos de datos cargados, con sus cadenas compartidas
+RUTA_DATOS = 'data/paises.csv'  # Se cambia con --datos
+CONJUNTOS_ADICIONALES = {}      # Nombre -> ruta, se agregan con --conjunto
+RUTA_HISTORIAL = 'data/historial_poblacion.csv'
+ANIO_BASE_DATOS = 2020       # Año de las poblaciones del archivo de datos, se cambia con --anio-base
+OMITIR_VERIFICACION = False  # Se activa con --skip-verify
+OBSERVAR_ARCHIVO = False     # Se activa con --watch
+BUSQUEDA_UNICA = None        # Nombre a buscar sin abrir el menú, con --buscar
+TAMANO_MUESTRA = None        # Países por continente de la muestra, con --aproximado
+muestra = None               # Muestra para las estadísticas aproximadas
+observador = None            # Estado del archivo observado para recargarlo en caliente
+
+# Criterios que consultar_claves_sqlite resuelve en SQL (la densidad y la ubicación no están en la tabla)
+CRITERIOS_SQL = {'continente', 'poblacion_min', 'poblacion_max',
+                 'superficie_min', 'superficie_max', 'nombre_contiene'}
 
 
 def inicializar_datos() -> bool:
     """
-    Carga e inicializa los datos de países desde el archivo CSV.
+    Carga e inicializa los datos de países desde el archivo de datos (CSV o SQLite).
     
     Returns:
         bool: True si la carga fue exitosa, False en caso contrario
     """
-    global paises
+    global paises, indice_difuso, trie_nombres, indice_bitmap, columnas_derivadas, observador
+    global historial, coleccion, indice_geografico, muestra
     
     print("🔄 Iniciando sistema...")
     mostrar_separador("-", 50)
     
     try:
-        # Cargar datos
+        # Cargar datos verificando su integridad en la misma pasada
         print(f"📂 Cargando datos desde: {RUTA_DATOS}")
-        paises = cargar_datos_csv(RUTA_DATOS)
+        paises, reporte = cargar_datos_con_reporte(RUTA_DATOS, OMITIR_VERIFICACION)
+        mostrar_reporte_integridad(reporte)
         
-        if not paises:
-            print("❌ No se pudieron cargar los datos del archivo CSV")
-            return False
-        
-        # Verificar integridad
-        print("🔍 Verificando integridad de datos...")
-        if not verificar_integridad_datos(paises):
+        if not reporte['valido']:
             print("❌ Los datos no pasaron la verificación de integridad")
             return False
         
+        # Registrar los datos como conjunto principal (comparte nombres y continentes
+        # con los conjuntos adicionales) y cargar los demás
+        coleccion = modulos.conjuntos.crear_coleccion()
+        modulos.conjuntos.agregar_conjunto(coleccion, 'principal', paises)
+        for nombre_conjunto, ruta in CONJUNTOS_ADICIONALES.items():
+            modulos.conjuntos.cargar_conjunto(coleccion, nombre_conjunto, ruta, OMITIR_VERIFICACION)
+            cambios = modulos.conjuntos.diferencia_conjuntos(coleccion, 'principal', nombre_conjunto)
+            print(f"📂 Conjunto '{nombre_conjunto}' ({ruta}): "
+                  f"{len(coleccion['conjuntos'][nombre_conjunto])} países, "
+                  f"{len(cambios['solo_b'])} solo en este conjunto, "
+                  f"{len(cambios['solo_a'])} solo en el principal, "
+                  f"{len(cambios['modificados'])} con diferencias")
+        
+        # Calcular las columnas derivadas (densidad y porcentaje de población)
+        columnas_derivadas = crear_columnas_derivadas(paises)
+        descartar_estadisticas_continentes()
+        
+        # Construir índices de búsqueda
+        indice_difuso = modulos.indices.crear_indice_difuso(paises)
+        trie_nombres = modulos.indices.crear_trie_nombres(paises)
+        indice_bitmap = modulos.bitmaps.crear_indice_bitmap(paises)
+        indice_geografico = modulos.geografia.crear_indice_geografico(paises)
+        
+        # Muestra por continente para las estadísticas aproximadas
+        if TAMANO_MUESTRA is not None:
+            muestra = modulos.muestreo.muestrear_paises(paises, TAMANO_MUESTRA)
+            print(f"🎲 Modo aproximado: muestra de {modulos.muestreo.contar_muestra(muestra)[0]} países")
+        
+        # Cargar el historial de población (si todavía no existe queda vacío)
+        historial = modulos.historial.cargar_historial_csv(RUTA_HISTORIAL)
+        
+        # Observar cambios externos en el CSV
+        if OBSERVAR_ARCHIVO and not es_ruta_sqlite(RUTA_DATOS):
+            observador = modulos.observador.crear_observador(RUTA_DATOS)
+            print(f"👀 Observando cambios en {RUTA_DATOS}")
+        
         print(f"✅ Sistema inicializado correctamente")
         print(f"📊 {len(paises)} países cargados exitosamente")
         mostrar_separador("-", 50)
@@ -89,10 +151,97 @@ def inicializar_datos() -> bool:
         return False
 
 
+def establecer_resultados(resultados: List[Dict[str, Any]]):
+    """
+    Reemplaza los resultados actuales por los de una nueva búsqueda.
+    
+    Las vistas ordenadas corresponden al conjunto anterior, por lo que se descartan.
+    
+    Args:
+        resultados (List[Dict[str, Any]]): Nuevos resultados
+    """
+    global resultados_actuales, orden_actual
+    resultados_actuales = resultados
+    orden_actual = None
+    vistas_ordenadas.clear()
+
+
+def filtrar_paises(**criterios) -> List[Dict[str, Any]]:
+    """
+    Busca los países que cumplen los criterios de buscar_paises_multiples_criterios.
+    
+    Si los datos están en SQLite y todos los criterios están en la tabla, la
+    base decide qué países cumplen los criterios con una consulta SQL sobre
+    sus índices, que devuelve solo las claves (nombres normalizados). Si no,
+    se usan los índices en memoria (bitmap y árbol k-d).
+    
+    Los países devueltos son siempre los de memoria, que tienen las columnas
+    derivadas y son los que se muestran y modifican; cada alta y modificación
+    se guarda en la base, así que las dos coinciden. Si la base tiene claves
+    que no están en memoria (otro proceso la cambió), se avisa cuántas son.
+    
+    Args:
+        **criterios: Criterios de buscar_paises_multiples_criterios (los que
+            valen None se ignoran)
+        
+    Returns:
+        List[Dict[str, Any]]: Países en memoria que cumplen los criterios
+    """
+    criterios = {criterio: valor for criterio, valor in criterios.items() if valor is not None}
+    if es_ruta_sqlite(RUTA_DATOS) and criterios.keys() <= CRITERIOS_SQL:
+        por_nombre = indice_difuso['paises']
+        resultados = []
+        faltantes = 0
+        for clave in consultar_claves_sqlite(RUTA_DATOS, **criterios):
+            existentes = por_nombre.get(clave)
+            if existentes:
+                resultados.append(existentes[0])
+            else:
+                faltantes += 1
+        if faltantes:
+            print(f"⚠️ {faltantes} países de {RUTA_DATOS} no están cargados "
+                  f"(la base cambió desde que se abrió el programa), se omiten")
+        return resultados
+    return buscar_paises_multiples_criterios(paises, indice_bitmap=indice_bitmap,
+                                             indice_geografico=indice_geografico, **criterios)
+
+
+def completar_nombre_pais(texto: str, estado: int) -> Optional[str]:
+    """
+    Función de autocompletado para readline basada en el trie de nombres.
+    
+    Args:
+        texto (str): Texto escrito hasta el momento
+        estado (int): Número de sugerencia solicitada por readline
+        
+    Returns:
+        Optional[str]: Nombre sugerido o None si no hay más sugerencias
+    """
+    sugerencias = modulos.indices.autocompletar_nombre(trie_nombres, texto)
+    if estado < len(sugerencias):
+        return sugerencias[estado]['nombre']
+    return None
+
+
+def configurar_autocompletado():
+    """Habilita el autocompletado de nombres con la tecla Tab (si hay readline)."""
+    try:
+        import readline
+    except ImportError:
+        # readline no está disponible en todas las plataformas (por ejemplo Windows)
+        return
+    
+    readline.set_completer(completar_nombre_pais)
+    # Los nombres pueden tener espacios: se completa la línea entera
+    readline.set_completer_delims('')
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')
+    else:
+        readline.parse_and_bind('tab: complete')
+
+
 def ejecutar_busqueda_por_nombre():
     """Ejecuta la búsqueda de países por nombre."""
-    global resultados_actuales
-    
     print("\n🔍 BÚSQUEDA POR NOMBRE")
     mostrar_separador("-", 30)
     
@@ -103,18 +252,27 @@ def ejecutar_busqueda_por_nombre():
     
     # Buscar países
     resultados = buscar_pais_por_nombre(paises, nombre)
-    resultados_actuales = resultados
+    descripcion = f"Países que contienen '{nombre}'"
+    
+    # Sugerir nombres parecidos si no hubo coincidencias
+    if not resultados:
+        sugerencias = modulos.indices.buscar_similares(indice_difuso, nombre)
+        if sugerencias:
+            nombres_sugeridos = ", ".join(p['nombre'] for p in sugerencias)
+            print(f"💡 No se encontró '{nombre}'. ¿Quiso decir: {nombres_sugeridos}?")
+            resultados = sugerencias
+            descripcion = f"Países parecidos a '{nombre}'"
+    
+    establecer_resultados(resultados)
     
     # Mostrar resultados
-    mostrar_resultados_busqueda(resultados, f"Países que contienen '{nombre}'")
+    mostrar_resultados_busqueda(resultados, descripcion)
     
     pausar_ejecucion()
 
 
 def ejecutar_filtro_por_continente():
     """Ejecuta el filtrado de países por continente."""
-    global resultados_actuales
-    
     print("\n🌍 FILTRADO POR CONTINENTE")
     mostrar_separador("-", 35)
     
@@ -132,8 +290,8 @@ def ejecutar_filtro_por_continente():
         opcion = int(input(f"\nSeleccione un continente (1-{len(continentes)}): "))
         if 1 <= opcion <= len(continentes):
             continente_seleccionado = continentes[opcion - 1]
-            resultados = filtrar_por_continente(paises, continente_seleccionado)
-            resultados_actuales = resultados
+            resultados = filtrar_paises(continente=continente_seleccionado)
+            establecer_resultados(resultados)
             
             mostrar_resultados_busqueda(resultados, f"Países de {continente_seleccionado}")
         else:
@@ -146,8 +304,6 @@ def ejecutar_filtro_por_continente():
 
 def ejecutar_filtro_por_poblacion():
     """Ejecuta el filtrado de países por rango de población."""
-    global resultados_actuales
-    
     print("\n📊 FILTRADO POR POBLACIÓN")
     mostrar_separador("-", 35)
     
@@ -169,10 +325,8 @@ def ejecutar_filtro_por_poblacion():
             pausar_ejecucion()
             return
         
-        resultados = filtrar_por_rango_poblacion(
-            paises, poblacion_min, poblacion_max
-        )
-        resultados_actuales = resultados
+        resultados = filtrar_paises(poblacion_min=poblacion_min, poblacion_max=poblacion_max)
+        establecer_resultados(resultados)
         
         mostrar_resultados_busqueda(
             resultados, 
@@ -186,8 +340,6 @@ def ejecutar_filtro_por_poblacion():
 
 def ejecutar_filtro_por_superficie():
     """Ejecuta el filtrado de países por rango de superficie."""
-    global resultados_actuales
-    
     print("\n📏 FILTRADO POR SUPERFICIE")
     mostrar_separador("-", 35)
     
@@ -200,10 +352,8 @@ def ejecutar_filtro_por_superficie():
         )
         
         if superficie_min is not None and superficie_max is not None:
-            resultados = filtrar_por_rango_superficie(
-                paises, superficie_min, superficie_max
-            )
-            resultados_actuales = resultados
+            resultados = filtrar_paises(superficie_min=superficie_min, superficie_max=superficie_max)
+            establecer_resultados(resultados)
             
             mostrar_resultados_busqueda(
                 resultados, 
@@ -217,7 +367,7 @@ def ejecutar_filtro_por_superficie():
 
 def ejecutar_ordenamiento():
     """Ejecuta el ordenamiento de países."""
-    global resultados_actuales
+    global resultados_actuales, orden_actual
     
     print("\n📈 ORDENAMIENTO DE PAÍSES")
     mostrar_separador("-", 35)
@@ -236,6 +386,8 @@ def ejecutar_ordenamiento():
             4: ('poblacion', False),   # Menor a mayor
             5: ('superficie', True),   # Mayor a menor
             6: ('superficie', False),  # Menor a mayor
+            7: ('densidad', True),     # Mayor a menor
+            8: ('densidad', False),    # Menor a mayor
         }
         
         if opcion in opciones_ordenamiento:
@@ -248,8 +400,15 @@ def ejecutar_ordenamiento():
                 pausar_ejecucion()
                 return
             
-            resultados = ordenar_personalizado(datos_a_ordenar, criterio, descendente)
+            # Reutilizar la vista del criterio (ascendente o descendente) si ya existe
+            vista = vistas_ordenadas.get(criterio)
+            if vista is None:
+                vista = modulos.vistas_ordenadas.crear_vista_ordenada(datos_a_ordenar, criterio)
+                vistas_ordenadas[criterio] = vista
+            
+            resultados = list(modulos.vistas_ordenadas.recorrer_vista(vista, descendente))
             resultados_actuales = resultados
+            orden_actual = (criterio, descendente)
             
             # Mostrar resultados
             direccion = "mayor a menor" if descendente else "menor a mayor"
@@ -273,9 +432,23 @@ def ejecutar_estadisticas_generales():
     mostrar_separador("-", 40)
     
     try:
-        estadisticas = calcular_estadisticas_generales(paises)
+        # En modo aproximado se estima con la muestra y el cálculo exacto es opcional
+        if muestra is not None:
+            mostrar_estimaciones(modulos.muestreo.estimar_estadisticas_generales(muestra))
+            if input("\n¿Calcular los valores exactos? (s/N): ").strip().lower() != 's':
+                pausar_ejecucion()
+                return
+        
+        estadisticas = modulos.estadisticas.calcular_estadisticas_generales(paises)
         if estadisticas:
             mostrar_estadisticas_generales(estadisticas)
+            histograma = modulos.estadisticas.generar_histograma
+            mostrar_histograma(histograma(paises, 'continente'), "PAÍSES POR CONTINENTE")
+            mostrar_histograma(
+                histograma(paises, modulos.estadisticas.clave_escala_logaritmica('poblacion')),
+                "PAÍSES POR ORDEN DE MAGNITUD DE POBLACIÓN",
+                lambda limite: f"≥ {formatear_numero(limite)} hab"
+            )
         else:
             print("❌ No se pudieron calcular las estadísticas")
             
@@ -285,6 +458,26 @@ def ejecutar_estadisticas_generales():
     pausar_ejecucion()
 
 
+def obtener_estadisticas_por_continente() -> Dict[str, Dict[str, Any]]:
+    """
+    Devuelve las estadísticas de todos los continentes, calculándolas solo si
+    los datos cambiaron desde la última vez.
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: Estadísticas de cada continente
+    """
+    global estadisticas_continentes
+    if estadisticas_continentes is None:
+        estadisticas_continentes = modulos.estadisticas.calcular_estadisticas_por_continente(paises)
+    return estadisticas_continentes
+
+
+def descartar_estadisticas_continentes():
+    """Descarta las estadísticas por continente guardadas, luego de cambiar los datos."""
+    global estadisticas_continentes
+    estadisticas_continentes = None
+
+
 def ejecutar_estadisticas_continente():
     """Ejecuta el cálculo y visualización de estadísticas por continente."""
     print("\n🌍 ESTADÍSTICAS POR CONTINENTE")
@@ -299,7 +492,7 @@ def ejecutar_estadisticas_continente():
         if 1 <= opcion <= len(continentes):
             continente_seleccionado = continentes[opcion - 1]
             
-            estadisticas = calcular_estadisticas_continente(paises, continente_seleccionado)
+            estadisticas = obtener_estadisticas_por_continente().get(continente_seleccionado)
             if estadisticas:
                 mostrar_estadisticas_continente(estadisticas, continente_seleccionado)
             else:
@@ -314,8 +507,6 @@ def ejecutar_estadisticas_continente():
 
 def ejecutar_busqueda_avanzada():
     """Ejecuta la búsqueda avanzada con múltiples criterios."""
-    global resultados_actuales
-    
     print("\n🔎 BÚSQUEDA AVANZADA")
     mostrar_separador("-", 30)
     
@@ -363,24 +554,53 @@ def ejecutar_busqueda_avanzada():
     except ValueError:
         print("⚠️ Valores de superficie inválidos, se omitirán")
     
+    # Rango de densidad
+    densidad_min = None
+    densidad_max = None
+    try:
+        densidad_min_input = input("Densidad mínima (hab/km², Enter para omitir): ").strip()
+        if densidad_min_input:
+            densidad_min = float(densidad_min_input.replace(',', '.'))
+        
+        densidad_max_input = input("Densidad máxima (hab/km², Enter para omitir): ").strip()
+        if densidad_max_input:
+            densidad_max = float(densidad_max_input.replace(',', '.'))
+    except ValueError:
+        print("⚠️ Valores de densidad inválidos, se omitirán")
+    
     # Nombre que contenga
     nombre_contiene = input("Nombre debe contener (Enter para omitir): ").strip()
     if not nombre_contiene:
         nombre_contiene = None
     
+    # Distancia a un punto (solo si los datos tienen coordenadas)
+    cerca_de = None
+    if indice_geografico['cantidad']:
+        try:
+            latitud_input = input("Latitud de referencia (Enter para omitir): ").strip()
+            if latitud_input:
+                latitud = float(latitud_input.replace(',', '.'))
+                longitud = float(input("Longitud de referencia: ").strip().replace(',', '.'))
+                radio = float(input("Distancia máxima (km): ").strip().replace(',', '.'))
+                cerca_de = (latitud, longitud, radio)
+        except ValueError:
+            print("⚠️ Valores de ubicación inválidos, se omitirán")
+    
     # Ejecutar búsqueda
     try:
-        resultados = buscar_paises_multiples_criterios(
-            paises,
+        resultados = filtrar_paises(
             continente=continente,
             poblacion_min=poblacion_min,
             poblacion_max=poblacion_max,
             superficie_min=superficie_min,
             superficie_max=superficie_max,
-            nombre_contiene=nombre_contiene
+            nombre_contiene=nombre_contiene,
+            densidad_min=densidad_min,
+            densidad_max=densidad_max,
+            cerca_de=cerca_de
         )
         
-        resultados_actuales = resultados
+        establecer_resultados(resultados)
         
         # Crear descripción de la búsqueda
         criterios = []
@@ -390,8 +610,12 @@ def ejecutar_busqueda_avanzada():
             criterios.append(f"población: {poblacion_min or 0}-{poblacion_max or '∞'}")
         if superficie_min or superficie_max:
             criterios.append(f"superficie: {superficie_min or 0}-{superficie_max or '∞'}")
+        if densidad_min is not None or densidad_max is not None:
+            criterios.append(f"densidad: {densidad_min or 0}-{densidad_max or '∞'}")
         if nombre_contiene:
             criterios.append(f"nombre contiene: '{nombre_contiene}'")
+        if cerca_de:
+            criterios.append(f"a menos de {cerca_de[2]:g} km de ({cerca_de[0]:g}, {cerca_de[1]:g})")
         
         descripcion = "Búsqueda avanzada con criterios: " + ", ".join(criterios)
         mostrar_resultados_busqueda(resultados, descripcion)
@@ -402,10 +626,66 @@ def ejecutar_busqueda_avanzada():
     pausar_ejecucion()
 
 
+def ejecutar_busqueda_geografica():
+    """Ejecuta las búsquedas por ubicación sobre el árbol k-d."""
+    print("\n📍 BÚSQUEDA GEOGRÁFICA")
+    mostrar_separador("-", 30)
+    
+    if not indice_geografico['cantidad']:
+        print("❌ Los datos no tienen coordenadas: agregue las columnas latitud y longitud al archivo")
+        pausar_ejecucion()
+        return
+    
+    mostrar_submenu_geografia()
+    
+    try:
+        opcion = int(input("\nSeleccione una opción: "))
+        if opcion == 0:
+            return  # Volver al menú principal
+        
+        if opcion == 1:
+            latitud = float(input("Latitud del punto: ").strip().replace(',', '.'))
+            longitud = float(input("Longitud del punto: ").strip().replace(',', '.'))
+            cantidad = validar_entrada_numero(input("¿Cuántos países mostrar?: "),
+                                              1, indice_geografico['cantidad'])
+            if cantidad is None:
+                print("❌ Debe ingresar una cantidad válida")
+            else:
+                pares = modulos.geografia.buscar_mas_cercanos(indice_geografico, latitud, longitud,
+                                                              cantidad)
+                establecer_resultados([pais for pais, _ in pares])
+                mostrar_paises_con_distancia(
+                    pares, f"{cantidad} países más cercanos a ({latitud:g}, {longitud:g})")
+        elif opcion == 2:
+            latitud = float(input("Latitud del punto: ").strip().replace(',', '.'))
+            longitud = float(input("Longitud del punto: ").strip().replace(',', '.'))
+            radio = float(input("Distancia máxima (km): ").strip().replace(',', '.'))
+            pares = modulos.geografia.buscar_en_radio(indice_geografico, latitud, longitud, radio)
+            establecer_resultados([pais for pais, _ in pares])
+            mostrar_paises_con_distancia(
+                pares, f"Países a menos de {radio:g} km de ({latitud:g}, {longitud:g})")
+        elif opcion == 3:
+            latitud_min = float(input("Latitud mínima: ").strip().replace(',', '.'))
+            latitud_max = float(input("Latitud máxima: ").strip().replace(',', '.'))
+            longitud_min = float(input("Longitud oeste: ").strip().replace(',', '.'))
+            longitud_max = float(input("Longitud este: ").strip().replace(',', '.'))
+            resultados = modulos.geografia.buscar_en_rectangulo(indice_geografico, latitud_min,
+                                                                latitud_max, longitud_min, longitud_max)
+            resultados.sort(key=lambda pais: pais['nombre'])
+            establecer_resultados(resultados)
+            mostrar_resultados_busqueda(
+                resultados, f"latitud {latitud_min:g} a {latitud_max:g}, "
+                            f"longitud {longitud_min:g} a {longitud_max:g}")
+        else:
+            print("❌ Opción inválida")
+    except ValueError:
+        print("❌ Debe ingresar un número válido")
+    
+    pausar_ejecucion()
+
+
 def ejecutar_mostrar_todos():
     """Ejecuta la visualización de todos los países."""
-    global resultados_actuales
-    
     print("\n📋 TODOS LOS PAÍSES")
     mostrar_separador("-", 25)
     
@@ -421,7 +701,7 @@ def ejecutar_mostrar_todos():
                 max_paises = None
         
         mostrar_lista_paises(paises, "Todos los países", max_paises=max_paises)
-        resultados_actuales = paises
+        establecer_resultados(paises)
         
     except Exception as e:
         print(f"❌ Error al mostrar países: {e}")
@@ -501,16 +781,24 @@ def ejecutar_agregar_pais():
             'continente': continente
         }
         
-        # Agregar a la lista
+        # Agregar a la lista, a las columnas derivadas y a los índices
         paises.append(nuevo_pais)
+        actualizar_columnas_derivadas(columnas_derivadas, paises, nuevo_pais)
+        descartar_estadisticas_continentes()
+        modulos.indices.agregar_a_indice_difuso(indice_difuso, nuevo_pais)
+        modulos.indices.agregar_a_trie(trie_nombres, nuevo_pais)
+        modulos.bitmaps.agregar_a_indice_bitmap(indice_bitmap, nuevo_pais)
+        actualizar_vistas_ordenadas(nuevo_pais, nuevo=True)
+        if muestra is not None:
+            modulos.muestreo.agregar_a_muestra(muestra, nuevo_pais)
         
-        # Guardar los datos en el CSV
-        if guardar_datos_csv(paises, RUTA_DATOS):
+        # Guardar los datos (solo la fila afectada si el almacenamiento lo permite)
+        if guardar_pais(paises, nuevo_pais, RUTA_DATOS):
             print(f"\n✅ País '{nombre}' agregado exitosamente")
-            print("💾 Datos guardados en el archivo CSV")
+            print(f"💾 Datos guardados en {RUTA_DATOS}")
         else:
             print(f"\n✅ País '{nombre}' agregado exitosamente")
-            print("⚠️ Advertencia: No se pudieron guardar los datos en el archivo CSV")
+            print(f"⚠️ Advertencia: No se pudieron guardar los datos en {RUTA_DATOS}")
         
         mostrar_pais(nuevo_pais)
         
@@ -549,6 +837,7 @@ def ejecutar_actualizar_pais():
         mostrar_pais(pais)
         
         print("\nIngrese los nuevos valores (presione Enter para mantener el valor actual):")
+        valores_anteriores = {'poblacion': pais['poblacion'], 'superficie': pais['superficie']}
         
         # Actualizar población
         nueva_poblacion = input(f"Población actual: {pais['poblacion']} → Nueva población: ").strip()
@@ -556,6 +845,7 @@ def ejecutar_actualizar_pais():
             poblacion = validar_entrada_numero(nueva_poblacion, 1, 2000000000)
             if poblacion is not None:
                 pais['poblacion'] = poblacion
+                modulos.indices.actualizar_en_trie(trie_nombres, pais)
             else:
                 print("⚠️ Población inválida, se mantiene el valor actual")
         
@@ -568,13 +858,33 @@ def ejecutar_actualizar_pais():
             else:
                 print("⚠️ Superficie inválida, se mantiene el valor actual")
         
-        # Guardar los datos en el CSV
-        if guardar_datos_csv(paises, RUTA_DATOS):
+        actualizar_columnas_derivadas(columnas_derivadas, paises, pais, valores_anteriores['poblacion'])
+        descartar_estadisticas_continentes()
+        modulos.bitmaps.actualizar_en_indice_bitmap(indice_bitmap, pais, valores_anteriores)
+        actualizar_vistas_ordenadas(pais)
+        
+        # Registrar la nueva población en el historial para conservar los valores anteriores
+        if pais['poblacion'] != valores_anteriores['poblacion']:
+            anio = time.localtime().tm_year
+            if not modulos.historial.tiene_registros(historial, pais['nombre']):
+                # Primer cambio del país: la población cargada se guarda en el año base de los datos
+                if ANIO_BASE_DATOS < anio:
+                    modulos.historial.registrar_poblacion(historial, pais['nombre'], ANIO_BASE_DATOS,
+                                                          valores_anteriores['poblacion'])
+                else:
+                    print(f"⚠️ El año base de los datos ({ANIO_BASE_DATOS}) no es anterior a {anio}: "
+                          f"la población anterior no se guarda en el historial")
+            modulos.historial.registrar_poblacion(historial, pais['nombre'], anio, pais['poblacion'])
+            if not modulos.historial.guardar_historial_csv(historial, RUTA_HISTORIAL):
+                print(f"⚠️ Advertencia: No se pudo guardar el historial en {RUTA_HISTORIAL}")
+        
+        # Guardar los datos (solo la fila afectada si el almacenamiento lo permite)
+        if guardar_pais(paises, pais, RUTA_DATOS):
             print(f"\n✅ País '{nombre}' actualizado exitosamente")
-            print("💾 Datos guardados en el archivo CSV")
+            print(f"💾 Datos guardados en {RUTA_DATOS}")
         else:
             print(f"\n✅ País '{nombre}' actualizado exitosamente")
-            print("⚠️ Advertencia: No se pudieron guardar los datos en el archivo CSV")
+            print(f"⚠️ Advertencia: No se pudieron guardar los datos en {RUTA_DATOS}")
         
         print("\n📋 Datos actualizados:")
         mostrar_pais(pais)
@@ -585,10 +895,194 @@ def ejecutar_actualizar_pais():
     pausar_ejecucion()
 
 
+def ejecutar_historial():
+    """Ejecuta las consultas sobre el historial de población."""
+    print("\n📜 HISTORIAL DE POBLACIÓN")
+    mostrar_separador("-", 35)
+    
+    if not historial['series']:
+        print(f"❌ El historial está vacío: se completa al actualizar la población de un país "
+              f"o desde {RUTA_HISTORIAL}")
+        pausar_ejecucion()
+        return
+    
+    mostrar_submenu_historial()
+    
+    try:
+        opcion = int(input("\nSeleccione una opción: "))
+        if opcion == 0:
+            return  # Volver al menú principal
+        if opcion not in (1, 2, 3, 4):
+            print("❌ Opción inválida")
+            pausar_ejecucion()
+            return
+        
+        anio_actual = time.localtime().tm_year
+        nombre = input("Ingrese el nombre del país: ").strip() if opcion in (1, 2) else None
+        if opcion in (1, 4):
+            anio_inicio = None
+            anio_fin = validar_entrada_numero(input("Año: "), 1, anio_actual)
+        else:
+            anio_inicio = validar_entrada_numero(input("Año inicial: "), 1, anio_actual)
+            anio_fin = validar_entrada_numero(input("Año final: "), anio_inicio or 1, anio_actual)
+            if anio_inicio is None:
+                anio_fin = None
+        if anio_fin is None or (opcion in (1, 2) and not nombre):
+            print("❌ Debe ingresar parámetros válidos")
+            pausar_ejecucion()
+            return
+        
+        if opcion == 1:
+            poblacion = modulos.historial.poblacion_en_anio(historial, nombre, anio_fin)
+            if poblacion is None:
+                print(f"❌ No hay registros de '{nombre}' hasta {anio_fin}")
+            else:
+                print(f"👥 Población de {nombre} en {anio_fin}: {formatear_numero(poblacion)} habitantes")
+        elif opcion == 2:
+            crecimiento = modulos.historial.crecimiento_entre_anios(historial, nombre, anio_inicio, anio_fin)
+            if crecimiento is None:
+                print(f"❌ No hay registros de '{nombre}' en {anio_inicio} y {anio_fin}")
+            else:
+                mostrar_crecimientos([crecimiento], f"CRECIMIENTO ENTRE {anio_inicio} Y {anio_fin}")
+        elif opcion == 3:
+            cantidad = input("¿Cuántos países mostrar? (Enter para 10): ").strip()
+            cantidad = validar_entrada_numero(cantidad, 1, len(historial['series'])) if cantidad else 10
+            if cantidad is not None:
+                mostrar_crecimientos(
+                    modulos.historial.top_crecimiento(historial, anio_inicio, anio_fin, cantidad),
+                    f"PAÍSES QUE MÁS CRECIERON ENTRE {anio_inicio} Y {anio_fin}"
+                )
+        else:
+            estadisticas = modulos.historial.estadisticas_en_anio(historial, paises, anio_fin)
+            if estadisticas:
+                print(f"📅 Países con registros hasta {anio_fin}")
+                mostrar_estadisticas_generales(estadisticas)
+            else:
+                print(f"❌ Ningún país tiene registros hasta {anio_fin}")
+    except ValueError:
+        print("❌ Debe ingresar un número válido")
+    
+    pausar_ejecucion()
+
+
+def actualizar_vistas_ordenadas(pais: Dict[str, Any], nuevo: bool = False):
+    """
+    Reubica un país modificado (o agrega uno nuevo) en las vistas ordenadas existentes.
+    
+    Un país nuevo solo se agrega a las vistas que tienen todos los demás
+    países: las armadas sobre el resultado de una búsqueda no lo incluyen,
+    porque la búsqueda no se vuelve a ejecutar. Si los resultados actuales
+    provienen de una vista, se refrescan para que no queden desactualizados.
+    
+    Args:
+        pais (Dict[str, Any]): País ya modificado o recién agregado a la lista
+        nuevo (bool): Si el país es nuevo
+    """
+    global resultados_actuales
+    
+    for vista in vistas_ordenadas.values():
+        if not nuevo:
+            modulos.vistas_ordenadas.reubicar_en_vista(vista, pais)
+        elif len(vista['paises']) == len(paises) - 1:
+            modulos.vistas_ordenadas.agregar_a_vista(vista, pais)
+    
+    if orden_actual is not None:
+        criterio, descendente = orden_actual
+        vista = vistas_ordenadas[criterio]
+        resultados_actuales = list(modulos.vistas_ordenadas.recorrer_vista(vista, descendente))
+
+
+def recargar_cambios_externos():
+    """
+    Aplica a los datos en memoria los cambios hechos al CSV por otro proceso.
+    
+    Solo se procesan los países que cambiaron: se modifican en su lugar (para
+    que los índices y vistas los sigan encontrando), se agregan o se quitan
+    de la lista y de cada índice de forma incremental.
+    """
+    global paises, resultados_actuales, indice_geografico, muestra
+    
+    if observador is None:
+        return
+    
+    try:
+        cambios = modulos.observador.detectar_cambios(observador)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ No se pudieron leer los cambios de {RUTA_DATOS}: {e}")
+        return
+    if cambios is None:
+        return
+    
+    agregados = modificados = 0
+    for nuevo in cambios['actualizados']:
+        existentes = indice_difuso['paises'].get(normalizar_texto_busqueda(nuevo['nombre']))
+        if not existentes:
+            paises.append(nuevo)
+            actualizar_columnas_derivadas(columnas_derivadas, paises, nuevo)
+            modulos.indices.agregar_a_indice_difuso(indice_difuso, nuevo)
+            modulos.indices.agregar_a_trie(trie_nombres, nuevo)
+            modulos.bitmaps.agregar_a_indice_bitmap(indice_bitmap, nuevo)
+            actualizar_vistas_ordenadas(nuevo, nuevo=True)
+            agregados += 1
+            continue
+        
+        pais = existentes[0]
+        # Columnas opcionales (coordenadas y adicionales) del país en memoria o en el archivo
+        opcionales = [campo for campo in dict.fromkeys([*pais, *nuevo])
+                      if campo not in COLUMNAS_REQUERIDAS and campo not in COLUMNAS_DERIVADAS]
+        if all(pais.get(campo) == nuevo.get(campo)
+               for campo in ['poblacion', 'superficie', 'continente'] + opcionales):
+            continue
+        valores_anteriores = {campo: pais[campo] for campo in ('poblacion', 'superficie', 'continente')}
+        pais.update(poblacion=nuevo['poblacion'], superficie=nuevo['superficie'],
+                    continente=nuevo['continente'])
+        for campo in opcionales:
+            if campo in nuevo:
+                pais[campo] = nuevo[campo]
+            else:
+                pais.pop(campo, None)
+        actualizar_columnas_derivadas(columnas_derivadas, paises, pais, valores_anteriores['poblacion'])
+        modulos.indices.actualizar_en_trie(trie_nombres, pais)
+        modulos.bitmaps.actualizar_en_indice_bitmap(indice_bitmap, pais, valores_anteriores)
+        actualizar_vistas_ordenadas(pais)
+        modificados += 1
+    
+    eliminados = []
+    for nombre in cambios['eliminados']:
+        for pais in list(indice_difuso['paises'].get(nombre, [])):
+            modulos.indices.eliminar_de_indice_difuso(indice_difuso, pais)
+            modulos.indices.eliminar_de_trie(trie_nombres, pais)
+            modulos.bitmaps.eliminar_de_indice_bitmap(indice_bitmap, pais)
+            for vista in vistas_ordenadas.values():
+                modulos.vistas_ordenadas.eliminar_de_vista(vista, pais)
+            eliminados.append(pais)
+    
+    if eliminados:
+        ids_eliminados = {id(pais) for pais in eliminados}
+        paises[:] = [pais for pais in paises if id(pais) not in ids_eliminados]
+        quitar_de_columnas_derivadas(columnas_derivadas, paises, eliminados)
+        resultados_actuales = [pais for pais in resultados_actuales if id(pais) not in ids_eliminados]
+    
+    if agregados or modificados or eliminados:
+        descartar_estadisticas_continentes()
+        # El árbol k-d no admite cambios: se vuelve a armar (O(n log n))
+        indice_geografico = modulos.geografia.crear_indice_geografico(paises)
+        # La muestra no admite bajas ni cambios de continente: se vuelve a sortear
+        if muestra is not None:
+            muestra = modulos.muestreo.muestrear_paises(paises, TAMANO_MUESTRA)
+        print(f"\n🔄 {RUTA_DATOS} cambió: {agregados} agregados, {modificados} modificados, "
+              f"{len(eliminados)} eliminados")
+    for error in cambios['errores']:
+        print(f"Advertencia: Error en fila {error['fila']}: {error['mensaje']}")
+
+
 def ejecutar_menu_principal():
     """Ejecuta el menú principal de la aplicación."""
     while True:
         try:
+            recargar_cambios_externos()
+            # Una sola pasada por los porcentajes tras las modificaciones de la opción anterior
+            refrescar_porcentajes(columnas_derivadas, paises)
             mostrar_menu_principal()
             opcion = int(input("\nSeleccione una opción: "))
             
@@ -616,6 +1110,12 @@ def ejecutar_menu_principal():
                 ejecutar_estadisticas_generales()
             elif opcion == 9:
                 ejecutar_estadisticas_continente()
+            elif opcion == 10:
+                ejecutar_historial()
+            elif opcion == 11:
+                ejecutar_busqueda_avanzada()
+            elif opcion == 12:
+                ejecutar_busqueda_geografica()
             else:
                 print("❌ Opción inválida. Por favor, seleccione una opción del menú.")
                 pausar_ejecucion()
@@ -631,8 +1131,92 @@ def ejecutar_menu_principal():
             pausar_ejecucion()
 
 
+def ejecutar_busqueda_unica(nombre: str) -> bool:
+    """
+    Busca un país por nombre y termina, sin abrir el menú (opción --buscar).
+    
+    Solo se cargan los datos: no se construyen los índices ni se cargan el
+    historial, los conjuntos adicionales o el observador, de modo que el
+    arranque queda dominado por la lectura del archivo.
+    
+    Args:
+        nombre (str): Nombre (o parte del nombre) del país a buscar
+        
+    Returns:
+        bool: True si se encontró algún país
+    """
+    paises_cargados, reporte = cargar_datos_con_reporte(RUTA_DATOS, OMITIR_VERIFICACION)
+    if not reporte['valido']:
+        mostrar_reporte_integridad(reporte)
+        return False
+    
+    resultados = buscar_pais_por_nombre(paises_cargados, nombre)
+    descripcion = f"Países que contienen '{nombre}'"
+    
+    # Sin coincidencias, el índice difuso se arma solo para sugerir nombres
+    if not resultados:
+        indice = modulos.indices.crear_indice_difuso(paises_cargados)
+        sugerencias = modulos.indices.buscar_similares(indice, nombre)
+        if sugerencias:
+            resultados = sugerencias
+            descripcion = f"Países parecidos a '{nombre}'"
+    
+    mostrar_resultados_busqueda(resultados, descripcion)
+    return bool(resultados)
+
+
+def procesar_argumentos():
+    """Procesa las opciones de línea de comandos."""
+    global OMITIR_VERIFICACION, OBSERVAR_ARCHIVO, RUTA_DATOS, BUSQUEDA_UNICA, TAMANO_MUESTRA, ANIO_BASE_DATOS
+    
+    parser = argparse.ArgumentParser(description="Sistema de Gestión de Datos de Países")
+    parser.add_argument('--datos', default=RUTA_DATOS, metavar='RUTA',
+                        help=f"Archivo de datos principal, CSV o SQLite (por defecto {RUTA_DATOS})")
+    parser.add_argument('--conjunto', action='append', default=[], metavar='NOMBRE=RUTA',
+                        help="Cargar además otro conjunto de datos con ese nombre (se puede repetir)")
+    parser.add_argument('--skip-verify', '--omitir-verificacion', action='store_true',
+                        dest='omitir_verificacion',
+                        help="No verificar el archivo si coincide con uno ya verificado")
+    parser.add_argument('--watch', '--observar', action='store_true', dest='observar',
+                        help="Aplicar los cambios que otros procesos hagan al CSV sin reiniciar")
+    parser.add_argument('--plain', '--plano', action='store_true', dest='plano',
+                        help="Mostrar los resultados sin emojis (salida para otros programas)")
+    parser.add_argument('--aproximado', type=int, nargs='?', const=1000, metavar='TAMAÑO',
+                        help="Estimar las estadísticas generales con una muestra de TAMAÑO "
+                             "países por continente (1000 si no se indica)")
+    parser.add_argument('--buscar', metavar='NOMBRE',
+                        help="Buscar un país por nombre y terminar, sin abrir el menú")
+    parser.add_argument('--anio-base', type=int, default=ANIO_BASE_DATOS, metavar='AÑO',
+                        help="Año de las poblaciones del archivo de datos, con el que el historial "
+                             f"guarda el valor anterior al primer cambio (por defecto {ANIO_BASE_DATOS})")
+    argumentos = parser.parse_args()
+    
+    for conjunto in argumentos.conjunto:
+        nombre_conjunto, separador, ruta = conjunto.partition('=')
+        if not separador or not nombre_conjunto or not ruta or nombre_conjunto == 'principal':
+            parser.error(f"--conjunto espera NOMBRE=RUTA (y un nombre distinto de 'principal'): {conjunto}")
+        CONJUNTOS_ADICIONALES[nombre_conjunto] = ruta
+    
+    RUTA_DATOS = argumentos.datos
+    establecer_modo_plano(argumentos.plano)
+    OMITIR_VERIFICACION = argumentos.omitir_verificacion
+    OBSERVAR_ARCHIVO = argumentos.observar
+    BUSQUEDA_UNICA = argumentos.buscar
+    if argumentos.aproximado is not None and argumentos.aproximado < 2:
+        parser.error("--aproximado necesita al menos 2 países por continente")
+    TAMANO_MUESTRA = argumentos.aproximado
+    ANIO_BASE_DATOS = argumentos.anio_base
+
+
 def main():
     """Función principal del programa."""
+    procesar_argumentos()
+    if BUSQUEDA_UNICA is not None:
+        try:
+            sys.exit(0 if ejecutar_busqueda_unica(BUSQUEDA_UNICA) else 1)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error al buscar: {e}")
+            sys.exit(1)
     try:
         print("🌍 SISTEMA DE GESTIÓN DE DATOS DE PAÍSES")
         print("=" * 60)
@@ -647,6 +1231,7 @@ def main():
             return
         
         # Ejecutar menú principal
+        configurar_autocompletado()
         ejecutar_menu_principal()
         
     except Exception as e:
@@ -1,4 +1,38 @@
 """
 Paquete de módulos del Sistema de Gestión de Datos de Países
+
+Los submódulos se importan recién cuando se usan por primera vez
+(PEP 562): importar el paquete no carga ninguno, y `modulos.historial`
+importa el historial en el primer acceso. Así una consulta aislada desde la
+línea de comandos no paga el arranque de los módulos que no usa.
+
+    import modulos
+    modulos.estadisticas.calcular_estadisticas_generales(paises)
 """
 
+import importlib
+from typing import Any, List
+
+# Submódulos del paquete, en el orden del README
+SUBMODULOS = (
+    'carga_datos', 'validacion', 'consultas', 'ordenamiento', 'estadisticas',
+    'presentacion', 'indices', 'bitmaps', 'cuantiles', 'almacenamiento',
+    'constructor_consultas', 'vistas_ordenadas', 'paralelo', 'observador',
+    'columnas_derivadas', 'servicio', 'historial', 'conjuntos', 'diferencias',
+    'ordenamiento_externo', 'geografia', 'registro_columnas', 'compresion', 'muestreo',
+)
+
+__all__ = list(SUBMODULOS)
+
+
+def __getattr__(nombre: str) -> Any:
+    """Importa un submódulo la primera vez que se lo pide como atributo."""
+    if nombre in SUBMODULOS:
+        # import_module también deja el submódulo como atributo del paquete,
+        # de modo que los accesos siguientes no pasan por aquí
+        return importlib.import_module(f'.{nombre}', __name__)
+    raise AttributeError(f"el módulo {__name__!r} no tiene el atributo {nombre!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(SUBMODULOS))
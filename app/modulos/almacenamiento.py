@@ -0,0 +1,495 @@
+"""
+Módulo de Almacenamiento
+========================
+Este módulo ofrece una capa de almacenamiento intercambiable: los datos
+pueden guardarse en un archivo CSV o en una base de datos SQLite, según la
+extensión de la ruta. Con SQLite las altas y modificaciones se guardan fila
+por fila y los filtros se resuelven con consultas SQL sobre columnas
+indexadas.
+
+También puede usarse como herramienta de migración desde la terminal:
+    python -m modulos.almacenamiento data/paises.csv data/paises.db
+"""
+
+import os
+import sqlite3
+import argparse
+from typing import List, Dict, Any, Optional, Tuple
+from .carga_datos import (
+    cargar_datos_csv, guardar_datos_csv, cargar_datos_verificados, generar_reporte_integridad
+)
+from .validacion import normalizar_texto_busqueda
+
+EXTENSIONES_SQLITE = ('.db', '.sqlite', '.sqlite3')
+
+ESQUEMA_SQLITE = """
+CREATE TABLE IF NOT EXISTS paises (
+    nombre TEXT NOT NULL,
+    nombre_normalizado TEXT PRIMARY KEY,
+    poblacion INTEGER NOT NULL CHECK (poblacion > 0),
+    superficie INTEGER NOT NULL CHECK (superficie > 0),
+    continente TEXT NOT NULL,
+    continente_normalizado TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_paises_continente ON paises (continente_normalizado);
+CREATE INDEX IF NOT EXISTS idx_paises_poblacion ON paises (poblacion);
+CREATE INDEX IF NOT EXISTS idx_paises_superficie ON paises (superficie);
+"""
+
+SQL_UPSERT = """
+INSERT INTO paises (nombre, nombre_normalizado, poblacion, superficie,
+                    continente, continente_normalizado)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (nombre_normalizado) DO UPDATE SET
+    nombre = excluded.nombre,
+    poblacion = excluded.poblacion,
+    superficie = excluded.superficie,
+    continente = excluded.continente,
+    continente_normalizado = excluded.continente_normalizado
+"""
+
+# Columnas por las que se permite ordenar en consultar_paises_sqlite
+COLUMNAS_ORDENABLES = {
+    'nombre': 'nombre_normalizado',
+    'poblacion': 'poblacion',
+    'superficie': 'superficie',
+}
+
+
+def es_ruta_sqlite(ruta_archivo: str) -> bool:
+    """
+    Indica si una ruta corresponde a una base de datos SQLite.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo de datos
+
+    Returns:
+        bool: True si la extensión es de SQLite
+    """
+    return os.path.splitext(ruta_archivo)[1].lower() in EXTENSIONES_SQLITE
+
+
+def _conectar(ruta_archivo: str, crear: bool = False) -> sqlite3.Connection:
+    """
+    Abre la base de datos y crea la tabla e índices si no existen.
+
+    Raises:
+        FileNotFoundError: Si la base de datos no existe y no debe crearse
+    """
+    if not crear and not os.path.exists(ruta_archivo):
+        raise FileNotFoundError(f"No se encontró el archivo: {ruta_archivo}")
+    directorio = os.path.dirname(ruta_archivo)
+    if directorio and not os.path.exists(directorio):
+        os.makedirs(directorio)
+    conexion = sqlite3.connect(ruta_archivo)
+    conexion.executescript(ESQUEMA_SQLITE)
+    return conexion
+
+
+def _fila_sqlite(pais: Dict[str, Any]) -> tuple:
+    """Convierte un país en los valores de una fila de la tabla."""
+    return (
+        pais['nombre'],
+        normalizar_texto_busqueda(pais['nombre']),
+        pais['poblacion'],
+        pais['superficie'],
+        pais['continente'],
+        normalizar_texto_busqueda(pais['continente']),
+    )
+
+
+def _descartar_nombres_repetidos(paises: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Quita de la lista los países cuyo nombre normalizado ya apareció, avisando cuáles son.
+
+    La tabla identifica a cada país por su nombre normalizado, por lo que
+    'Perú' y 'peru' ocuparían la misma fila y uno reemplazaría al otro sin
+    aviso. Se conserva la primera aparición, como en el resto del sistema.
+
+    Returns:
+        List[Dict[str, Any]]: Países con nombres distintos
+    """
+    vistos = {}
+    repetidos = []
+    for posicion, pais in enumerate(paises):
+        primera = vistos.setdefault(normalizar_texto_busqueda(pais['nombre']), posicion)
+        if primera != posicion:
+            original = paises[primera]['nombre']
+            repetidos.append(f"'{pais['nombre']}'" if pais['nombre'] == original
+                             else f"'{pais['nombre']}' (igual a '{original}')")
+    if not repetidos:
+        return paises
+    print(f"⚠️ Nombres repetidos (la base de datos no distingue mayúsculas ni acentos), "
+          f"se guarda solo la primera aparición: {', '.join(repetidos)}")
+    return [paises[posicion] for posicion in vistos.values()]
+
+
+def _filas_a_paises(filas: List[tuple]) -> List[Dict[str, Any]]:
+    """Convierte filas (nombre, poblacion, superficie, continente) en diccionarios."""
+    return [
+        {'nombre': nombre, 'poblacion': poblacion, 'superficie': superficie, 'continente': continente}
+        for nombre, poblacion, superficie, continente in filas
+    ]
+
+
+def cargar_datos_sqlite(ruta_archivo: str) -> List[Dict[str, Any]]:
+    """
+    Carga datos de países desde una base de datos SQLite.
+
+    Args:
+        ruta_archivo (str): Ruta a la base de datos
+
+    Returns:
+        List[Dict[str, Any]]: Lista de diccionarios con los datos de países
+
+    Raises:
+        FileNotFoundError: Si la base de datos no existe
+        ValueError: Si la base de datos no contiene países
+    """
+    try:
+        conexion = _conectar(ruta_archivo)
+        try:
+            filas = conexion.execute(
+                "SELECT nombre, poblacion, superficie, continente FROM paises ORDER BY rowid"
+            ).fetchall()
+        finally:
+            conexion.close()
+    except sqlite3.Error as e:
+        raise ValueError(f"Error al leer la base de datos: {e}")
+
+    if not filas:
+        raise ValueError("No se pudieron cargar datos válidos del archivo")
+    print(f"✓ Datos cargados exitosamente: {len(filas)} países")
+    return _filas_a_paises(filas)
+
+
+def guardar_datos_sqlite(paises: List[Dict[str, Any]], ruta_archivo: str) -> bool:
+    """
+    Sincroniza la base de datos con la lista completa de países.
+
+    Inserta o actualiza cada país y elimina los que ya no están en la lista,
+    todo dentro de una única transacción. Crea la base si no existe. Los
+    países se identifican por su nombre normalizado: de los nombres que solo
+    difieren en mayúsculas o acentos se guarda el primero y se avisa cuáles
+    se descartaron.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países a guardar
+        ruta_archivo (str): Ruta a la base de datos
+
+    Returns:
+        bool: True si el guardado fue exitoso, False en caso contrario
+    """
+    if not paises:
+        print("⚠️ No hay datos para guardar")
+        return False
+    paises = _descartar_nombres_repetidos(paises)
+
+    try:
+        conexion = _conectar(ruta_archivo, crear=True)
+        try:
+            with conexion:
+                filas = [_fila_sqlite(pais) for pais in paises]
+                conexion.executemany(SQL_UPSERT, filas)
+                conexion.execute("CREATE TEMP TABLE vigentes (nombre_normalizado TEXT PRIMARY KEY)")
+                conexion.executemany("INSERT OR IGNORE INTO vigentes VALUES (?)",
+                                     ((fila[1],) for fila in filas))
+                conexion.execute(
+                    "DELETE FROM paises WHERE nombre_normalizado NOT IN "
+                    "(SELECT nombre_normalizado FROM vigentes)"
+                )
+                conexion.execute("DROP TABLE vigentes")
+        finally:
+            conexion.close()
+        return True
+
+    except sqlite3.Error as e:
+        print(f"❌ Error al guardar los datos en la base de datos: {e}")
+        return False
+
+
+def guardar_pais_sqlite(pais: Dict[str, Any], ruta_archivo: str) -> bool:
+    """
+    Inserta o actualiza un único país en la base de datos.
+
+    Args:
+        pais (Dict[str, Any]): País a guardar
+        ruta_archivo (str): Ruta a la base de datos
+
+    Returns:
+        bool: True si el guardado fue exitoso, False en caso contrario
+    """
+    try:
+        conexion = _conectar(ruta_archivo)
+        try:
+            with conexion:
+                conexion.execute(SQL_UPSERT, _fila_sqlite(pais))
+        finally:
+            conexion.close()
+        return True
+
+    except (sqlite3.Error, OSError) as e:
+        print(f"❌ Error al guardar el país en la base de datos: {e}")
+        return False
+
+
+def guardar_cambios_sqlite(actualizados: List[Dict[str, Any]], eliminados: List[str],
+                          ruta_archivo: str) -> bool:
+    """
+    Aplica un lote de altas, modificaciones y bajas en una única transacción.
+
+    Args:
+        actualizados (List[Dict[str, Any]]): Países a insertar o actualizar
+        eliminados (List[str]): Nombres normalizados de los países a eliminar
+        ruta_archivo (str): Ruta a la base de datos
+
+    Returns:
+        bool: True si el guardado fue exitoso, False en caso contrario
+    """
+    actualizados = _descartar_nombres_repetidos(actualizados)
+
+    try:
+        conexion = _conectar(ruta_archivo)
+        try:
+            with conexion:
+                conexion.executemany(SQL_UPSERT, (_fila_sqlite(pais) for pais in actualizados))
+                conexion.executemany("DELETE FROM paises WHERE nombre_normalizado = ?",
+                                     ((nombre,) for nombre in eliminados))
+        finally:
+            conexion.close()
+        return True
+
+    except (sqlite3.Error, OSError) as e:
+        print(f"❌ Error al guardar los cambios en la base de datos: {e}")
+        return False
+
+
+def _condiciones_sql(continente: Optional[str] = None,
+                     poblacion_min: Optional[int] = None,
+                     poblacion_max: Optional[int] = None,
+                     superficie_min: Optional[int] = None,
+                     superficie_max: Optional[int] = None,
+                     nombre_contiene: Optional[str] = None) -> Tuple[str, list]:
+    """Arma la cláusula WHERE (o una cadena vacía) y sus parámetros para los filtros."""
+    condiciones = []
+    parametros = []
+
+    if continente:
+        condiciones.append("continente_normalizado = ?")
+        parametros.append(normalizar_texto_busqueda(continente))
+    if poblacion_min is not None:
+        condiciones.append("poblacion >= ?")
+        parametros.append(poblacion_min)
+    if poblacion_max is not None:
+        condiciones.append("poblacion <= ?")
+        parametros.append(poblacion_max)
+    if superficie_min is not None:
+        condiciones.append("superficie >= ?")
+        parametros.append(superficie_min)
+    if superficie_max is not None:
+        condiciones.append("superficie <= ?")
+        parametros.append(superficie_max)
+    if nombre_contiene:
+        texto = normalizar_texto_busqueda(nombre_contiene)
+        texto = texto.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        condiciones.append("nombre_normalizado LIKE ? ESCAPE '\\'")
+        parametros.append(f"%{texto}%")
+
+    if not condiciones:
+        return "", parametros
+    return " WHERE " + " AND ".join(condiciones), parametros
+
+
+def consultar_paises_sqlite(ruta_archivo: str,
+                            continente: Optional[str] = None,
+                            poblacion_min: Optional[int] = None,
+                            poblacion_max: Optional[int] = None,
+                            superficie_min: Optional[int] = None,
+                            superficie_max: Optional[int] = None,
+                            nombre_contiene: Optional[str] = None,
+                            ordenar_por: Optional[str] = None,
+                            descendente: bool = False,
+                            limite: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Busca países aplicando los filtros directamente en SQL.
+
+    Acepta los mismos criterios que buscar_paises_multiples_criterios, más
+    un orden y un límite opcionales.
+
+    Args:
+        ruta_archivo (str): Ruta a la base de datos
+        continente (str, optional): Continente a filtrar
+        poblacion_min (int, optional): Población mínima
+        poblacion_max (int, optional): Población máxima
+        superficie_min (int, optional): Superficie mínima
+        superficie_max (int, optional): Superficie máxima
+        nombre_contiene (str, optional): Texto que debe contener el nombre
+        ordenar_por (str, optional): 'nombre', 'poblacion' o 'superficie'
+        descendente (bool): Si debe ordenar de forma descendente
+        limite (int, optional): Cantidad máxima de resultados
+
+    Returns:
+        List[Dict[str, Any]]: Lista de países que cumplen todos los criterios
+
+    Raises:
+        FileNotFoundError: Si la base de datos no existe
+        ValueError: Si el criterio de orden no es válido
+    """
+    filtro, parametros = _condiciones_sql(continente, poblacion_min, poblacion_max,
+                                          superficie_min, superficie_max, nombre_contiene)
+    consulta = "SELECT nombre, poblacion, superficie, continente FROM paises" + filtro
+
+    if ordenar_por is not None:
+        if ordenar_por not in COLUMNAS_ORDENABLES:
+            raise ValueError(f"Criterio de ordenamiento inválido: {ordenar_por}")
+        direccion = "DESC" if descendente else "ASC"
+        consulta += f" ORDER BY {COLUMNAS_ORDENABLES[ordenar_por]} {direccion}"
+    else:
+        consulta += " ORDER BY rowid"
+
+    if limite is not None:
+        consulta += " LIMIT ?"
+        parametros.append(limite)
+
+    conexion = _conectar(ruta_archivo)
+    try:
+        filas = conexion.execute(consulta, parametros).fetchall()
+    finally:
+        conexion.close()
+
+    return _filas_a_paises(filas)
+
+
+def consultar_claves_sqlite(ruta_archivo: str, **criterios) -> List[str]:
+    """
+    Busca los países que cumplen los criterios y devuelve solo su clave.
+
+    Acepta los filtros de consultar_paises_sqlite (sin orden ni límite). La
+    clave es el nombre normalizado (la clave primaria de la tabla): sirve
+    para ubicar los países ya cargados en memoria sin armar un diccionario
+    por fila.
+
+    Args:
+        ruta_archivo (str): Ruta a la base de datos
+        **criterios: Filtros de consultar_paises_sqlite
+
+    Returns:
+        List[str]: Nombres normalizados de los países, en el orden de la tabla
+
+    Raises:
+        FileNotFoundError: Si la base de datos no existe
+    """
+    filtro, parametros = _condiciones_sql(**criterios)
+    conexion = _conectar(ruta_archivo)
+    try:
+        filas = conexion.execute(
+            "SELECT nombre_normalizado FROM paises" + filtro + " ORDER BY rowid", parametros
+        ).fetchall()
+    finally:
+        conexion.close()
+    return [clave for clave, in filas]
+
+
+def cargar_datos(ruta_archivo: str) -> List[Dict[str, Any]]:
+    """
+    Carga los países desde un CSV o una base SQLite según la extensión.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo de datos
+
+    Returns:
+        List[Dict[str, Any]]: Lista de diccionarios con los datos de países
+    """
+    if es_ruta_sqlite(ruta_archivo):
+        return cargar_datos_sqlite(ruta_archivo)
+    return cargar_datos_csv(ruta_archivo)
+
+
+def cargar_datos_con_reporte(ruta_archivo: str,
+                             omitir_verificacion: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Carga los países y genera el reporte de integridad en una sola pasada.
+
+    En SQLite las restricciones de la tabla ya garantizan valores válidos y
+    nombres únicos, por lo que el reporte se arma sobre los datos leídos.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo de datos
+        omitir_verificacion (bool): Si debe confiar en un CSV ya verificado
+            (ver cargar_datos_verificados)
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[str, Any]]: Países y reporte de integridad
+    """
+    if es_ruta_sqlite(ruta_archivo):
+        paises = cargar_datos_sqlite(ruta_archivo)
+        reporte = generar_reporte_integridad(paises)
+        reporte.update({'ruta': ruta_archivo, 'checksum': None, 'verificado': True})
+        return paises, reporte
+    return cargar_datos_verificados(ruta_archivo, omitir_verificacion)
+
+
+def guardar_datos(paises: List[Dict[str, Any]], ruta_archivo: str) -> bool:
+    """
+    Guarda la lista completa de países en un CSV o una base SQLite.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países a guardar
+        ruta_archivo (str): Ruta al archivo de datos
+
+    Returns:
+        bool: True si el guardado fue exitoso, False en caso contrario
+    """
+    if es_ruta_sqlite(ruta_archivo):
+        return guardar_datos_sqlite(paises, ruta_archivo)
+    return guardar_datos_csv(paises, ruta_archivo)
+
+
+def guardar_pais(paises: List[Dict[str, Any]], pais: Dict[str, Any], ruta_archivo: str) -> bool:
+    """
+    Persiste el alta o modificación de un país.
+
+    Con SQLite solo se escribe la fila afectada; con CSV se reescribe el
+    archivo completo porque el formato no permite modificar una sola fila.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista completa de países
+        pais (Dict[str, Any]): País agregado o modificado
+        ruta_archivo (str): Ruta al archivo de datos
+
+    Returns:
+        bool: True si el guardado fue exitoso, False en caso contrario
+    """
+    if es_ruta_sqlite(ruta_archivo):
+        return guardar_pais_sqlite(pais, ruta_archivo)
+    return guardar_datos_csv(paises, ruta_archivo)
+
+
+def migrar_csv_a_sqlite(ruta_csv: str, ruta_sqlite: str) -> int:
+    """
+    Copia todos los países de un archivo CSV a una base de datos SQLite.
+
+    Args:
+        ruta_csv (str): Ruta al archivo CSV de origen
+        ruta_sqlite (str): Ruta a la base de datos de destino
+
+    Returns:
+        int: Cantidad de países distintos migrados (0 si falló el guardado)
+    """
+    paises = cargar_datos_csv(ruta_csv)
+    if not guardar_datos_sqlite(paises, ruta_sqlite):
+        return 0
+    return len({normalizar_texto_busqueda(pais['nombre']) for pais in paises})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Migra los datos de países de CSV a SQLite")
+    parser.add_argument('origen', help="Archivo CSV de origen")
+    parser.add_argument('destino', help="Base de datos SQLite de destino (.db, .sqlite)")
+    argumentos = parser.parse_args()
+
+    migrados = migrar_csv_a_sqlite(argumentos.origen, argumentos.destino)
+    if migrados:
+        print(f"✅ {migrados} países migrados a {argumentos.destino}")
+    else:
+        print(f"❌ No se migraron los datos a {argumentos.destino}")
@@ -0,0 +1,267 @@
+"""
+Módulo de Índices Bitmap
+========================
+Este módulo contiene índices bitmap para resolver búsquedas con varios
+criterios combinando enteros de Python con operaciones AND/OR, en lugar de
+filtrar la lista de países una vez por cada criterio.
+
+El bit i de cada bitmap corresponde a la fila i del índice.
+"""
+
+from bisect import bisect_right
+from heapq import merge
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from .validacion import normalizar_texto_busqueda
+
+# Cantidad de cubetas en las que se dividen los rangos numéricos
+CUBETAS_POR_DEFECTO = 32
+
+# Posiciones de los bits encendidos para cada valor posible de un byte
+_BITS_DE_BYTE = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def _bitmap_desde_posiciones(posiciones: List[int], total: int) -> int:
+    """Construye un bitmap con los bits indicados encendidos en una sola pasada."""
+    datos = bytearray((total + 7) // 8)
+    for posicion in posiciones:
+        datos[posicion >> 3] |= 1 << (posicion & 7)
+    return int.from_bytes(datos, 'little')
+
+
+def _posiciones_activas(bitmap: int) -> Iterator[int]:
+    """Recorre las posiciones de los bits encendidos de menor a mayor."""
+    datos = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for indice_byte, byte in enumerate(datos):
+        if byte:
+            base = indice_byte << 3
+            for bit in _BITS_DE_BYTE[byte]:
+                yield base + bit
+
+
+def _crear_columna_rangos(valores: List[int], cubetas: int) -> Dict[str, Any]:
+    """
+    Divide una columna numérica en cubetas de igual cantidad de filas.
+
+    Returns:
+        Dict[str, Any]: Límites inferiores de las cubetas y un bitmap por cubeta
+    """
+    ordenados = sorted(valores)
+    limites = []
+    for i in range(1, cubetas if ordenados else 0):
+        limite = ordenados[i * len(ordenados) // cubetas]
+        if not limites or limite > limites[-1]:
+            limites.append(limite)
+
+    posiciones = [[] for _ in range(len(limites) + 1)]
+    for fila, valor in enumerate(valores):
+        posiciones[bisect_right(limites, valor)].append(fila)
+
+    return {
+        'limites': limites,
+        'bitmaps': [_bitmap_desde_posiciones(p, len(valores)) for p in posiciones],
+    }
+
+
+def _candidatos_rango(columna: Dict[str, Any], minimo: Optional[int],
+                      maximo: Optional[int]) -> Tuple[int, int]:
+    """
+    Obtiene las filas que pueden cumplir un rango numérico.
+
+    Returns:
+        Tuple[int, int]: Bitmap de candidatos y bitmap de las filas en cubetas
+            de borde, que deben verificarse contra el valor real
+    """
+    bitmaps = columna['bitmaps']
+    desde = 0 if minimo is None else bisect_right(columna['limites'], minimo)
+    hasta = len(bitmaps) - 1 if maximo is None else bisect_right(columna['limites'], maximo)
+    if desde > hasta:
+        return 0, 0
+
+    interior = 0
+    for cubeta in range(desde + 1, hasta):
+        interior |= bitmaps[cubeta]
+
+    # Las cubetas de los extremos solo cubren el rango parcialmente
+    bordes = 0
+    if minimo is not None:
+        bordes |= bitmaps[desde]
+    else:
+        interior |= bitmaps[desde]
+    if maximo is not None:
+        bordes |= bitmaps[hasta]
+    elif hasta != desde:
+        interior |= bitmaps[hasta]
+
+    return interior | bordes, bordes
+
+
+def crear_indice_bitmap(paises: List[Dict[str, Any]],
+                        cubetas: int = CUBETAS_POR_DEFECTO) -> Dict[str, Any]:
+    """
+    Crea los bitmaps por continente y por rangos de población y superficie.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        cubetas (int): Cantidad de cubetas para las columnas numéricas
+
+    Returns:
+        Dict[str, Any]: Índice bitmap sobre la lista de países
+    """
+    total = len(paises)
+
+    posiciones_continente = {}
+    for fila, pais in enumerate(paises):
+        continente = normalizar_texto_busqueda(pais['continente'])
+        posiciones_continente.setdefault(continente, []).append(fila)
+
+    return {
+        'filas': list(paises),
+        'posiciones': {id(pais): fila for fila, pais in enumerate(paises)},
+        'activas': (1 << total) - 1,
+        'continentes': {
+            continente: _bitmap_desde_posiciones(posiciones, total)
+            for continente, posiciones in posiciones_continente.items()
+        },
+        'poblacion': _crear_columna_rangos([p['poblacion'] for p in paises], cubetas),
+        'superficie': _crear_columna_rangos([p['superficie'] for p in paises], cubetas),
+    }
+
+
+def _marcar_fila(indice: Dict[str, Any], fila: int, pais: Dict[str, Any], encender: bool):
+    """Enciende o apaga el bit de una fila en los bitmaps que le corresponden."""
+    mascara = 1 << fila
+    continentes = indice['continentes']
+    continente = normalizar_texto_busqueda(pais['continente'])
+    if encender:
+        continentes[continente] = continentes.get(continente, 0) | mascara
+    elif continente in continentes:
+        continentes[continente] &= ~mascara
+
+    for campo in ('poblacion', 'superficie'):
+        columna = indice[campo]
+        cubeta = bisect_right(columna['limites'], pais[campo])
+        if encender:
+            columna['bitmaps'][cubeta] |= mascara
+        else:
+            columna['bitmaps'][cubeta] &= ~mascara
+
+
+def agregar_a_indice_bitmap(indice: Dict[str, Any], pais: Dict[str, Any]):
+    """
+    Agrega un país al final del índice bitmap.
+
+    Los límites de las cubetas no se recalculan: los valores fuera del rango
+    original caen en la primera o la última cubeta.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_bitmap
+        pais (Dict[str, Any]): País a agregar
+    """
+    fila = len(indice['filas'])
+    indice['filas'].append(pais)
+    indice['posiciones'][id(pais)] = fila
+    indice['activas'] |= 1 << fila
+    _marcar_fila(indice, fila, pais, encender=True)
+
+
+def actualizar_en_indice_bitmap(indice: Dict[str, Any], pais: Dict[str, Any],
+                                valores_anteriores: Dict[str, Any]):
+    """
+    Mueve un país a las cubetas que corresponden a sus nuevos valores.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_bitmap
+        pais (Dict[str, Any]): País ya modificado
+        valores_anteriores (Dict[str, Any]): Valores de 'poblacion', 'superficie'
+            y 'continente' antes de la modificación
+    """
+    fila = indice['posiciones'].get(id(pais))
+    if fila is None:
+        return
+    anterior = dict(pais)
+    anterior.update(valores_anteriores)
+    _marcar_fila(indice, fila, anterior, encender=False)
+    _marcar_fila(indice, fila, pais, encender=True)
+
+
+def eliminar_de_indice_bitmap(indice: Dict[str, Any], pais: Dict[str, Any]):
+    """
+    Quita un país del índice bitmap sin desplazar las demás filas.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_bitmap
+        pais (Dict[str, Any]): País a quitar
+    """
+    fila = indice['posiciones'].pop(id(pais), None)
+    if fila is None:
+        return
+    _marcar_fila(indice, fila, pais, encender=False)
+    indice['activas'] &= ~(1 << fila)
+    indice['filas'][fila] = None
+
+
+def consultar_indice_bitmap(indice: Dict[str, Any],
+                            continente: Optional[str] = None,
+                            poblacion_min: Optional[int] = None,
+                            poblacion_max: Optional[int] = None,
+                            superficie_min: Optional[int] = None,
+                            superficie_max: Optional[int] = None,
+                            nombre_contiene: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Busca países combinando los bitmaps de cada criterio.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_bitmap
+        continente (str, optional): Continente a filtrar
+        poblacion_min (int, optional): Población mínima
+        poblacion_max (int, optional): Población máxima
+        superficie_min (int, optional): Superficie mínima
+        superficie_max (int, optional): Superficie máxima
+        nombre_contiene (str, optional): Texto que debe contener el nombre
+
+    Returns:
+        List[Dict[str, Any]]: Países que cumplen todos los criterios, en el
+            mismo orden en que fueron indexados
+    """
+    resultado = indice['activas']
+
+    if continente:
+        resultado &= indice['continentes'].get(normalizar_texto_busqueda(continente), 0)
+
+    verificar_poblacion = 0
+    if poblacion_min is not None or poblacion_max is not None:
+        candidatos, verificar_poblacion = _candidatos_rango(
+            indice['poblacion'], poblacion_min, poblacion_max)
+        resultado &= candidatos
+
+    verificar_superficie = 0
+    if superficie_min is not None or superficie_max is not None:
+        candidatos, verificar_superficie = _candidatos_rango(
+            indice['superficie'], superficie_min, superficie_max)
+        resultado &= candidatos
+
+    min_pob = poblacion_min if poblacion_min is not None else 0
+    max_pob = poblacion_max if poblacion_max is not None else float('inf')
+    min_sup = superficie_min if superficie_min is not None else 0
+    max_sup = superficie_max if superficie_max is not None else float('inf')
+    texto = normalizar_texto_busqueda(nombre_contiene) if nombre_contiene else None
+    filas = indice['filas']
+
+    # Única pasada de materialización: solo se revisan los valores reales
+    # de las filas que cayeron en cubetas de borde
+    bordes = resultado & (verificar_poblacion | verificar_superficie)
+    filas_seguras = _posiciones_activas(resultado & ~bordes)
+    filas_a_revisar = (
+        fila for fila in _posiciones_activas(bordes)
+        if min_pob <= filas[fila]['poblacion'] <= max_pob
+        and min_sup <= filas[fila]['superficie'] <= max_sup
+    )
+
+    resultados = []
+    for fila in merge(filas_seguras, filas_a_revisar):
+        pais = filas[fila]
+        if texto and texto not in normalizar_texto_busqueda(pais['nombre']):
+            continue
+        resultados.append(pais)
+
+    return resultados
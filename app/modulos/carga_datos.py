@@ -6,7 +6,32 @@ Incluye funciones para validar el formato de los datos y manejar errores.
 """
 import csv
 import os
-from typing import List, Dict, Any
+import io
+import hashlib
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Iterator, Callable
+from .validacion import normalizar_texto_busqueda
+from .registro_columnas import (
+    REGISTRO_COLUMNAS, columnas_adicionales, es_columna_adicional,
+    compilar_conversor
+)
+
+# Sufijo del archivo que guarda el checksum del último archivo verificado
+SUFIJO_CHECKSUM = '.verificado'
+
+# Columnas requeridas del CSV, en el orden en que se leen las filas crudas
+COLUMNAS_REQUERIDAS = ['nombre', 'poblacion', 'superficie', 'continente']
+
+# Columnas opcionales con las coordenadas del centroide de cada país (en grados)
+COLUMNAS_COORDENADAS = ['latitud', 'longitud']
+
+# Cantidad de filas que se convierten juntas, columna por columna, al validar en lote
+TAMANO_BLOQUE_VALIDACION = 256
+
+# Cantidad de filas que se leen por vez al recorrer un CSV sin cargarlo completo
+TAMANO_BLOQUE_LECTURA = 8192
 
 def cargar_datos_csv(ruta_archivo: str) -> List[Dict[str, Any]]:
     """
@@ -28,20 +53,13 @@ def cargar_datos_csv(ruta_archivo: str) -> List[Dict[str, Any]]:
     paises = []
     
     try:
-        with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
-            lector_csv = csv.DictReader(archivo)
-            # Verificar que las columnas requeridas estén presentes
-            columnas_requeridas = ['nombre', 'poblacion', 'superficie', 'continente']
-            if not all(col in lector_csv.fieldnames for col in columnas_requeridas):
-                raise ValueError("El archivo CSV no contiene todas las columnas requeridas")
-            for numero_fila, fila in enumerate(lector_csv, start=2):  # Empezamos en 2 porque la fila 1 es el header
-                try:
-                    # Validar y convertir los datos
-                    pais = validar_fila_pais(fila, numero_fila)
-                    paises.append(pais)
-                except ValueError as e:
-                    print(f"Advertencia: Error en fila {numero_fila}: {e}")
-                    continue
+        columnas = []
+        with open(ruta_archivo, 'r', encoding='utf-8', newline='') as archivo:
+            filas = leer_filas_csv(archivo, columnas)
+        # Validar y convertir todas las filas en lote (la fila 1 es el header)
+        _, paises, errores = validar_filas_paises(filas, primera_fila=2, columnas=columnas)
+        for error in errores:
+            print(f"Advertencia: Error en fila {error['fila']}: {error['mensaje']}")
     except Exception as e:
         raise ValueError(f"Error al leer el archivo CSV: {e}")
     
@@ -51,10 +69,126 @@ def cargar_datos_csv(ruta_archivo: str) -> List[Dict[str, Any]]:
     return paises
 
 
+def _columnas_leidas(encabezado: Optional[List[str]]) -> List[str]:
+    """
+    Columnas que se leen de un CSV: las requeridas, las coordenadas si están
+    las dos y, al final, las columnas adicionales (ver columnas_adicionales).
+    """
+    if not encabezado or not all(col in encabezado for col in COLUMNAS_REQUERIDAS):
+        raise ValueError("El archivo CSV no contiene todas las columnas requeridas")
+    columnas = list(COLUMNAS_REQUERIDAS)
+    if all(col in encabezado for col in COLUMNAS_COORDENADAS):
+        columnas += COLUMNAS_COORDENADAS
+    return columnas + columnas_adicionales(encabezado)
+
+
+def _proyectar_filas(crudas: List[List[str]], posiciones: List[int]) -> List[Sequence[Optional[str]]]:
+    """Reordena las filas crudas para dejar solo las columnas leídas."""
+    if posiciones == list(range(len(posiciones))):
+        # Formato habitual (el que escribe guardar_datos_csv): usar las filas tal cual
+        return crudas
+    try:
+        return list(map(itemgetter(*posiciones), crudas))
+    except IndexError:
+        # Filas más cortas que el encabezado: completar con None como csv.DictReader
+        return [tuple(fila[i] if i < len(fila) else None for i in posiciones) for fila in crudas]
+
+
+def leer_filas_csv(archivo, columnas: Optional[List[str]] = None) -> List[Sequence[Optional[str]]]:
+    """
+    Lee las filas crudas de un CSV de países sin crear un diccionario por fila.
+    
+    Args:
+        archivo: Archivo de texto abierto (o cualquier iterable de líneas)
+        columnas (List[str], optional): Lista donde se agregan los nombres de
+            las columnas leídas, que se pasan a validar_filas_paises
+        
+    Returns:
+        List[Sequence[Optional[str]]]: Los campos (nombre, poblacion,
+            superficie, continente, latitud y longitud si el archivo las tiene
+            y las columnas adicionales) de cada fila, en ese orden
+        
+    Raises:
+        ValueError: Si el archivo no tiene las columnas requeridas
+    """
+    lector_csv = csv.reader(archivo)
+    encabezado = next(lector_csv, None)
+    leidas = _columnas_leidas(encabezado)
+    if columnas is not None:
+        columnas.extend(leidas)
+    # filter(None, ...) descarta las líneas vacías, como csv.DictReader
+    return _proyectar_filas(list(filter(None, lector_csv)), [encabezado.index(col) for col in leidas])
+
+
+def leer_bloques_csv(archivo, tamano_bloque: int = TAMANO_BLOQUE_LECTURA,
+                     columnas: Optional[List[str]] = None) -> Iterator[List[Sequence[Optional[str]]]]:
+    """
+    Lee las filas crudas de un CSV de a bloques, sin cargar el archivo completo.
+    
+    Args:
+        archivo: Archivo de texto abierto (o cualquier iterable de líneas)
+        tamano_bloque (int): Cantidad de filas de cada bloque
+        columnas (List[str], optional): Lista donde se agregan los nombres de
+            las columnas leídas (ver leer_filas_csv)
+        
+    Yields:
+        List[Sequence[Optional[str]]]: Filas de cada bloque, como en leer_filas_csv
+        
+    Raises:
+        ValueError: Si el archivo no tiene las columnas requeridas
+    """
+    lector_csv = csv.reader(archivo)
+    encabezado = next(lector_csv, None)
+    leidas = _columnas_leidas(encabezado)
+    if columnas is not None:
+        columnas.extend(leidas)
+    posiciones = [encabezado.index(col) for col in leidas]
+    # Las líneas vacías se descartan igual que en leer_filas_csv
+    no_vacias = filter(None, lector_csv)
+    while True:
+        crudas = list(islice(no_vacias, tamano_bloque))
+        if not crudas:
+            return
+        yield _proyectar_filas(crudas, posiciones)
+
+
+def iterar_paises_csv(ruta_archivo: str, errores: Optional[List[Dict[str, Any]]] = None,
+                      tamano_bloque: int = TAMANO_BLOQUE_LECTURA) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre los países válidos de un CSV leyéndolo de a bloques.
+    
+    Permite procesar archivos que no entran en memoria: solo se mantiene un
+    bloque de filas a la vez.
+    
+    Args:
+        ruta_archivo (str): Ruta al archivo CSV
+        errores (List[Dict[str, Any]], optional): Lista donde se agregan las
+            filas inválidas ({'fila', 'mensaje', 'nombre'}, como en
+            validar_filas_paises)
+        tamano_bloque (int): Cantidad de filas que se leen y validan juntas
+        
+    Yields:
+        Dict[str, Any]: Cada país válido, en el orden del archivo
+    """
+    with open(ruta_archivo, 'r', encoding='utf-8', newline='') as archivo:
+        primera_fila = 2
+        columnas = []
+        for filas in leer_bloques_csv(archivo, tamano_bloque, columnas):
+            _, paises, errores_bloque = validar_filas_paises(filas, primera_fila, columnas)
+            if errores is not None:
+                errores.extend(errores_bloque)
+            primera_fila += len(filas)
+            yield from paises
+
+
 def validar_fila_pais(fila: Dict[str, str], numero_fila: int) -> Dict[str, Any]:
     """
     Valida y convierte una fila del CSV a un diccionario de país.
     
+    Las columnas requeridas se validan con las reglas de su definición en el
+    registro de columnas, escritas en línea; las adicionales se convierten
+    con compilar_conversor.
+    
     Args:
         fila (Dict[str, str]): Fila del CSV como diccionario
         numero_fila (int): Número de fila para reportar errores
@@ -99,9 +233,241 @@ def validar_fila_pais(fila: Dict[str, str], numero_fila: int) -> Dict[str, Any]:
         'continente': continente,
     }
     
+    # Coordenadas opcionales
+    _agregar_coordenadas(pais, fila.get('latitud'), fila.get('longitud'))
+    
+    # Columnas adicionales (las desconocidas se conservan como texto)
+    if len(fila) > len(COLUMNAS_REQUERIDAS):
+        adicionales = _columnas_adicionales_fila(tuple(fila))
+        if adicionales:
+            pais.update(compilar_conversor(adicionales)([fila[columna] for columna in adicionales]))
+    
     return pais
 
 
+@lru_cache(maxsize=64)
+def _columnas_adicionales_fila(claves: Tuple[Any, ...]) -> Tuple[str, ...]:
+    """Columnas adicionales de una fila como diccionario (las filas de un archivo repiten sus claves)."""
+    return tuple(columna for columna in claves if es_columna_adicional(columna))
+
+
+def _agregar_coordenadas(pais: Dict[str, Any], latitud: Optional[str], longitud: Optional[str]):
+    """
+    Valida y agrega las coordenadas de un país, si la fila las tiene.
+    
+    Raises:
+        ValueError: Si solo hay una de las dos o no son coordenadas válidas
+    """
+    if not (latitud and latitud.strip()) and not (longitud and longitud.strip()):
+        return
+    definicion_latitud = REGISTRO_COLUMNAS['latitud']
+    definicion_longitud = REGISTRO_COLUMNAS['longitud']
+    try:
+        valor_latitud = definicion_latitud['convertir'](latitud)
+        valor_longitud = definicion_longitud['convertir'](longitud)
+    except (ValueError, TypeError):
+        raise ValueError(f"Coordenadas inválidas: '{latitud}', '{longitud}'")
+    if not (definicion_latitud['validar'](valor_latitud) and definicion_longitud['validar'](valor_longitud)):
+        raise ValueError(f"Coordenadas fuera de rango: '{latitud}', '{longitud}'")
+    pais['latitud'] = valor_latitud
+    pais['longitud'] = valor_longitud
+
+
+def _limpiar_columna_texto(valores: Sequence[Optional[str]]) -> List[str]:
+    """Quita los espacios de una columna de texto (las celdas faltantes quedan vacías)."""
+    try:
+        return list(map(str.strip, valores))
+    except TypeError:
+        return [valor.strip() if valor is not None else '' for valor in valores]
+
+
+def _convertir_columna_entera(valores: Sequence[Optional[str]]) -> List[Optional[int]]:
+    """
+    Convierte de una vez una columna de enteros positivos con separadores de miles.
+    
+    La columna se une en un solo texto, una línea por valor: los separadores
+    se quitan con dos replace sobre todo el texto y map(int) convierte la
+    columna completa. Solo si algún valor no es válido se vuelve a recorrer
+    la columna valor por valor para ubicarlo.
+    
+    Returns:
+        List[Optional[int]]: El entero de cada valor, o None para los que no
+            son enteros positivos (validar_fila_pais da el mensaje de error)
+    """
+    try:
+        numeros = list(map(int, '\n'.join(valores).replace(',', '').replace('.', '').split('\n')))
+        # Un campo entre comillas con un salto de línea cambiaría la cantidad
+        if len(numeros) == len(valores) and min(numeros) > 0:
+            return numeros
+    except (ValueError, TypeError):  # TypeError: celdas faltantes (None)
+        pass
+    
+    # isdecimal() acepta exactamente los dígitos que acepta int(); los valores
+    # con otro formato que int() admite (espacios, signo) quedan para validar_fila_pais
+    sin_separadores = [(valor or '').replace(',', '').replace('.', '') for valor in valores]
+    return [int(texto) or None if texto.isdecimal() else None for texto in sin_separadores]
+
+
+def _convertir_bloque(bloque: List[Sequence[Optional[str]]], ancho: int, coordenadas: bool = False,
+                      conversor: Optional[Callable] = None,
+                      inicio_adicionales: int = 4) -> Tuple[List[Optional[Dict[str, Any]]], List[int]]:
+    """
+    Convierte un bloque de filas crudas columna por columna.
+    
+    El bloque se transpone y cada columna requerida se convierte completa:
+    las numéricas con _convertir_columna_entera y las de texto con un único
+    map(str.strip). Recién al final se arma el diccionario de cada país.
+    
+    Returns:
+        Tuple[List[Optional[Dict[str, Any]]], List[int]]: El país de cada
+            fila (None si no pudo convertirse) y las posiciones de esas filas,
+            que deben revisarse con validar_fila_pais
+    """
+    if set(map(len, bloque)) != {ancho}:
+        # Filas con otra cantidad de campos: se revisan aparte, fila por fila
+        vacia = (None,) * ancho
+        bloque = [fila if len(fila) == ancho else vacia for fila in bloque]
+    columnas = list(zip(*bloque))
+    nombres = _limpiar_columna_texto(columnas[0])
+    poblaciones = _convertir_columna_entera(columnas[1])
+    superficies = _convertir_columna_entera(columnas[2])
+    continentes = _limpiar_columna_texto(columnas[3])
+    
+    if (None not in poblaciones and None not in superficies
+            and all(nombres) and all(continentes)):
+        convertidos = [
+            {'nombre': nombre, 'poblacion': poblacion, 'superficie': superficie, 'continente': continente}
+            for nombre, poblacion, superficie, continente
+            in zip(nombres, poblaciones, superficies, continentes)
+        ]
+        if not coordenadas and conversor is None:
+            return convertidos, []
+    else:
+        convertidos = [
+            {'nombre': nombre, 'poblacion': poblacion, 'superficie': superficie, 'continente': continente}
+            if nombre and poblacion and superficie and continente else None
+            for nombre, poblacion, superficie, continente
+            in zip(nombres, poblaciones, superficies, continentes)
+        ]
+    
+    # Coordenadas y columnas adicionales: el conversor compilado va fila por fila
+    if coordenadas or conversor is not None:
+        for posicion, (pais, fila) in enumerate(zip(convertidos, bloque)):
+            if pais is None:
+                continue
+            try:
+                if coordenadas:
+                    _agregar_coordenadas(pais, fila[4], fila[5])
+                if conversor is not None:
+                    pais.update(conversor(fila[inicio_adicionales:]))
+            except (ValueError, IndexError):
+                convertidos[posicion] = None
+    
+    return convertidos, [posicion for posicion, pais in enumerate(convertidos) if pais is None]
+
+
+def validar_filas_paises(filas: List[Sequence[Optional[str]]], primera_fila: int = 2,
+                         columnas: Optional[List[str]] = None) -> Tuple[List[bool], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Valida y convierte un lote de filas crudas del CSV.
+    
+    Equivale a llamar a validar_fila_pais para cada fila, pero las filas se
+    convierten por bloques y cada bloque columna por columna, sin llamadas ni
+    excepciones por fila (ver _convertir_columna_entera). Solo las filas que
+    no pasan la conversión por columnas se revisan con validar_fila_pais, con
+    los mismos mensajes de error. El conversor de las columnas adicionales se
+    arma una sola vez por lote.
+    
+    Args:
+        filas (List[Sequence[Optional[str]]]): Campos de cada fila, tal como
+            los devuelve leer_filas_csv
+        primera_fila (int): Número de la primera fila, para reportar errores
+        columnas (List[str], optional): Columnas de las filas, tal como las
+            informa leer_filas_csv (por defecto, solo las requeridas)
+        
+    Returns:
+        Tuple[List[bool], List[Dict[str, Any]], List[Dict[str, Any]]]: Máscara
+            con la validez de cada fila, países válidos en orden y errores
+            ({'fila', 'mensaje', 'nombre'}; 'nombre' queda vacío si la fila no
+            lo trae)
+    """
+    mascara = []
+    paises = []
+    errores = []
+    
+    if columnas is None:
+        columnas = COLUMNAS_REQUERIDAS
+    coordenadas = columnas[4:6] == COLUMNAS_COORDENADAS
+    inicio_adicionales = 6 if coordenadas else 4
+    adicionales = tuple(columnas[inicio_adicionales:])
+    conversor = compilar_conversor(adicionales) if adicionales else None
+    
+    for inicio in range(0, len(filas), TAMANO_BLOQUE_VALIDACION):
+        bloque = filas[inicio:inicio + TAMANO_BLOQUE_VALIDACION]
+        convertidos, pendientes = _convertir_bloque(bloque, len(columnas), coordenadas,
+                                                    conversor, inicio_adicionales)
+        if not pendientes:
+            paises.extend(convertidos)
+            mascara.extend([True] * len(convertidos))
+            continue
+        
+        # Solo las filas que la conversión por columnas no resolvió pasan por
+        # validar_fila_pais, que da el mensaje de error (o las acepta, si
+        # tienen un formato que int() admite, como espacios alrededor)
+        for posicion in pendientes:
+            numero_fila = primera_fila + inicio + posicion
+            campos = dict.fromkeys(columnas)
+            campos.update(zip(columnas, bloque[posicion]))
+            try:
+                convertidos[posicion] = validar_fila_pais(campos, numero_fila)
+            except (ValueError, AttributeError) as e:
+                errores.append({'fila': numero_fila, 'mensaje': str(e),
+                                'nombre': (campos.get('nombre') or '').strip()})
+        # Los países son diccionarios no vacíos: bool() los distingue de None
+        mascara.extend(map(bool, convertidos))
+        paises.extend(filter(None, convertidos))
+    
+    return mascara, paises, errores
+
+
+def generar_reporte_integridad(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Revisa una lista de países ya cargada y reúne todos los problemas encontrados.
+    
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        
+    Returns:
+        Dict[str, Any]: Reporte con las claves 'valido', 'total_filas',
+            'filas_validas', 'errores' y 'duplicados'
+    """
+    campos_requeridos = ['nombre', 'poblacion', 'superficie', 'continente']
+    errores = []
+    duplicados = []
+    indice_nombres = {}
+    
+    for i, pais in enumerate(paises, start=1):
+        faltantes = [campo for campo in campos_requeridos if campo not in pais]
+        if faltantes:
+            errores.append({'fila': i, 'mensaje': f"Faltan los campos: {', '.join(faltantes)}"})
+            continue
+        
+        if pais['poblacion'] <= 0:
+            errores.append({'fila': i, 'mensaje': f"País {pais['nombre']} tiene población inválida"})
+        if pais['superficie'] <= 0:
+            errores.append({'fila': i, 'mensaje': f"País {pais['nombre']} tiene superficie inválida"})
+        
+        _registrar_nombre(indice_nombres, duplicados, pais['nombre'], i)
+    
+    return {
+        'valido': bool(paises) and not errores,
+        'total_filas': len(paises),
+        'filas_validas': len(paises) - len({error['fila'] for error in errores}),
+        'errores': errores,
+        'duplicados': duplicados,
+    }
+
+
 def verificar_integridad_datos(paises: List[Dict[str, Any]]) -> bool:
     """
     Verifica la integridad de los datos cargados.
@@ -116,32 +482,157 @@ def verificar_integridad_datos(paises: List[Dict[str, Any]]) -> bool:
         print("❌ Error: No hay países cargados")
         return False
     
-    # Verificar que todos los países tengan los campos requeridos
-    campos_requeridos = ['nombre', 'poblacion', 'superficie', 'continente']
+    reporte = generar_reporte_integridad(paises)
+    if not reporte['valido']:
+        primer_error = reporte['errores'][0]
+        print(f"❌ Error: {len(reporte['errores'])} problemas de integridad "
+              f"(fila {primer_error['fila']}: {primer_error['mensaje']})")
+        return False
+    
+    print("✓ Integridad de datos verificada correctamente")
+    return True
+
+
+def _registrar_nombre(indice_nombres: Dict[str, int], duplicados: List[Dict[str, Any]],
+                      nombre: str, numero_fila: int):
+    """Registra un nombre en el índice y anota el duplicado si ya existía."""
+    nombre_normalizado = normalizar_texto_busqueda(nombre)
+    fila_original = indice_nombres.setdefault(nombre_normalizado, numero_fila)
+    if fila_original != numero_fila:
+        duplicados.append({'fila': numero_fila, 'nombre': nombre, 'fila_original': fila_original})
+
+
+def calcular_checksum(contenido: bytes) -> str:
+    """
+    Calcula el checksum SHA-256 del contenido de un archivo.
     
-    for i, pais in enumerate(paises):
-        for campo in campos_requeridos:
-            if campo not in pais:
-                print(f"❌ Error: País {i+1} no tiene el campo '{campo}'")
-                return False
+    Args:
+        contenido (bytes): Contenido del archivo
         
-        # Verificar que los valores numéricos sean válidos
-        if pais['poblacion'] <= 0:
-            print(f"❌ Error: País {pais['nombre']} tiene población inválida")
-            return False
+    Returns:
+        str: Checksum en hexadecimal
+    """
+    return hashlib.sha256(contenido).hexdigest()
+
+
+def _ruta_checksum(ruta_archivo: str) -> str:
+    """Ruta del archivo donde se guarda el checksum del último archivo verificado."""
+    return ruta_archivo + SUFIJO_CHECKSUM
+
+
+def _leer_checksum_verificado(ruta_archivo: str) -> Optional[str]:
+    """Lee el checksum registrado de la última verificación exitosa, si existe."""
+    try:
+        with open(_ruta_checksum(ruta_archivo), 'r', encoding='utf-8') as archivo:
+            return archivo.read().strip() or None
+    except OSError:
+        return None
+
+
+def _registrar_checksum_verificado(ruta_archivo: str, checksum: str):
+    """Registra el checksum de un archivo que pasó la verificación completa."""
+    try:
+        with open(_ruta_checksum(ruta_archivo), 'w', encoding='utf-8') as archivo:
+            archivo.write(checksum + "\n")
+    except OSError:
+        # No poder registrar el checksum solo impide omitir la próxima verificación
+        pass
+
+
+def cargar_datos_verificados(ruta_archivo: str,
+                             omitir_verificacion: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Carga un CSV de países verificando su integridad en la misma pasada.
+    
+    A diferencia de cargar_datos_csv, no se detiene ni imprime un mensaje por
+    cada fila inválida: todos los problemas (filas inválidas y nombres
+    repetidos) se reúnen en un reporte. Si se pide omitir la verificación y
+    el checksum coincide con el del último archivo verificado, las filas se
+    convierten sin validarlas; si no coincide, se verifica el archivo y, si
+    todas sus filas son válidas, se registra su checksum para la próxima
+    vez. Sin omitir la verificación no se escribe ningún archivo.
+    
+    Args:
+        ruta_archivo (str): Ruta al archivo CSV con los datos
+        omitir_verificacion (bool): Si debe confiar en un archivo ya verificado
         
-        if pais['superficie'] <= 0:
-            print(f"❌ Error: País {pais['nombre']} tiene superficie inválida")
-            return False
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[str, Any]]: Países cargados y reporte
+            de integridad (ver generar_reporte_integridad), con las claves
+            adicionales 'ruta', 'checksum' y 'verificado'
+        
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el archivo no tiene las columnas requeridas
+    """
+    if not os.path.exists(ruta_archivo):
+        raise FileNotFoundError(f"No se encontró el archivo: {ruta_archivo}")
     
-    print("✓ Integridad de datos verificada correctamente")
-    return True
+    with open(ruta_archivo, 'rb') as archivo:
+        contenido = archivo.read()
+    checksum = calcular_checksum(contenido)
+    confiable = omitir_verificacion and _leer_checksum_verificado(ruta_archivo) == checksum
+    
+    columnas = []
+    filas = leer_filas_csv(io.StringIO(contenido.decode('utf-8'), newline=''), columnas)
+    errores = []
+    duplicados = []
+    
+    if confiable:
+        # Archivo idéntico a uno ya verificado: solo convertir tipos
+        paises = [
+            {
+                'nombre': nombre.strip(),
+                'poblacion': int(poblacion.replace(',', '').replace('.', '')),
+                'superficie': int(superficie.replace(',', '').replace('.', '')),
+                'continente': continente.strip(),
+            }
+            for nombre, poblacion, superficie, continente, *_ in filas
+        ]
+        coordenadas = columnas[4:6] == COLUMNAS_COORDENADAS
+        if coordenadas:
+            for pais, fila in zip(paises, filas):
+                _agregar_coordenadas(pais, fila[4] if len(fila) > 4 else None,
+                                     fila[5] if len(fila) > 5 else None)
+        inicio_adicionales = 6 if coordenadas else 4
+        if len(columnas) > inicio_adicionales:
+            conversor = compilar_conversor(tuple(columnas[inicio_adicionales:]))
+            for pais, fila in zip(paises, filas):
+                pais.update(conversor(fila[inicio_adicionales:]))
+    else:
+        mascara, paises, errores = validar_filas_paises(filas, primera_fila=2, columnas=columnas)
+        numeros_fila = (numero for numero, valida in enumerate(mascara, start=2) if valida)
+        indice_nombres = {}
+        for numero_fila, pais in zip(numeros_fila, paises):
+            _registrar_nombre(indice_nombres, duplicados, pais['nombre'], numero_fila)
+    
+    if omitir_verificacion and not confiable and paises and not errores:
+        _registrar_checksum_verificado(ruta_archivo, checksum)
+    
+    reporte = {
+        'ruta': ruta_archivo,
+        'checksum': checksum,
+        'verificado': not confiable,
+        'valido': bool(paises),
+        'total_filas': len(filas),
+        'filas_validas': len(paises),
+        'errores': errores,
+        'duplicados': duplicados,
+    }
+    
+    if paises:
+        print(f"✓ Datos cargados exitosamente: {len(paises)} países")
+    return paises, reporte
 
 
 def guardar_datos_csv(paises: List[Dict[str, Any]], ruta_archivo: str) -> bool:
     """
     Guarda los datos de países en un archivo CSV.
     
+    Además de las columnas requeridas se guardan las coordenadas y las
+    columnas adicionales, si algún país las tiene; las derivadas no se
+    guardan porque se recalculan al cargar.
+    
     Args:
         paises (List[Dict[str, Any]]): Lista de países a guardar
         ruta_archivo (str): Ruta al archivo CSV donde guardar los datos
@@ -162,19 +653,24 @@ def guardar_datos_csv(paises: List[Dict[str, Any]], ruta_archivo: str) -> bool:
         # Escribir los datos al archivo CSV
         with open(ruta_archivo, 'w', encoding='utf-8', newline='') as archivo:
             columnas = ['nombre', 'poblacion', 'superficie', 'continente']
-            escritor_csv = csv.DictWriter(archivo, fieldnames=columnas)
+            # Las coordenadas son opcionales: solo se guardan si algún país las tiene
+            if any('latitud' in pais for pais in paises):
+                columnas += COLUMNAS_COORDENADAS
+            # Columnas adicionales, en el orden en que aparecen
+            claves = {}
+            for pais in paises:
+                claves.update(dict.fromkeys(pais))
+            columnas += filter(es_columna_adicional, claves)
+            # Las claves que no son columnas (las derivadas) se ignoran y las
+            # columnas que le faltan a un país quedan vacías
+            escritor_csv = csv.DictWriter(archivo, fieldnames=columnas, restval='',
+                                          extrasaction='ignore')
             
             # Escribir el encabezado
             escritor_csv.writeheader()
             
             # Escribir cada país
-            for pais in paises:
-                escritor_csv.writerow({
-                    'nombre': pais['nombre'],
-                    'poblacion': pais['poblacion'],
-                    'superficie': pais['superficie'],
-                    'continente': pais['continente']
-                })
+            escritor_csv.writerows(paises)
         
         return True
         
@@ -0,0 +1,111 @@
+"""
+Módulo de Columnas Derivadas
+============================
+Este módulo agrega a cada país columnas calculadas a partir de sus datos:
+
+- 'densidad': habitantes por km²
+- 'porcentaje_poblacion': porcentaje de la población total del conjunto
+
+Las columnas se calculan una sola vez para toda la lista al cargar los
+datos y se guardan en cada país, de modo que ordenar, filtrar o buscar por
+ellas no requiere recalcularlas. Al modificar un país solo se recalculan su
+densidad y su porcentaje. Si cambia la población total, los porcentajes de
+los demás países quedan desactualizados hasta llamar a refrescar_porcentajes,
+que los recalcula en una sola pasada: varias modificaciones seguidas (por
+ejemplo una recarga en caliente) cuestan O(1) cada una más una única pasada.
+"""
+
+from typing import List, Dict, Any
+
+# Columnas que se agregan a cada país
+COLUMNAS_DERIVADAS = ('densidad', 'porcentaje_poblacion')
+
+
+def _calcular_densidad(pais: Dict[str, Any]) -> float:
+    """Habitantes por km² de un país."""
+    return pais['poblacion'] / pais['superficie'] if pais['superficie'] else 0.0
+
+
+def _recalcular_porcentajes(paises: List[Dict[str, Any]], poblacion_total: int):
+    """Recalcula el porcentaje de población de todos los países."""
+    factor = 100 / poblacion_total if poblacion_total else 0.0
+    for pais in paises:
+        pais['porcentaje_poblacion'] = pais['poblacion'] * factor
+
+
+def crear_columnas_derivadas(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Calcula las columnas derivadas de todos los países.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países (se modifica en su lugar)
+
+    Returns:
+        Dict[str, Any]: Estado con la población total usada para los porcentajes
+            y si los porcentajes guardados están al día
+    """
+    poblacion_total = 0
+    for pais in paises:
+        pais['densidad'] = _calcular_densidad(pais)
+        poblacion_total += pais['poblacion']
+    _recalcular_porcentajes(paises, poblacion_total)
+    return {'poblacion_total': poblacion_total, 'porcentajes_vigentes': True}
+
+
+def actualizar_columnas_derivadas(derivadas: Dict[str, Any], paises: List[Dict[str, Any]],
+                                  pais: Dict[str, Any], poblacion_anterior: int = 0):
+    """
+    Recalcula las columnas derivadas luego de agregar o modificar un país.
+
+    Si la población total cambia, los porcentajes de los demás países quedan
+    desactualizados (ver refrescar_porcentajes).
+
+    Args:
+        derivadas (Dict[str, Any]): Estado creado con crear_columnas_derivadas
+        paises (List[Dict[str, Any]]): Lista completa de países
+        pais (Dict[str, Any]): País agregado o ya modificado
+        poblacion_anterior (int): Población antes del cambio (0 si es nuevo)
+    """
+    pais['densidad'] = _calcular_densidad(pais)
+    diferencia = pais['poblacion'] - poblacion_anterior
+    if diferencia:
+        derivadas['poblacion_total'] += diferencia
+        derivadas['porcentajes_vigentes'] = False
+    factor = 100 / derivadas['poblacion_total'] if derivadas['poblacion_total'] else 0.0
+    pais['porcentaje_poblacion'] = pais['poblacion'] * factor
+
+
+def quitar_de_columnas_derivadas(derivadas: Dict[str, Any], paises: List[Dict[str, Any]],
+                                 quitados: List[Dict[str, Any]]):
+    """
+    Actualiza la población total luego de quitar países de la lista.
+
+    Los porcentajes de los países restantes quedan desactualizados (ver
+    refrescar_porcentajes).
+
+    Args:
+        derivadas (Dict[str, Any]): Estado creado con crear_columnas_derivadas
+        paises (List[Dict[str, Any]]): Lista de países, ya sin los quitados
+        quitados (List[Dict[str, Any]]): Países quitados
+    """
+    diferencia = sum(pais['poblacion'] for pais in quitados)
+    if diferencia:
+        derivadas['poblacion_total'] -= diferencia
+        derivadas['porcentajes_vigentes'] = False
+
+
+def refrescar_porcentajes(derivadas: Dict[str, Any], paises: List[Dict[str, Any]]):
+    """
+    Recalcula los porcentajes de población si cambió la población total.
+
+    Debe llamarse antes de leer 'porcentaje_poblacion' de países que no
+    fueron los últimos modificados. Si los porcentajes están al día no hace
+    nada (O(1)).
+
+    Args:
+        derivadas (Dict[str, Any]): Estado creado con crear_columnas_derivadas
+        paises (List[Dict[str, Any]]): Lista completa de países
+    """
+    if not derivadas['porcentajes_vigentes']:
+        _recalcular_porcentajes(paises, derivadas['poblacion_total'])
+        derivadas['porcentajes_vigentes'] = True
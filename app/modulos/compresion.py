@@ -0,0 +1,331 @@
+"""
+Módulo de Almacenamiento Comprimido
+===================================
+Este módulo guarda conjuntos muy grandes de países en una tabla compacta de
+solo lectura, en lugar de un diccionario con objetos de Python por país:
+
+- Los nombres se concatenan en un único buffer UTF-8 y un array de
+  desplazamientos indica dónde empieza cada uno.
+- Los continentes se guardan una sola vez y cada fila tiene su código.
+- La población y la superficie se empaquetan como varints (7 bits por byte),
+  con la posición en bytes de cada bloque de INTERVALO_ACCESO filas para
+  poder leer una fila sin recorrer toda la columna.
+- Las coordenadas van en arrays de dobles (NaN si el país no tiene).
+
+Las filas se decodifican recién cuando se leen: PaisesComprimidos se
+comporta como una lista de países de solo lectura, y cada país es un
+PaisComprimido que decodifica cada campo al pedirlo. Por eso puede pasarse
+a mostrar_pais, mostrar_lista_paises o Consulta sin descomprimir la tabla.
+
+La contracara es la latencia: leer un campo numérico decodifica hasta
+INTERVALO_ACCESO varints, y cada acceso crea un objeto nuevo. Para
+recorridos completos conviene descomprimir_filas, que decodifica en orden.
+Las columnas adicionales del CSV se guardan sin comprimir, una lista por
+columna.
+"""
+
+import math
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
+
+# Cada cuántas filas se guarda la posición en bytes de las columnas varint
+INTERVALO_ACCESO = 32
+
+# Columnas numéricas que se empaquetan como varints
+COLUMNAS_VARINT = ('poblacion', 'superficie')
+
+# Columnas con las coordenadas (arrays de dobles)
+COLUMNAS_COORDENADAS = ('latitud', 'longitud')
+
+# Columnas que la tabla guarda comprimidas (las derivadas se descartan); las
+# demás se guardan como columnas adicionales
+_COLUMNAS_PROPIAS = frozenset(('nombre', 'continente', 'densidad', 'porcentaje_poblacion')
+                              + COLUMNAS_VARINT + COLUMNAS_COORDENADAS)
+
+
+def _agregar_varint(datos: bytearray, valor: int):
+    """Agrega un entero en zigzag + varint (los negativos también ocupan pocos bytes)."""
+    valor = valor << 1 if valor >= 0 else (-valor << 1) - 1
+    while valor >= 0x80:
+        datos.append(valor & 0x7F | 0x80)
+        valor >>= 7
+    datos.append(valor)
+
+
+def _leer_varint(datos: bytes, posicion: int):
+    """Lee un entero desde una posición; devuelve el valor y la posición siguiente."""
+    resultado = 0
+    desplazamiento = 0
+    while True:
+        byte = datos[posicion]
+        posicion += 1
+        resultado |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            break
+        desplazamiento += 7
+    return (resultado >> 1) if not resultado & 1 else -((resultado + 1) >> 1), posicion
+
+
+def _crear_columna_varint() -> Dict[str, Any]:
+    """Columna varint vacía."""
+    return {'datos': bytearray(), 'bloques': array('Q')}
+
+
+def crear_tabla_comprimida(paises: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Crea una tabla comprimida a partir de una secuencia de países.
+
+    Los países se recorren una sola vez, por lo que pueden venir de un
+    generador (por ejemplo iterar_paises_csv) sin cargar la lista completa.
+
+    Args:
+        paises (Iterable[Dict[str, Any]]): Países a guardar
+
+    Returns:
+        Dict[str, Any]: Tabla con la cantidad de filas y cada columna comprimida
+    """
+    nombres = bytearray()
+    desplazamientos = array('Q', [0])
+    continentes: List[str] = []
+    codigos_continente: Dict[str, int] = {}
+    codigos = array('H')
+    numericas = {columna: _crear_columna_varint() for columna in COLUMNAS_VARINT}
+    coordenadas: Optional[Dict[str, array]] = None
+    adicionales: Dict[str, List[Any]] = {}
+
+    cantidad = 0
+    for pais in paises:
+        nombres += pais['nombre'].encode('utf-8')
+        desplazamientos.append(len(nombres))
+
+        codigo = codigos_continente.get(pais['continente'])
+        if codigo is None:
+            codigo = codigos_continente[pais['continente']] = len(continentes)
+            continentes.append(pais['continente'])
+        codigos.append(codigo)
+
+        for columna, destino in numericas.items():
+            if cantidad % INTERVALO_ACCESO == 0:
+                destino['bloques'].append(len(destino['datos']))
+            _agregar_varint(destino['datos'], pais[columna])
+
+        if coordenadas is None and pais.get('latitud') is not None:
+            # Primeras coordenadas: las filas anteriores no tenían
+            coordenadas = {columna: array('d', [math.nan]) * cantidad for columna in COLUMNAS_COORDENADAS}
+        if coordenadas is not None:
+            for columna, valores in coordenadas.items():
+                valor = pais.get(columna)
+                valores.append(math.nan if valor is None else valor)
+
+        for columna, valor in pais.items():
+            if columna in _COLUMNAS_PROPIAS:
+                continue
+            valores = adicionales.get(columna)
+            if valores is None:
+                valores = adicionales[columna] = [None] * cantidad
+            valores.append(valor)
+        cantidad += 1
+        for valores in adicionales.values():
+            if len(valores) < cantidad:
+                valores.append(None)
+
+    return {
+        'cantidad': cantidad,
+        'nombres': bytes(nombres),
+        'desplazamientos': desplazamientos,
+        'continentes': continentes,
+        'codigos_continente': codigos,
+        'numericas': {columna: {'datos': bytes(columna_varint['datos']),
+                                'bloques': columna_varint['bloques']}
+                      for columna, columna_varint in numericas.items()},
+        'coordenadas': coordenadas,
+        'adicionales': adicionales,
+    }
+
+
+def _ubicar_fila(columna: Dict[str, Any], posicion: int) -> int:
+    """Posición en bytes del valor de una fila en una columna varint."""
+    bloque, salto = divmod(posicion, INTERVALO_ACCESO)
+    datos = columna['datos']
+    inicio = columna['bloques'][bloque]
+    # Saltear los varints anteriores del bloque: cada uno termina en un byte < 0x80
+    while salto:
+        if datos[inicio] < 0x80:
+            salto -= 1
+        inicio += 1
+    return inicio
+
+
+def _leer_numerica(columna: Dict[str, Any], posicion: int) -> int:
+    """Lee el valor de una fila en una columna varint."""
+    return _leer_varint(columna['datos'], _ubicar_fila(columna, posicion))[0]
+
+
+def obtener_campo(tabla: Dict[str, Any], posicion: int, campo: str) -> Any:
+    """
+    Decodifica un campo de una fila de la tabla.
+
+    Args:
+        tabla (Dict[str, Any]): Tabla creada con crear_tabla_comprimida
+        posicion (int): Número de fila (desde 0)
+        campo (str): Nombre del campo
+
+    Returns:
+        Any: Valor del campo
+
+    Raises:
+        KeyError: Si la fila no tiene ese campo
+    """
+    if campo == 'nombre':
+        desplazamientos = tabla['desplazamientos']
+        return tabla['nombres'][desplazamientos[posicion]:desplazamientos[posicion + 1]].decode('utf-8')
+    if campo == 'continente':
+        return tabla['continentes'][tabla['codigos_continente'][posicion]]
+    if campo in COLUMNAS_VARINT:
+        return _leer_numerica(tabla['numericas'][campo], posicion)
+    if campo in COLUMNAS_COORDENADAS:
+        if tabla['coordenadas'] is not None:
+            valor = tabla['coordenadas'][campo][posicion]
+            if not math.isnan(valor):
+                return valor
+    elif campo in tabla['adicionales']:
+        valor = tabla['adicionales'][campo][posicion]
+        if valor is not None:
+            return valor
+    raise KeyError(campo)
+
+
+def _campos_fila(tabla: Dict[str, Any], posicion: int) -> List[str]:
+    """Campos que tiene una fila, en el orden de los países originales."""
+    campos = ['nombre', 'poblacion', 'superficie', 'continente']
+    if tabla['coordenadas'] is not None and not math.isnan(tabla['coordenadas']['latitud'][posicion]):
+        campos += COLUMNAS_COORDENADAS
+    campos += [columna for columna, valores in tabla['adicionales'].items()
+               if valores[posicion] is not None]
+    return campos
+
+
+def descomprimir_filas(tabla: Dict[str, Any], inicio: int = 0,
+                       fin: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre las filas de la tabla como diccionarios, decodificando en orden.
+
+    Es mucho más rápido que leer las filas una por una, porque cada columna
+    varint se decodifica de corrido.
+
+    Args:
+        tabla (Dict[str, Any]): Tabla creada con crear_tabla_comprimida
+        inicio (int): Primera fila
+        fin (int, optional): Fila siguiente a la última (por defecto, todas)
+
+    Yields:
+        Dict[str, Any]: Cada país
+    """
+    fin = tabla['cantidad'] if fin is None else min(fin, tabla['cantidad'])
+    if inicio >= fin:
+        return
+
+    nombres = tabla['nombres']
+    desplazamientos = tabla['desplazamientos']
+    continentes = tabla['continentes']
+    codigos = tabla['codigos_continente']
+    coordenadas = tabla['coordenadas']
+    adicionales = tabla['adicionales'].items()
+
+    datos_poblacion = tabla['numericas']['poblacion']['datos']
+    datos_superficie = tabla['numericas']['superficie']['datos']
+    cursor_poblacion = _ubicar_fila(tabla['numericas']['poblacion'], inicio)
+    cursor_superficie = _ubicar_fila(tabla['numericas']['superficie'], inicio)
+
+    for fila in range(inicio, fin):
+        poblacion, cursor_poblacion = _leer_varint(datos_poblacion, cursor_poblacion)
+        superficie, cursor_superficie = _leer_varint(datos_superficie, cursor_superficie)
+        pais = {
+            'nombre': nombres[desplazamientos[fila]:desplazamientos[fila + 1]].decode('utf-8'),
+            'poblacion': poblacion,
+            'superficie': superficie,
+            'continente': continentes[codigos[fila]],
+        }
+        if coordenadas is not None and not math.isnan(coordenadas['latitud'][fila]):
+            pais['latitud'] = coordenadas['latitud'][fila]
+            pais['longitud'] = coordenadas['longitud'][fila]
+        for columna, valores in adicionales:
+            if valores[fila] is not None:
+                pais[columna] = valores[fila]
+        yield pais
+
+
+def memoria_tabla(tabla: Dict[str, Any]) -> int:
+    """
+    Calcula los bytes que ocupan los datos de la tabla.
+
+    Cuenta los buffers y arrays comprimidos y los continentes; las columnas
+    adicionales se cuentan solo por sus listas (sin sus valores).
+    """
+    total = len(tabla['nombres']) + tabla['desplazamientos'].itemsize * len(tabla['desplazamientos'])
+    total += tabla['codigos_continente'].itemsize * len(tabla['codigos_continente'])
+    total += sum(len(continente.encode('utf-8')) for continente in tabla['continentes'])
+    for columna in tabla['numericas'].values():
+        total += len(columna['datos']) + columna['bloques'].itemsize * len(columna['bloques'])
+    if tabla['coordenadas'] is not None:
+        total += sum(valores.itemsize * len(valores) for valores in tabla['coordenadas'].values())
+    total += sum(8 * len(valores) for valores in tabla['adicionales'].values())
+    return total
+
+
+class PaisComprimido(Mapping):
+    """País de una tabla comprimida; cada campo se decodifica al pedirlo."""
+
+    __slots__ = ('_tabla', '_posicion')
+
+    def __init__(self, tabla: Dict[str, Any], posicion: int):
+        self._tabla = tabla
+        self._posicion = posicion
+
+    def __getitem__(self, campo: str) -> Any:
+        return obtener_campo(self._tabla, self._posicion, campo)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_campos_fila(self._tabla, self._posicion))
+
+    def __len__(self) -> int:
+        return len(_campos_fila(self._tabla, self._posicion))
+
+    def __repr__(self) -> str:
+        return f"PaisComprimido({dict(self)!r})"
+
+
+class PaisesComprimidos(Sequence):
+    """Lista de países de solo lectura respaldada por una tabla comprimida."""
+
+    def __init__(self, paises: Union[Iterable[Dict[str, Any]], Dict[str, Any]]):
+        """
+        Args:
+            paises: Países a comprimir, o una tabla ya creada con
+                crear_tabla_comprimida
+        """
+        if isinstance(paises, dict) and 'numericas' in paises:
+            self.tabla = paises
+        else:
+            self.tabla = crear_tabla_comprimida(paises)
+
+    def __len__(self) -> int:
+        return self.tabla['cantidad']
+
+    def __getitem__(self, posicion):
+        if isinstance(posicion, slice):
+            return [PaisComprimido(self.tabla, i) for i in range(*posicion.indices(len(self)))]
+        if posicion < 0:
+            posicion += len(self)
+        if not 0 <= posicion < len(self):
+            raise IndexError("Posición fuera de rango")
+        return PaisComprimido(self.tabla, posicion)
+
+    def __iter__(self) -> Iterator[PaisComprimido]:
+        tabla = self.tabla
+        return (PaisComprimido(tabla, posicion) for posicion in range(tabla['cantidad']))
+
+    def descomprimir(self) -> List[Dict[str, Any]]:
+        """Devuelve todos los países como una lista de diccionarios."""
+        return list(descomprimir_filas(self.tabla))
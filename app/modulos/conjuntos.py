@@ -0,0 +1,215 @@
+"""
+Módulo de Conjuntos de Datos
+============================
+Este módulo permite tener varios conjuntos de países cargados a la vez, por
+ejemplo variantes regionales o cortes de distintos años, identificados por
+un nombre:
+
+    coleccion = crear_coleccion()
+    cargar_conjunto(coleccion, '2023', 'data/paises_2023.csv')
+    cargar_conjunto(coleccion, '2024', 'data/paises_2024.csv')
+    cambios = diferencia_conjuntos(coleccion, '2023', '2024')
+
+Todos los conjuntos de una colección comparten un repositorio de cadenas:
+cada nombre y continente distinto se guarda una sola vez aunque aparezca en
+todos los conjuntos, y su forma normalizada se calcula también una sola vez.
+
+Las consultas entre conjuntos (diferencia y unión por nombre) se resuelven
+como uniones por hash: se arma un diccionario por nombre normalizado con
+uno de los conjuntos y se recorre el otro una única vez.
+"""
+
+from typing import List, Dict, Any, Tuple
+from .validacion import normalizar_texto_busqueda
+from .almacenamiento import cargar_datos_con_reporte
+
+# Campos que se comparan al buscar diferencias entre conjuntos
+CAMPOS_COMPARADOS = ('poblacion', 'superficie', 'continente')
+
+
+def crear_coleccion() -> Dict[str, Any]:
+    """
+    Crea una colección vacía de conjuntos de datos.
+
+    Returns:
+        Dict[str, Any]: Colección con los conjuntos por nombre, el repositorio
+            de cadenas y la forma normalizada de cada nombre
+    """
+    return {'conjuntos': {}, 'cadenas': {}, 'normalizados': {}}
+
+
+def _internar(coleccion: Dict[str, Any], texto: str) -> str:
+    """Devuelve la instancia compartida de un texto."""
+    return coleccion['cadenas'].setdefault(texto, texto)
+
+
+def _nombre_normalizado(coleccion: Dict[str, Any], nombre: str) -> str:
+    """Forma normalizada de un nombre, calculada una sola vez por colección."""
+    normalizados = coleccion['normalizados']
+    normalizado = normalizados.get(nombre)
+    if normalizado is None:
+        normalizado = normalizados[nombre] = _internar(coleccion, normalizar_texto_busqueda(nombre))
+    return normalizado
+
+
+def agregar_conjunto(coleccion: Dict[str, Any], nombre_conjunto: str,
+                     paises: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Agrega a la colección una lista de países ya cargada.
+
+    Los nombres y continentes de los países se reemplazan por las instancias
+    del repositorio compartido (la lista se modifica en su lugar).
+
+    Args:
+        coleccion (Dict[str, Any]): Colección creada con crear_coleccion
+        nombre_conjunto (str): Nombre con el que se identifica el conjunto
+        paises (List[Dict[str, Any]]): Lista de países
+
+    Returns:
+        List[Dict[str, Any]]: La misma lista de países
+    """
+    for pais in paises:
+        pais['nombre'] = _internar(coleccion, pais['nombre'])
+        pais['continente'] = _internar(coleccion, pais['continente'])
+    coleccion['conjuntos'][nombre_conjunto] = paises
+    return paises
+
+
+def cargar_conjunto(coleccion: Dict[str, Any], nombre_conjunto: str, ruta_archivo: str,
+                    omitir_verificacion: bool = False) -> Dict[str, Any]:
+    """
+    Carga un archivo de datos (CSV o SQLite) como un conjunto de la colección.
+
+    Args:
+        coleccion (Dict[str, Any]): Colección creada con crear_coleccion
+        nombre_conjunto (str): Nombre con el que se identifica el conjunto
+        ruta_archivo (str): Ruta al archivo de datos
+        omitir_verificacion (bool): Si debe confiar en un CSV ya verificado
+
+    Returns:
+        Dict[str, Any]: Reporte de integridad de la carga
+
+    Raises:
+        ValueError: Si los datos no pasan la verificación de integridad
+    """
+    paises, reporte = cargar_datos_con_reporte(ruta_archivo, omitir_verificacion)
+    if not reporte['valido']:
+        raise ValueError(f"Los datos de '{ruta_archivo}' no pasaron la verificación de integridad")
+    agregar_conjunto(coleccion, nombre_conjunto, paises)
+    return reporte
+
+
+def obtener_conjunto(coleccion: Dict[str, Any], nombre_conjunto: str) -> List[Dict[str, Any]]:
+    """
+    Obtiene la lista de países de un conjunto.
+
+    Raises:
+        KeyError: Si el conjunto no existe
+    """
+    if nombre_conjunto not in coleccion['conjuntos']:
+        raise KeyError(f"No existe el conjunto '{nombre_conjunto}'")
+    return coleccion['conjuntos'][nombre_conjunto]
+
+
+def quitar_conjunto(coleccion: Dict[str, Any], nombre_conjunto: str) -> bool:
+    """
+    Quita un conjunto de la colección.
+
+    Las cadenas del repositorio se conservan, ya que pueden seguir en uso
+    por otros conjuntos.
+
+    Returns:
+        bool: True si el conjunto existía
+    """
+    return coleccion['conjuntos'].pop(nombre_conjunto, None) is not None
+
+
+def _indexar_por_nombre(coleccion: Dict[str, Any],
+                        paises: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Tabla hash de un conjunto por nombre normalizado (gana el primero)."""
+    tabla = {}
+    for pais in paises:
+        tabla.setdefault(_nombre_normalizado(coleccion, pais['nombre']), pais)
+    return tabla
+
+
+def _agrupar_por_nombre(coleccion: Dict[str, Any],
+                        paises: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Tabla hash de un conjunto con todos los países de cada nombre normalizado."""
+    tabla = {}
+    for pais in paises:
+        tabla.setdefault(_nombre_normalizado(coleccion, pais['nombre']), []).append(pais)
+    return tabla
+
+
+def unir_conjuntos(coleccion: Dict[str, Any], conjunto_a: str,
+                   conjunto_b: str) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Une dos conjuntos por nombre de país.
+
+    La tabla hash se arma con el conjunto más chico y se recorre el otro.
+
+    Args:
+        coleccion (Dict[str, Any]): Colección de conjuntos
+        conjunto_a (str): Nombre del primer conjunto
+        conjunto_b (str): Nombre del segundo conjunto
+
+    Returns:
+        List[Tuple[Dict[str, Any], Dict[str, Any]]]: Pares (país de A, país de B)
+            con el mismo nombre, en el orden de A y luego de B
+    """
+    paises_a = obtener_conjunto(coleccion, conjunto_a)
+    paises_b = obtener_conjunto(coleccion, conjunto_b)
+
+    if len(paises_b) <= len(paises_a):
+        tabla = _agrupar_por_nombre(coleccion, paises_b)
+        return [(pais, pareja) for pais in paises_a
+                for pareja in tabla.get(_nombre_normalizado(coleccion, pais['nombre']), ())]
+
+    # A es el más chico: se indexa A y el orden de A se recupera al final
+    # (el ordenamiento es estable, así que se mantiene el orden de B)
+    tabla = _agrupar_por_nombre(coleccion, paises_a)
+    pares = [(pareja, pais) for pais in paises_b
+             for pareja in tabla.get(_nombre_normalizado(coleccion, pais['nombre']), ())]
+    posiciones = {id(pais): posicion for posicion, pais in enumerate(paises_a)}
+    pares.sort(key=lambda par: posiciones[id(par[0])])
+    return pares
+
+
+def diferencia_conjuntos(coleccion: Dict[str, Any], conjunto_a: str,
+                         conjunto_b: str) -> Dict[str, Any]:
+    """
+    Compara dos conjuntos por nombre de país.
+
+    Si un nombre se repite en B, se compara con su primera aparición.
+
+    Args:
+        coleccion (Dict[str, Any]): Colección de conjuntos
+        conjunto_a (str): Nombre del conjunto de referencia
+        conjunto_b (str): Nombre del conjunto comparado
+
+    Returns:
+        Dict[str, Any]: 'solo_a' y 'solo_b' (países presentes en un solo
+            conjunto) y 'modificados' (tuplas (país de A, país de B, campos
+            que cambiaron))
+    """
+    paises_a = obtener_conjunto(coleccion, conjunto_a)
+    tabla_b = _indexar_por_nombre(coleccion, obtener_conjunto(coleccion, conjunto_b))
+
+    solo_a = []
+    modificados = []
+    emparejados = set()
+    for pais in paises_a:
+        nombre = _nombre_normalizado(coleccion, pais['nombre'])
+        pareja = tabla_b.get(nombre)
+        if pareja is None:
+            solo_a.append(pais)
+            continue
+        emparejados.add(nombre)
+        campos = [campo for campo in CAMPOS_COMPARADOS if pais[campo] != pareja[campo]]
+        if campos:
+            modificados.append((pais, pareja, campos))
+
+    solo_b = [pais for nombre, pais in tabla_b.items() if nombre not in emparejados]
+
+    return {'solo_a': solo_a, 'solo_b': solo_b, 'modificados': modificados}
@@ -0,0 +1,216 @@
+"""
+Módulo Constructor de Consultas
+===============================
+Este módulo permite armar consultas sobre la lista de países encadenando
+criterios, por ejemplo:
+
+    Consulta(paises).continente('América').poblacion(minimo=1000000) \\
+        .ordenar('superficie', descendente=True).limite(10).a_lista()
+
+La consulta no se ejecuta hasta que se recorre: todos los criterios se
+evalúan juntos en una única pasada, sin listas intermedias, y el recorrido
+se corta apenas se alcanza el límite.
+
+Si se recibe un índice bitmap construido sobre la misma lista, se usa como
+camino de acceso: los criterios de continente, población, superficie y
+nombre se resuelven con el índice y el resto se evalúa solo sobre los
+países que devuelve.
+"""
+
+import heapq
+from itertools import islice
+from typing import List, Dict, Any, Optional, Callable, Iterator, Set
+from .validacion import normalizar_texto_busqueda
+from .bitmaps import consultar_indice_bitmap
+from .ordenamiento import obtener_clave_ordenamiento
+from .geografia import distancia_a_pais, esta_en_rectangulo
+
+
+class Consulta:
+    """Consulta perezosa y encadenable sobre una lista de países."""
+
+    def __init__(self, paises: List[Dict[str, Any]], indice_bitmap: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            paises (List[Dict[str, Any]]): Lista de países a consultar
+            indice_bitmap (Dict[str, Any], optional): Índice creado con
+                crear_indice_bitmap sobre la misma lista
+        """
+        self._paises = paises
+        self._indice = indice_bitmap
+        self._predicados: List[Callable[[Dict[str, Any]], bool]] = []
+        # Criterios que puede resolver el índice y predicados a los que reemplazan
+        self._criterios_indice: Dict[str, Any] = {}
+        self._resueltos_por_indice: Set[Callable[[Dict[str, Any]], bool]] = set()
+        self._orden: Optional[tuple] = None
+        self._limite: Optional[int] = None
+
+    def _derivar(self) -> 'Consulta':
+        """Crea una copia de la consulta para que cada paso sea reutilizable."""
+        nueva = Consulta(self._paises, self._indice)
+        nueva._predicados = list(self._predicados)
+        nueva._criterios_indice = dict(self._criterios_indice)
+        nueva._resueltos_por_indice = set(self._resueltos_por_indice)
+        nueva._orden = self._orden
+        nueva._limite = self._limite
+        return nueva
+
+    def _donde_indexable(self, predicado: Callable[[Dict[str, Any]], bool],
+                         criterios: Dict[str, Any]) -> 'Consulta':
+        """
+        Agrega un criterio que el índice bitmap también puede resolver.
+
+        Si el mismo criterio ya se había indicado, el nuevo queda solo como
+        predicado, para que se cumplan ambos.
+        """
+        nueva = self.donde(predicado)
+        if not criterios.keys() & nueva._criterios_indice.keys():
+            nueva._criterios_indice.update(criterios)
+            nueva._resueltos_por_indice.add(predicado)
+        return nueva
+
+    def donde(self, predicado: Callable[[Dict[str, Any]], bool]) -> 'Consulta':
+        """
+        Agrega un criterio arbitrario.
+
+        Args:
+            predicado (Callable): Función que recibe un país y devuelve True
+                si debe incluirse en el resultado
+        """
+        nueva = self._derivar()
+        nueva._predicados.append(predicado)
+        return nueva
+
+    def continente(self, continente: str) -> 'Consulta':
+        """Filtra por continente (sin importar acentos ni mayúsculas)."""
+        buscado = normalizar_texto_busqueda(continente)
+        return self._donde_indexable(
+            lambda pais: normalizar_texto_busqueda(pais['continente']) == buscado,
+            {'continente': continente})
+
+    def nombre_contiene(self, texto: str) -> 'Consulta':
+        """Filtra los países cuyo nombre contiene un texto."""
+        buscado = normalizar_texto_busqueda(texto)
+        return self._donde_indexable(
+            lambda pais: buscado in normalizar_texto_busqueda(pais['nombre']),
+            {'nombre_contiene': texto})
+
+    def rango(self, campo: str, minimo: Optional[float] = None,
+              maximo: Optional[float] = None) -> 'Consulta':
+        """
+        Filtra por un rango de valores de un campo numérico (límites incluidos).
+
+        Args:
+            campo (str): Campo numérico a filtrar
+            minimo (float, optional): Valor mínimo
+            maximo (float, optional): Valor máximo
+        """
+        if minimo is None and maximo is None:
+            return self._derivar()
+        if minimo is None:
+            predicado = lambda pais: pais[campo] <= maximo
+        elif maximo is None:
+            predicado = lambda pais: pais[campo] >= minimo
+        else:
+            predicado = lambda pais: minimo <= pais[campo] <= maximo
+        if campo in ('poblacion', 'superficie'):
+            return self._donde_indexable(predicado, {f'{campo}_min': minimo, f'{campo}_max': maximo})
+        return self.donde(predicado)
+
+    def poblacion(self, minimo: Optional[int] = None, maximo: Optional[int] = None) -> 'Consulta':
+        """Filtra por rango de población."""
+        return self.rango('poblacion', minimo, maximo)
+
+    def superficie(self, minimo: Optional[int] = None, maximo: Optional[int] = None) -> 'Consulta':
+        """Filtra por rango de superficie."""
+        return self.rango('superficie', minimo, maximo)
+
+    def densidad(self, minimo: Optional[float] = None, maximo: Optional[float] = None) -> 'Consulta':
+        """Filtra por rango de densidad (requiere las columnas derivadas)."""
+        return self.rango('densidad', minimo, maximo)
+
+    def porcentaje_poblacion(self, minimo: Optional[float] = None,
+                             maximo: Optional[float] = None) -> 'Consulta':
+        """Filtra por rango de porcentaje de la población total (requiere las columnas derivadas)."""
+        return self.rango('porcentaje_poblacion', minimo, maximo)
+
+    def cerca_de(self, latitud: float, longitud: float, radio_km: float) -> 'Consulta':
+        """
+        Filtra los países a una distancia máxima de un punto (requiere coordenadas).
+
+        Args:
+            latitud (float): Latitud del punto (grados)
+            longitud (float): Longitud del punto (grados)
+            radio_km (float): Distancia máxima en kilómetros (incluida)
+        """
+        def dentro_del_radio(pais: Dict[str, Any]) -> bool:
+            distancia = distancia_a_pais(pais, latitud, longitud)
+            return distancia is not None and distancia <= radio_km
+        return self.donde(dentro_del_radio)
+
+    def dentro_de(self, latitud_min: float, latitud_max: float,
+                  longitud_min: float, longitud_max: float) -> 'Consulta':
+        """Filtra los países dentro de un rectángulo de latitudes y longitudes (requiere coordenadas)."""
+        return self.donde(lambda pais: esta_en_rectangulo(pais, latitud_min, latitud_max,
+                                                          longitud_min, longitud_max))
+
+    def ordenar(self, criterio: str, descendente: bool = False) -> 'Consulta':
+        """
+        Ordena el resultado por un criterio.
+
+        Args:
+            criterio (str): Criterio de ordenamiento ('nombre', 'poblacion', 'superficie')
+            descendente (bool): Si debe ordenar de forma descendente
+        """
+        nueva = self._derivar()
+        nueva._orden = (criterio, descendente)
+        return nueva
+
+    def limite(self, cantidad: int) -> 'Consulta':
+        """Limita la cantidad de resultados."""
+        nueva = self._derivar()
+        nueva._limite = max(0, cantidad)
+        return nueva
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Ejecuta la consulta y recorre los países resultantes."""
+        predicados = self._predicados
+        paises = self._paises
+        if self._indice is not None and self._criterios_indice:
+            # El índice da los países que cumplen sus criterios; el resto se evalúa sobre ellos
+            paises = consultar_indice_bitmap(self._indice, **self._criterios_indice)
+            predicados = [p for p in predicados if p not in self._resueltos_por_indice]
+
+        if not predicados:
+            candidatos = iter(paises)
+        elif len(predicados) == 1:
+            candidatos = filter(predicados[0], paises)
+        else:
+            candidatos = (p for p in paises if all(predicado(p) for predicado in predicados))
+
+        if self._orden is None:
+            if self._limite is None:
+                return candidatos
+            return islice(candidatos, self._limite)
+
+        criterio, descendente = self._orden
+        clave = obtener_clave_ordenamiento(criterio)
+        if self._limite is None:
+            return iter(sorted(candidatos, key=clave, reverse=descendente))
+
+        # Con límite solo se conservan los mejores candidatos en un heap
+        if descendente:
+            return iter(heapq.nlargest(self._limite, candidatos, key=clave))
+        return iter(heapq.nsmallest(self._limite, candidatos, key=clave))
+
+    def a_lista(self) -> List[Dict[str, Any]]:
+        """Ejecuta la consulta y devuelve los resultados en una lista."""
+        return list(self)
+
+    def primero(self) -> Optional[Dict[str, Any]]:
+        """Devuelve el primer resultado o None si no hay resultados."""
+        return next(iter(self.limite(1)), None)
+
+    def contar(self) -> int:
+        """Cuenta los resultados sin construir una lista."""
+        return sum(1 for _ in self)
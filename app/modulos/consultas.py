@@ -5,7 +5,7 @@ Este módulo contiene funciones para buscar y filtrar países
 según diferentes criterios.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from .validacion import normalizar_texto_busqueda
 
 
@@ -122,10 +122,24 @@ def buscar_paises_multiples_criterios(paises: List[Dict[str, Any]],
                                      poblacion_max: Optional[int] = None,
                                      superficie_min: Optional[int] = None,
                                      superficie_max: Optional[int] = None,
-                                     nombre_contiene: Optional[str] = None) -> List[Dict[str, Any]]:
+                                     nombre_contiene: Optional[str] = None,
+                                     indice_bitmap: Optional[Dict[str, Any]] = None,
+                                     densidad_min: Optional[float] = None,
+                                     densidad_max: Optional[float] = None,
+                                     cerca_de: Optional[Tuple[float, float, float]] = None,
+                                     rectangulo: Optional[Tuple[float, float, float, float]] = None,
+                                     indice_geografico: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Busca países aplicando múltiples criterios de filtrado.
     
+    Si se recibe un índice bitmap construido sobre la misma lista de países,
+    la consulta lo usa como camino de acceso: continente, población,
+    superficie y nombre se resuelven con operaciones de bits y la densidad
+    se evalúa sobre el resultado. Del
+    mismo modo, los criterios geográficos se resuelven con el árbol k-d si se
+    recibe un índice geográfico; si no, se calcula la distancia de cada país.
+    Los países sin coordenadas nunca cumplen un criterio geográfico.
+    
     Args:
         paises (List[Dict[str, Any]]): Lista de países
         continente (str, optional): Continente a filtrar
@@ -134,33 +148,70 @@ def buscar_paises_multiples_criterios(paises: List[Dict[str, Any]],
         superficie_min (int, optional): Superficie mínima
         superficie_max (int, optional): Superficie máxima
         nombre_contiene (str, optional): Texto que debe contener el nombre
+        indice_bitmap (Dict[str, Any], optional): Índice creado con crear_indice_bitmap
+        densidad_min (float, optional): Densidad mínima (hab/km²)
+        densidad_max (float, optional): Densidad máxima (hab/km²)
+        cerca_de (Tuple[float, float, float], optional): (latitud, longitud,
+            radio en km) alrededor del cual deben estar los países
+        rectangulo (Tuple[float, float, float, float], optional): (latitud
+            mínima, latitud máxima, longitud oeste, longitud este)
+        indice_geografico (Dict[str, Any], optional): Índice creado con
+            crear_indice_geografico
         
     Returns:
         List[Dict[str, Any]]: Lista de países que cumplen todos los criterios
     """
-    resultados = paises.copy()
+    # El constructor de consultas (y con él los bitmaps y la geografía) se
+    # importa recién aquí, para que buscar por nombre no lo cargue
+    from .constructor_consultas import Consulta
+    
+    # Todos los criterios se evalúan juntos en una sola pasada; con el índice
+    # bitmap como camino de acceso, solo sobre los países que este devuelve
+    consulta = Consulta(paises, indice_bitmap)
     
     # Filtrar por continente
     if continente:
-        resultados = filtrar_por_continente(resultados, continente)
+        consulta = consulta.continente(continente)
     
     # Filtrar por rango de población
-    if poblacion_min is not None or poblacion_max is not None:
-        min_pob = poblacion_min if poblacion_min is not None else 0
-        max_pob = poblacion_max if poblacion_max is not None else float('inf')
-        resultados = [p for p in resultados if min_pob <= p['poblacion'] <= max_pob]
+    consulta = consulta.poblacion(poblacion_min, poblacion_max)
     
     # Filtrar por rango de superficie
-    if superficie_min is not None or superficie_max is not None:
-        min_sup = superficie_min if superficie_min is not None else 0
-        max_sup = superficie_max if superficie_max is not None else float('inf')
-        resultados = [p for p in resultados if min_sup <= p['superficie'] <= max_sup]
+    consulta = consulta.superficie(superficie_min, superficie_max)
+    
+    # Filtrar por rango de densidad
+    consulta = consulta.densidad(densidad_min, densidad_max)
     
     # Filtrar por nombre que contenga texto
     if nombre_contiene:
-        resultados = buscar_pais_por_nombre(resultados, nombre_contiene, busqueda_exacta=False)
+        consulta = consulta.nombre_contiene(nombre_contiene)
     
-    return resultados
+    # Filtrar por ubicación
+    consulta = _filtrar_ubicacion(consulta, cerca_de, rectangulo, indice_geografico)
+    
+    return consulta.a_lista()
+
+
+def _filtrar_ubicacion(consulta: 'Consulta',
+                       cerca_de: Optional[Tuple[float, float, float]],
+                       rectangulo: Optional[Tuple[float, float, float, float]],
+                       indice_geografico: Optional[Dict[str, Any]]) -> 'Consulta':
+    """Agrega a una consulta los criterios geográficos, con el árbol k-d si está disponible."""
+    from .geografia import buscar_en_radio, buscar_en_rectangulo
+    if indice_geografico is None:
+        if cerca_de is not None:
+            consulta = consulta.cerca_de(*cerca_de)
+        if rectangulo is not None:
+            consulta = consulta.dentro_de(*rectangulo)
+        return consulta
+
+    if cerca_de is not None:
+        en_radio = {id(pais) for pais, _ in buscar_en_radio(indice_geografico, *cerca_de)}
+        consulta = consulta.donde(lambda pais: id(pais) in en_radio)
+    if rectangulo is not None:
+        en_rectangulo = {id(pais) for pais in buscar_en_rectangulo(indice_geografico, *rectangulo)}
+        consulta = consulta.donde(lambda pais: id(pais) in en_rectangulo)
+    return consulta
 
 
 def obtener_continentes_disponibles(paises: List[Dict[str, Any]]) -> List[str]:
@@ -183,7 +234,8 @@ def buscar_paises_top(paises: List[Dict[str, Any]], criterio: str, cantidad: int
     
     Args:
         paises (List[Dict[str, Any]]): Lista de países
-        criterio (str): Criterio de ordenamiento ('poblacion', 'superficie')
+        criterio (str): Criterio de ordenamiento ('poblacion', 'superficie', 'densidad',
+            'porcentaje_poblacion')
         cantidad (int): Cantidad de países a retornar
         
     Returns:
@@ -204,7 +256,8 @@ def buscar_paises_bottom(paises: List[Dict[str, Any]], criterio: str, cantidad:
     
     Args:
         paises (List[Dict[str, Any]]): Lista de países
-        criterio (str): Criterio de ordenamiento ('poblacion', 'superficie')
+        criterio (str): Criterio de ordenamiento ('poblacion', 'superficie', 'densidad',
+            'porcentaje_poblacion')
         cantidad (int): Cantidad de países a retornar
         
     Returns:
@@ -0,0 +1,245 @@
+"""
+Módulo de Cuantiles
+===================
+Este módulo contiene funciones para calcular percentiles de forma exacta,
+mediante selección rápida (quickselect) sin ordenar toda la lista, y de
+forma aproximada, mediante un sketch KLL que puede alimentarse por partes
+y combinarse con otros sketches.
+
+El sketch KLL es de uso como biblioteca: ninguna opción del menú lo usa,
+porque los datos del sistema siempre están completos en memoria y allí el
+cálculo exacto es O(n). Sirve para quien procese datos por bloques (por
+ejemplo con carga_datos.iterar_paises_csv) sin conservarlos.
+"""
+
+import random
+from typing import List, Dict, Any, Iterable, Optional
+
+
+def seleccionar_posiciones(valores: List[float], posiciones: Iterable[int]) -> Dict[int, float]:
+    """
+    Obtiene los valores que ocuparían ciertas posiciones si la lista estuviera ordenada.
+
+    Usa quickselect con partición en tres partes: cada partición solo se
+    sigue procesando si contiene alguna de las posiciones buscadas, por lo
+    que el costo esperado es O(n) para pocas posiciones.
+
+    Args:
+        valores (List[float]): Valores sin ordenar (no se modifican)
+        posiciones (Iterable[int]): Posiciones buscadas (de 0 a n - 1)
+
+    Returns:
+        Dict[int, float]: Valor correspondiente a cada posición
+    """
+    datos = list(valores)
+    resultado = {}
+    pendientes = [(0, len(datos) - 1, sorted(set(posiciones)))]
+
+    while pendientes:
+        inicio, fin, buscadas = pendientes.pop()
+        if not buscadas:
+            continue
+        if inicio == fin:
+            resultado[inicio] = datos[inicio]
+            continue
+
+        pivote = datos[random.randint(inicio, fin)]
+
+        # Partición: [inicio, menor) < pivote, [menor, mayor] == pivote, (mayor, fin] > pivote
+        menor, actual, mayor = inicio, inicio, fin
+        while actual <= mayor:
+            valor = datos[actual]
+            if valor < pivote:
+                datos[menor], datos[actual] = valor, datos[menor]
+                menor += 1
+                actual += 1
+            elif valor > pivote:
+                datos[mayor], datos[actual] = valor, datos[mayor]
+                mayor -= 1
+            else:
+                actual += 1
+
+        izquierda = [p for p in buscadas if p < menor]
+        derecha = [p for p in buscadas if p > mayor]
+        for posicion in buscadas:
+            if menor <= posicion <= mayor:
+                resultado[posicion] = pivote
+        pendientes.append((inicio, menor - 1, izquierda))
+        pendientes.append((mayor + 1, fin, derecha))
+
+    return resultado
+
+
+def _validar_percentiles(percentiles: Iterable[float]):
+    """
+    Verifica que todos los percentiles estén entre 0 y 100.
+
+    Raises:
+        ValueError: Si algún percentil está fuera de rango
+    """
+    for percentil in percentiles:
+        if not 0 <= percentil <= 100:
+            raise ValueError(f"Percentil fuera de rango (debe estar entre 0 y 100): {percentil}")
+
+
+def calcular_percentiles(valores: List[float], percentiles: List[float],
+                         interpolar: bool = True) -> Dict[float, float]:
+    """
+    Calcula percentiles exactos de una lista de valores.
+
+    Args:
+        valores (List[float]): Valores sin ordenar
+        percentiles (List[float]): Percentiles buscados, entre 0 y 100
+        interpolar (bool): Si debe interpolar linealmente entre las dos
+            posiciones vecinas o tomar la posición inferior
+
+    Returns:
+        Dict[float, float]: Valor de cada percentil solicitado
+
+    Raises:
+        ValueError: Si algún percentil no está entre 0 y 100
+    """
+    _validar_percentiles(percentiles)
+    if not valores:
+        return {}
+
+    n = len(valores)
+    posiciones_reales = {p: p / 100 * (n - 1) for p in percentiles}
+    necesarias = set()
+    for posicion in posiciones_reales.values():
+        necesarias.add(int(posicion))
+        if interpolar:
+            necesarias.add(min(int(posicion) + 1, n - 1))
+
+    seleccion = seleccionar_posiciones(valores, necesarias)
+
+    resultado = {}
+    for percentil, posicion in posiciones_reales.items():
+        inferior = int(posicion)
+        if not interpolar or inferior == n - 1:
+            resultado[percentil] = seleccion[inferior]
+        else:
+            fraccion = posicion - inferior
+            resultado[percentil] = seleccion[inferior] + \
+                (seleccion[inferior + 1] - seleccion[inferior]) * fraccion
+
+    return resultado
+
+
+def crear_sketch_cuantiles(k: int = 200) -> Dict[str, Any]:
+    """
+    Crea un sketch KLL vacío para estimar cuantiles.
+
+    El error de rango esperado es de aproximadamente 1.7 / k y la memoria
+    utilizada no depende de la cantidad de valores agregados.
+
+    Args:
+        k (int): Capacidad del nivel superior del sketch
+
+    Returns:
+        Dict[str, Any]: Sketch vacío
+    """
+    return {'k': k, 'n': 0, 'niveles': [[]]}
+
+
+def _capacidad_nivel(sketch: Dict[str, Any], nivel: int) -> int:
+    """Capacidad de un nivel: decrece geométricamente hacia los niveles inferiores."""
+    profundidad = len(sketch['niveles']) - nivel - 1
+    return max(2, int(sketch['k'] * (2 / 3) ** profundidad))
+
+
+def _compactar(sketch: Dict[str, Any]):
+    """Compacta niveles llenos promoviendo la mitad de sus valores al nivel siguiente."""
+    niveles = sketch['niveles']
+    nivel = 0
+    while nivel < len(niveles):
+        if len(niveles[nivel]) >= _capacidad_nivel(sketch, nivel):
+            if nivel + 1 == len(niveles):
+                niveles.append([])
+            valores = sorted(niveles[nivel])
+            # Un valor sobrante queda en el nivel para no perder peso
+            sobrante = [valores.pop()] if len(valores) % 2 else []
+            desplazamiento = random.getrandbits(1)
+            niveles[nivel + 1].extend(valores[desplazamiento::2])
+            niveles[nivel] = sobrante
+        nivel += 1
+
+
+def agregar_a_sketch(sketch: Dict[str, Any], valores: Iterable[float]):
+    """
+    Agrega valores a un sketch de cuantiles.
+
+    Args:
+        sketch (Dict[str, Any]): Sketch creado con crear_sketch_cuantiles
+        valores (Iterable[float]): Valores a agregar
+    """
+    nivel_base = sketch['niveles'][0]
+    for valor in valores:
+        nivel_base.append(valor)
+        sketch['n'] += 1
+        if len(nivel_base) >= _capacidad_nivel(sketch, 0):
+            _compactar(sketch)
+            nivel_base = sketch['niveles'][0]
+
+
+def combinar_sketches(sketch_a: Dict[str, Any], sketch_b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combina dos sketches en uno nuevo que resume ambos conjuntos de datos.
+
+    Args:
+        sketch_a (Dict[str, Any]): Primer sketch
+        sketch_b (Dict[str, Any]): Segundo sketch
+
+    Returns:
+        Dict[str, Any]: Sketch combinado (los originales no se modifican)
+    """
+    combinado = crear_sketch_cuantiles(max(sketch_a['k'], sketch_b['k']))
+    cantidad_niveles = max(len(sketch_a['niveles']), len(sketch_b['niveles']))
+    combinado['niveles'] = [[] for _ in range(cantidad_niveles)]
+    for sketch in (sketch_a, sketch_b):
+        for nivel, valores in enumerate(sketch['niveles']):
+            combinado['niveles'][nivel].extend(valores)
+    combinado['n'] = sketch_a['n'] + sketch_b['n']
+    _compactar(combinado)
+    return combinado
+
+
+def consultar_sketch(sketch: Dict[str, Any], percentiles: List[float]) -> Dict[float, Optional[float]]:
+    """
+    Estima percentiles a partir de un sketch.
+
+    Args:
+        sketch (Dict[str, Any]): Sketch creado con crear_sketch_cuantiles
+        percentiles (List[float]): Percentiles buscados, entre 0 y 100
+
+    Returns:
+        Dict[float, Optional[float]]: Valor estimado de cada percentil
+            (None si el sketch está vacío)
+
+    Raises:
+        ValueError: Si algún percentil no está entre 0 y 100
+    """
+    _validar_percentiles(percentiles)
+    # Cada valor del nivel h representa 2^h valores originales
+    ponderados = sorted(
+        (valor, 1 << nivel)
+        for nivel, valores in enumerate(sketch['niveles'])
+        for valor in valores
+    )
+    if not ponderados:
+        return {p: None for p in percentiles}
+
+    peso_total = sum(peso for _, peso in ponderados)
+    resultado = {}
+    for percentil in sorted(percentiles):
+        objetivo = percentil / 100 * peso_total
+        acumulado = 0
+        estimado = ponderados[-1][0]
+        for valor, peso in ponderados:
+            acumulado += peso
+            if acumulado >= objetivo:
+                estimado = valor
+                break
+        resultado[percentil] = estimado
+
+    return resultado
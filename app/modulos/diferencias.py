@@ -0,0 +1,276 @@
+"""
+Módulo de Diferencias entre Archivos
+====================================
+Este módulo compara dos versiones de un CSV de países (por ejemplo, los
+datos actuales y una actualización de un proveedor) y aplica los cambios
+encontrados sobre un archivo de datos.
+
+Los países se identifican por su nombre normalizado. Ninguno de los dos
+archivos se carga completo: el archivo anterior se guarda en una tabla hash
+y el nuevo se recorre de a bloques. Si el archivo anterior supera el límite
+de memoria, ambos se reparten primero en particiones temporales según el
+hash del nombre, de modo que cada país queda en la misma partición en los
+dos archivos, y se comparan partición por partición.
+
+Un país cuya fila es inválida en el archivo nuevo no se da por eliminado:
+la fila se informa como error y el país anterior se deja como estaba.
+
+También puede usarse desde la terminal:
+    python -m modulos.diferencias data/paises.csv data/paises_proveedor.csv [--aplicar]
+"""
+
+import csv
+import os
+import zlib
+import shutil
+import argparse
+import tempfile
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from .validacion import normalizar_texto_busqueda
+from .carga_datos import iterar_paises_csv, COLUMNAS_REQUERIDAS
+from .almacenamiento import es_ruta_sqlite, guardar_cambios_sqlite
+
+# Tamaño máximo (en bytes) del archivo anterior para compararlo sin particionar
+LIMITE_MEMORIA_POR_DEFECTO = 64 * 1024 * 1024
+
+# Campos que se comparan entre las dos versiones de un país
+CAMPOS_COMPARADOS = ('nombre', 'poblacion', 'superficie', 'continente')
+
+
+def _comparar_en_memoria(anteriores: Iterable[Dict[str, Any]],
+                         nuevos: Iterable[Dict[str, Any]],
+                         errores_nuevos: Iterable[Dict[str, Any]] = ()) -> Iterator[Dict[str, Any]]:
+    """
+    Compara dos secuencias de países con una tabla hash de la primera.
+
+    errores_nuevos son las filas inválidas de la versión nueva; se consultan
+    recién al terminar de recorrerla, así que pueden irse llenando mientras
+    se lee. Los países que nombran no se dan por eliminados.
+    """
+    tabla = {}
+    for pais in anteriores:
+        tabla.setdefault(normalizar_texto_busqueda(pais['nombre']), pais)
+
+    vistos = set()
+    for pais in nuevos:
+        nombre = normalizar_texto_busqueda(pais['nombre'])
+        if nombre in vistos:
+            continue  # Nombre repetido en el archivo nuevo: vale la primera aparición
+        vistos.add(nombre)
+
+        anterior = tabla.pop(nombre, None)
+        if anterior is None:
+            yield {'tipo': 'agregado', 'nombre': nombre, 'antes': None,
+                   'despues': pais, 'cambios': {}}
+            continue
+
+        cambios = {campo: (anterior[campo], pais[campo])
+                   for campo in CAMPOS_COMPARADOS if anterior[campo] != pais[campo]}
+        if cambios:
+            yield {'tipo': 'modificado', 'nombre': nombre, 'antes': anterior,
+                   'despues': pais, 'cambios': cambios}
+
+    invalidos = {normalizar_texto_busqueda(error['nombre'])
+                 for error in errores_nuevos if error.get('nombre')}
+    for nombre, pais in tabla.items():
+        if nombre in invalidos:
+            continue  # La fila nueva es inválida: no hay dato para reemplazarlo ni para borrarlo
+        yield {'tipo': 'eliminado', 'nombre': nombre, 'antes': pais,
+               'despues': None, 'cambios': {}}
+
+
+def _particionar(ruta_archivo: str, directorio: str, prefijo: str, particiones: int,
+                 errores: Optional[List[Dict[str, Any]]]) -> List[str]:
+    """Reparte los países de un CSV en archivos temporales según el hash del nombre."""
+    rutas = [os.path.join(directorio, f"{prefijo}_{i}.csv") for i in range(particiones)]
+    archivos = [open(ruta, 'w', encoding='utf-8', newline='') for ruta in rutas]
+    try:
+        escritores = [csv.writer(archivo) for archivo in archivos]
+        for escritor_csv in escritores:
+            escritor_csv.writerow(COLUMNAS_REQUERIDAS)
+        for pais in iterar_paises_csv(ruta_archivo, errores):
+            # crc32 y no hash(): el reparto debe ser igual para los dos archivos
+            clave = zlib.crc32(normalizar_texto_busqueda(pais['nombre']).encode('utf-8'))
+            escritores[clave % particiones].writerow(
+                [pais['nombre'], pais['poblacion'], pais['superficie'], pais['continente']])
+    finally:
+        for archivo in archivos:
+            archivo.close()
+    return rutas
+
+
+def comparar_archivos_csv(ruta_anterior: str, ruta_nueva: str,
+                          limite_memoria: int = LIMITE_MEMORIA_POR_DEFECTO,
+                          errores: Optional[List[Dict[str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Compara dos versiones de un CSV de países.
+
+    Args:
+        ruta_anterior (str): Ruta a la versión anterior
+        ruta_nueva (str): Ruta a la versión nueva
+        limite_memoria (int): Tamaño máximo (en bytes) del archivo anterior
+            para compararlo sin particionar; también determina la cantidad
+            de particiones
+        errores (List[Dict[str, Any]], optional): Lista donde se agregan las
+            filas inválidas de ambos archivos al terminar la comparación, con
+            el 'archivo' de cada una. Se omiten de la comparación, y los
+            países con una fila inválida en la versión nueva nunca se
+            informan como eliminados
+
+    Yields:
+        Dict[str, Any]: Un cambio por país, con 'tipo' ('agregado',
+            'eliminado' o 'modificado'), 'nombre' (normalizado), 'antes' y
+            'despues' (el país en cada versión o None) y 'cambios' (campo ->
+            (valor anterior, valor nuevo), solo en las modificaciones)
+    """
+    errores_anteriores = []
+    errores_nuevos = []
+    tamano = os.path.getsize(ruta_anterior)
+    try:
+        if tamano <= limite_memoria:
+            yield from _comparar_en_memoria(iterar_paises_csv(ruta_anterior, errores_anteriores),
+                                            iterar_paises_csv(ruta_nueva, errores_nuevos),
+                                            errores_nuevos)
+            return
+
+        particiones = -(-tamano // limite_memoria) + 1  # Margen para particiones desparejas
+        with tempfile.TemporaryDirectory(prefix='diferencias_') as directorio:
+            anteriores = _particionar(ruta_anterior, directorio, 'anterior', particiones,
+                                      errores_anteriores)
+            nuevas = _particionar(ruta_nueva, directorio, 'nueva', particiones, errores_nuevos)
+            for ruta_parte_anterior, ruta_parte_nueva in zip(anteriores, nuevas):
+                yield from _comparar_en_memoria(iterar_paises_csv(ruta_parte_anterior),
+                                                iterar_paises_csv(ruta_parte_nueva),
+                                                errores_nuevos)
+    finally:
+        if errores is not None:
+            errores.extend({**error, 'archivo': ruta_anterior} for error in errores_anteriores)
+            errores.extend({**error, 'archivo': ruta_nueva} for error in errores_nuevos)
+
+
+def aplicar_diferencias(ruta_archivo: str, diferencias: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Aplica un conjunto de cambios sobre un archivo de datos (CSV o SQLite).
+
+    Los cambios se aplican en lote: en SQLite con una única transacción, y
+    en CSV recorriendo el archivo una sola vez, donde las filas que no
+    cambian se copian tal como estaban (con sus columnas adicionales), las
+    modificadas se reemplazan, las eliminadas se omiten y las agregadas van
+    al final. El archivo se reemplaza al terminar, nunca queda a medias.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo de datos a actualizar
+        diferencias (Iterable[Dict[str, Any]]): Cambios como los que genera
+            comparar_archivos_csv (se pueden filtrar antes de aplicarlos)
+
+    Returns:
+        Dict[str, int]: Cantidad de países 'agregados', 'modificados' y 'eliminados'
+    """
+    pendientes = {}  # Nombre normalizado -> país nuevo (None para eliminarlo)
+    tipos = {}       # Nombre normalizado -> tipo de cambio
+    for cambio in diferencias:
+        pendientes[cambio['nombre']] = cambio['despues']
+        tipos[cambio['nombre']] = cambio['tipo']
+
+    if es_ruta_sqlite(ruta_archivo):
+        actualizados = [pais for pais in pendientes.values() if pais is not None]
+        eliminados = [nombre for nombre, pais in pendientes.items() if pais is None]
+        if not guardar_cambios_sqlite(actualizados, eliminados, ruta_archivo):
+            raise ValueError(f"No se pudieron aplicar los cambios en {ruta_archivo}")
+        tipos = list(tipos.values())
+        return {'agregados': tipos.count('agregado'), 'modificados': tipos.count('modificado'),
+                'eliminados': len(eliminados)}
+
+    conteo = {'agregados': 0, 'modificados': 0, 'eliminados': 0}
+    directorio = os.path.dirname(os.path.abspath(ruta_archivo))
+    descriptor, ruta_temporal = tempfile.mkstemp(dir=directorio, suffix='.tmp')
+    try:
+        with open(ruta_archivo, 'r', encoding='utf-8', newline='') as entrada, \
+                os.fdopen(descriptor, 'w', encoding='utf-8', newline='') as salida:
+            lector_csv = csv.reader(entrada)
+            escritor_csv = csv.writer(salida)
+            encabezado = next(lector_csv, None)
+            if not encabezado or 'nombre' not in encabezado:
+                raise ValueError("El archivo CSV no contiene la columna 'nombre'")
+            escritor_csv.writerow(encabezado)
+            posiciones = {col: encabezado.index(col) for col in COLUMNAS_REQUERIDAS if col in encabezado}
+
+            def fila_nueva(pais: Dict[str, Any], anterior: List[str]) -> List[Any]:
+                fila = list(anterior) + [''] * (len(encabezado) - len(anterior))
+                for columna, posicion in posiciones.items():
+                    fila[posicion] = pais[columna]
+                return fila
+
+            procesados = set()
+            for fila in lector_csv:
+                if not fila:
+                    continue
+                nombre = normalizar_texto_busqueda(fila[posiciones['nombre']].strip()) \
+                    if len(fila) > posiciones['nombre'] else ''
+                if nombre not in pendientes:
+                    escritor_csv.writerow(fila)
+                    continue
+                if nombre in procesados:
+                    continue  # Fila repetida de un país que ya se reemplazó o eliminó
+                procesados.add(nombre)
+                if pendientes[nombre] is None:
+                    conteo['eliminados'] += 1
+                else:
+                    escritor_csv.writerow(fila_nueva(pendientes[nombre], fila))
+                    conteo['modificados'] += 1
+
+            for nombre, pais in pendientes.items():
+                if pais is not None and nombre not in procesados:
+                    escritor_csv.writerow(fila_nueva(pais, []))
+                    conteo['agregados'] += 1
+
+        shutil.copymode(ruta_archivo, ruta_temporal)
+        os.replace(ruta_temporal, ruta_archivo)
+    except BaseException:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+        raise
+
+    return conteo
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compara dos versiones de un CSV de países")
+    parser.add_argument('anterior', help="Versión anterior (CSV)")
+    parser.add_argument('nueva', help="Versión nueva (CSV)")
+    parser.add_argument('--aplicar', action='store_true',
+                        help="Aplicar los cambios sobre la versión anterior")
+    parser.add_argument('--sin-eliminar', action='store_true', dest='sin_eliminar',
+                        help="No eliminar los países que faltan en la versión nueva")
+    parser.add_argument('--forzar', action='store_true',
+                        help="Aplicar los cambios aunque la versión nueva tenga filas inválidas")
+    parser.add_argument('--limite-memoria', type=int, default=LIMITE_MEMORIA_POR_DEFECTO,
+                        dest='limite_memoria', metavar='BYTES',
+                        help="Tamaño máximo del archivo anterior para compararlo sin particionar")
+    argumentos = parser.parse_args()
+
+    errores = []
+    cambios = [cambio for cambio in comparar_archivos_csv(argumentos.anterior, argumentos.nueva,
+                                                          argumentos.limite_memoria, errores)
+               if not (argumentos.sin_eliminar and cambio['tipo'] == 'eliminado')]
+
+    simbolos = {'agregado': '+', 'eliminado': '-', 'modificado': '~'}
+    for cambio in cambios:
+        pais = cambio['despues'] or cambio['antes']
+        detalle = ', '.join(f"{campo}: {antes} → {despues}"
+                            for campo, (antes, despues) in cambio['cambios'].items())
+        print(f"{simbolos[cambio['tipo']]} {pais['nombre']}" + (f" ({detalle})" if detalle else ""))
+    for error in errores:
+        print(f"⚠️ Fila {error['fila']} de {error['archivo']} inválida, se omite: {error['mensaje']}")
+    invalidas_nuevas = sum(1 for error in errores if error['archivo'] == argumentos.nueva)
+
+    if argumentos.aplicar and invalidas_nuevas and not argumentos.forzar:
+        print(f"❌ La versión nueva tiene {invalidas_nuevas} filas inválidas; no se aplican "
+              f"los cambios (corrija el archivo o use --forzar)")
+        raise SystemExit(1)
+    if argumentos.aplicar:
+        conteo = aplicar_diferencias(argumentos.anterior, cambios)
+        print(f"✅ {argumentos.anterior} actualizado: {conteo['agregados']} agregados, "
+              f"{conteo['modificados']} modificados, {conteo['eliminados']} eliminados")
+    else:
+        print(f"📊 {len(cambios)} países con cambios")
@@ -5,8 +5,10 @@ Este módulo contiene funciones para calcular estadísticas descriptivas
 y generar reportes sobre los datos de países.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union
+from bisect import bisect_left
 import math
+from .cuantiles import seleccionar_posiciones, calcular_percentiles
 
 
 def calcular_estadisticas_generales(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -88,12 +90,15 @@ def calcular_estadisticas_continente(paises: List[Dict[str, Any]], continente: s
     return calcular_estadisticas_generales(paises_continente)
 
 
-def analizar_distribucion_poblacion(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
+def analizar_distribucion_poblacion(paises: List[Dict[str, Any]],
+                                    percentiles: Optional[List[float]] = None) -> Dict[str, Any]:
     """
     Analiza la distribución de población entre los países.
     
     Args:
         paises (List[Dict[str, Any]]): Lista de países
+        percentiles (List[float], optional): Percentiles adicionales a calcular
+            (entre 0 y 100), interpolados linealmente
         
     Returns:
         Dict[str, Any]: Análisis de distribución de población
@@ -102,30 +107,43 @@ def analizar_distribucion_poblacion(paises: List[Dict[str, Any]]) -> Dict[str, A
         return {}
     
     poblaciones = [pais['poblacion'] for pais in paises]
-    poblaciones_ordenadas = sorted(poblaciones)
-    n = len(poblaciones_ordenadas)
+    n = len(poblaciones)
     
-    # Calcular percentil 90 (simplificado)
+    # Seleccionar solo las posiciones necesarias en lugar de ordenar todo
     posicion_90 = int(0.9 * (n - 1))
-    percentil_90 = poblaciones_ordenadas[posicion_90] if posicion_90 < n else poblaciones_ordenadas[-1]
+    posiciones_mediana = (n // 2 - 1, n // 2) if n % 2 == 0 else (n // 2,)
+    seleccion = seleccionar_posiciones(poblaciones, (posicion_90,) + posiciones_mediana)
+    
+    # Calcular percentil 90 (simplificado)
+    percentil_90 = seleccion[posicion_90]
     
     # Calcular mediana (percentil 50)
     if n % 2 == 0:
-        mediana = (poblaciones_ordenadas[n // 2 - 1] + poblaciones_ordenadas[n // 2]) / 2
+        mediana = (seleccion[n // 2 - 1] + seleccion[n // 2]) / 2
     else:
-        mediana = poblaciones_ordenadas[n // 2]
+        mediana = seleccion[n // 2]
     
-    # Clasificar países por tamaño poblacional
-    paises_grandes = [p for p in paises if p['poblacion'] >= percentil_90]
-    paises_pequeños = [p for p in paises if p['poblacion'] < mediana]
+    # Clasificar países por tamaño poblacional en una sola pasada
+    paises_grandes = []
+    paises_pequeños = []
+    for pais in paises:
+        if pais['poblacion'] >= percentil_90:
+            paises_grandes.append(pais)
+        if pais['poblacion'] < mediana:
+            paises_pequeños.append(pais)
     
-    return {
+    distribucion = {
         'percentil_90': percentil_90,
         'mediana': mediana,
         'paises_grandes': len(paises_grandes),
         'paises_pequeños': len(paises_pequeños),
         'lista_grandes': paises_grandes[:10]  # Top 10
     }
+    
+    if percentiles:
+        distribucion['percentiles'] = calcular_percentiles(poblaciones, percentiles)
+    
+    return distribucion
 
 
 def calcular_correlacion_poblacion_superficie(paises: List[Dict[str, Any]]) -> float:
@@ -170,3 +188,222 @@ def calcular_correlacion_poblacion_superficie(paises: List[Dict[str, Any]]) -> f
 
 
 
+
+
+# Operaciones de agregación disponibles para agrupar_por
+OPERACIONES_AGREGADO = ('suma', 'promedio', 'minimo', 'maximo', 'desviacion')
+
+# Agregados que devuelven el país (no el valor) con el mayor o menor valor de un campo
+OPERACIONES_EXTREMO = ('pais_mayor', 'pais_menor')
+
+# Estadísticas de calcular_estadisticas_generales y el agregado de agrupar_por de cada una
+AGREGADOS_ESTADISTICAS = {
+    'total_paises': 'cantidad',
+    'poblacion_total': 'suma_poblacion',
+    'superficie_total': 'suma_superficie',
+    'poblacion_promedio': 'promedio_poblacion',
+    'superficie_promedio': 'promedio_superficie',
+    'pais_mayor_poblacion': 'pais_mayor_poblacion',
+    'pais_menor_poblacion': 'pais_menor_poblacion',
+    'pais_mayor_superficie': 'pais_mayor_superficie',
+    'pais_menor_superficie': 'pais_menor_superficie',
+    'desviacion_poblacion': 'desviacion_poblacion',
+    'desviacion_superficie': 'desviacion_superficie',
+}
+
+
+def _interpretar_agregados(agregados: List[str]) -> Tuple[List[Tuple[str, str, str]], List[str]]:
+    """
+    Traduce nombres como 'promedio_poblacion' a tuplas (nombre, operación, campo).
+
+    Returns:
+        Tuple: Agregados interpretados y campos numéricos que se deben acumular
+
+    Raises:
+        ValueError: Si algún agregado no es válido
+    """
+    interpretados = []
+    campos = []
+    for agregado in agregados:
+        if agregado == 'cantidad':
+            interpretados.append((agregado, 'cantidad', ''))
+            continue
+        if agregado == 'densidad':
+            interpretados.append((agregado, 'densidad', ''))
+            campos.extend(c for c in ('poblacion', 'superficie') if c not in campos)
+            continue
+
+        extremo = next((op for op in OPERACIONES_EXTREMO if agregado.startswith(op + '_')), None)
+        if extremo:
+            operacion, campo = extremo, agregado[len(extremo) + 1:]
+        else:
+            operacion, _, campo = agregado.partition('_')
+        if (operacion not in OPERACIONES_AGREGADO and not extremo) or not campo:
+            raise ValueError(f"Agregado inválido: '{agregado}'")
+        interpretados.append((agregado, operacion, campo))
+        if campo not in campos:
+            campos.append(campo)
+
+    return interpretados, campos
+
+
+def agrupar_por(paises: List[Dict[str, Any]], clave: Union[str, Callable[[Dict[str, Any]], Any]],
+                agregados: List[str]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Agrupa países y calcula agregados por grupo en una sola pasada.
+
+    Los agregados disponibles son 'cantidad', 'densidad' (población total
+    sobre superficie total) y '<operación>_<campo>', donde la operación es
+    suma, promedio, minimo, maximo o desviacion, o bien pais_mayor o
+    pais_menor (el primer país con el mayor o menor valor, como max y min).
+    Por ejemplo: agrupar_por(paises, 'continente', ['cantidad', 'promedio_poblacion']).
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        clave (str | Callable): Campo por el cual agrupar o función que
+            devuelve el grupo de cada país
+        agregados (List[str]): Agregados a calcular
+
+    Returns:
+        Dict[Any, Dict[str, Any]]: Agregados calculados para cada grupo
+
+    Raises:
+        ValueError: Si algún agregado no es válido
+    """
+    interpretados, campos = _interpretar_agregados(agregados)
+    obtener_grupo = (lambda pais: pais[clave]) if isinstance(clave, str) else clave
+
+    # Acumuladores por grupo: cantidad y, por campo,
+    # [suma, media, M2, mínimo, máximo, país con el mínimo, país con el máximo]
+    acumuladores = {}
+    for pais in paises:
+        grupo = obtener_grupo(pais)
+        acumulador = acumuladores.get(grupo)
+        if acumulador is None:
+            acumulador = {'cantidad': 0, 'campos': {c: [0, 0.0, 0.0, None, None, None, None] for c in campos}}
+            acumuladores[grupo] = acumulador
+
+        acumulador['cantidad'] += 1
+        cantidad = acumulador['cantidad']
+        for campo, valores in acumulador['campos'].items():
+            valor = pais[campo]
+            valores[0] += valor
+            # Algoritmo de Welford para la varianza en una pasada
+            delta = valor - valores[1]
+            valores[1] += delta / cantidad
+            valores[2] += delta * (valor - valores[1])
+            if valores[3] is None or valor < valores[3]:
+                valores[3] = valor
+                valores[5] = pais
+            if valores[4] is None or valor > valores[4]:
+                valores[4] = valor
+                valores[6] = pais
+
+    resultados = {}
+    for grupo, acumulador in acumuladores.items():
+        cantidad = acumulador['cantidad']
+        resultado = {}
+        for nombre, operacion, campo in interpretados:
+            if operacion == 'cantidad':
+                resultado[nombre] = cantidad
+            elif operacion == 'densidad':
+                superficie = acumulador['campos']['superficie'][0]
+                resultado[nombre] = round(acumulador['campos']['poblacion'][0] / superficie, 2) \
+                    if superficie else 0
+            else:
+                suma, media, m2, minimo, maximo, pais_minimo, pais_maximo = acumulador['campos'][campo]
+                if operacion == 'suma':
+                    resultado[nombre] = suma
+                elif operacion == 'promedio':
+                    resultado[nombre] = round(suma / cantidad, 2)
+                elif operacion == 'minimo':
+                    resultado[nombre] = minimo
+                elif operacion == 'maximo':
+                    resultado[nombre] = maximo
+                elif operacion == 'pais_menor':
+                    resultado[nombre] = pais_minimo
+                elif operacion == 'pais_mayor':
+                    resultado[nombre] = pais_maximo
+                else:
+                    resultado[nombre] = round(math.sqrt(m2 / cantidad), 2)
+        resultados[grupo] = resultado
+
+    return resultados
+
+
+def calcular_estadisticas_por_continente(paises: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Calcula las estadísticas de todos los continentes con una única agrupación.
+
+    Todas las estadísticas se acumulan con agrupar_por en una sola pasada
+    (una tabla hash por continente), en lugar de filtrar la lista completa
+    y recorrer cada grupo otra vez por continente.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Estadísticas de cada continente, con el
+            mismo formato que calcular_estadisticas_continente
+    """
+    grupos = agrupar_por(paises, 'continente', list(AGREGADOS_ESTADISTICAS.values()))
+    return {continente: {clave: agregados[agregado] for clave, agregado in AGREGADOS_ESTADISTICAS.items()}
+            for continente, agregados in grupos.items()}
+
+
+def clave_escala_logaritmica(campo: str, base: int = 10) -> Callable[[Dict[str, Any]], int]:
+    """
+    Crea una función de agrupación por orden de magnitud de un campo.
+
+    Args:
+        campo (str): Campo numérico ('poblacion', 'superficie')
+        base (int): Base de la escala logarítmica
+
+    Returns:
+        Callable: Función que devuelve el límite inferior de la cubeta
+            (por ejemplo 1000000 para poblaciones entre 1 y 10 millones)
+    """
+    def obtener_cubeta(pais: Dict[str, Any]) -> int:
+        limite = 1
+        while limite * base <= pais[campo]:
+            limite *= base
+        return limite
+
+    return obtener_cubeta
+
+
+def clave_deciles(paises: List[Dict[str, Any]], campo: str) -> Callable[[Dict[str, Any]], int]:
+    """
+    Crea una función de agrupación por deciles de un campo.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países usada para calcular los cortes
+        campo (str): Campo numérico ('poblacion', 'superficie')
+
+    Returns:
+        Callable: Función que devuelve el decil (1 a 10) de cada país
+    """
+    cortes = calcular_percentiles([p[campo] for p in paises], list(range(10, 100, 10)),
+                                  interpolar=False)
+    limites = [cortes[p] for p in sorted(cortes)]
+
+    def obtener_decil(pais: Dict[str, Any]) -> int:
+        return bisect_left(limites, pais[campo]) + 1
+
+    return obtener_decil
+
+
+def generar_histograma(paises: List[Dict[str, Any]],
+                       clave: Union[str, Callable[[Dict[str, Any]], Any]]) -> List[Tuple[Any, int]]:
+    """
+    Cuenta cuántos países hay en cada grupo.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        clave (str | Callable): Campo o función de agrupación (ver agrupar_por)
+
+    Returns:
+        List[Tuple[Any, int]]: Pares (grupo, cantidad) ordenados por grupo
+    """
+    grupos = agrupar_por(paises, clave, ['cantidad'])
+    return sorted((grupo, datos['cantidad']) for grupo, datos in grupos.items())
@@ -0,0 +1,291 @@
+"""
+Módulo de Búsquedas Geográficas
+===============================
+Este módulo responde consultas espaciales sobre los países que tienen
+coordenadas (las columnas opcionales latitud y longitud del CSV, con el
+centroide de cada país): los k países más cercanos a un punto, los que
+están dentro de un radio y los que caen dentro de un rectángulo de
+latitudes y longitudes.
+
+Las consultas usan un árbol k-d armado una sola vez con
+crear_indice_geografico. Cada país se guarda como un punto de la esfera
+unitaria en coordenadas cartesianas (x, y, z): así la distancia en línea
+recta entre dos puntos crece con la distancia sobre la superficie, no hay
+que tratar aparte el antimeridiano ni los polos, y el árbol puede descartar
+ramas enteras comparando una sola coordenada. Los candidatos que quedan se
+confirman con la fórmula de haversine.
+
+En promedio una consulta visita O(log n) nodos más los resultados. El
+índice no se actualiza solo: si cambian las coordenadas de los países hay
+que volver a crearlo.
+"""
+
+import heapq
+import math
+from itertools import count
+from typing import List, Dict, Any, Optional, Tuple
+
+# Radio medio de la Tierra en kilómetros
+RADIO_TIERRA_KM = 6371.0088
+
+# Margen para los errores de redondeo al comparar distancias en la esfera unitaria
+TOLERANCIA = 1e-12
+
+
+def tiene_coordenadas(pais: Dict[str, Any]) -> bool:
+    """Indica si un país tiene latitud y longitud."""
+    return pais.get('latitud') is not None and pais.get('longitud') is not None
+
+
+def distancia_km(latitud_1: float, longitud_1: float,
+                 latitud_2: float, longitud_2: float) -> float:
+    """
+    Calcula la distancia sobre la superficie terrestre entre dos puntos.
+
+    Args:
+        latitud_1 (float): Latitud del primer punto (grados)
+        longitud_1 (float): Longitud del primer punto (grados)
+        latitud_2 (float): Latitud del segundo punto (grados)
+        longitud_2 (float): Longitud del segundo punto (grados)
+
+    Returns:
+        float: Distancia en kilómetros (fórmula de haversine)
+    """
+    fi_1 = math.radians(latitud_1)
+    fi_2 = math.radians(latitud_2)
+    seno_latitud = math.sin((fi_2 - fi_1) / 2)
+    seno_longitud = math.sin(math.radians(longitud_2 - longitud_1) / 2)
+    a = seno_latitud * seno_latitud + math.cos(fi_1) * math.cos(fi_2) * seno_longitud * seno_longitud
+    return 2 * RADIO_TIERRA_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distancia_a_pais(pais: Dict[str, Any], latitud: float, longitud: float) -> Optional[float]:
+    """Distancia en kilómetros de un punto a un país, o None si el país no tiene coordenadas."""
+    if not tiene_coordenadas(pais):
+        return None
+    return distancia_km(latitud, longitud, pais['latitud'], pais['longitud'])
+
+
+def esta_en_rectangulo(pais: Dict[str, Any], latitud_min: float, latitud_max: float,
+                       longitud_min: float, longitud_max: float) -> bool:
+    """
+    Indica si un país está dentro de un rectángulo de latitudes y longitudes.
+
+    Si longitud_min es mayor que longitud_max, el rectángulo cruza el
+    antimeridiano (por ejemplo, de 170 a -170).
+    """
+    if not tiene_coordenadas(pais) or not latitud_min <= pais['latitud'] <= latitud_max:
+        return False
+    longitud = pais['longitud']
+    if longitud_min <= longitud_max:
+        return longitud_min <= longitud <= longitud_max
+    return longitud >= longitud_min or longitud <= longitud_max
+
+
+def _a_cartesianas(latitud: float, longitud: float) -> Tuple[float, float, float]:
+    """Punto de la esfera unitaria correspondiente a una latitud y longitud."""
+    fi = math.radians(latitud)
+    landa = math.radians(longitud)
+    return (math.cos(fi) * math.cos(landa), math.cos(fi) * math.sin(landa), math.sin(fi))
+
+
+def _distancia_cuadrada(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> float:
+    """Cuadrado de la distancia en línea recta entre dos puntos."""
+    dx = a[0] - b[0]
+    dy = a[1] - b[1]
+    dz = a[2] - b[2]
+    return dx * dx + dy * dy + dz * dz
+
+
+def _cuerda_a_km(distancia_cuadrada: float) -> float:
+    """Convierte el cuadrado de una cuerda de la esfera unitaria en kilómetros sobre la superficie."""
+    return 2 * RADIO_TIERRA_KM * math.asin(min(1.0, math.sqrt(distancia_cuadrada) / 2))
+
+
+def _construir(puntos: List[Tuple[Tuple[float, float, float], Dict[str, Any]]],
+               profundidad: int) -> Optional[Dict[str, Any]]:
+    """Arma el subárbol de una lista de puntos partiendo por la mediana."""
+    if not puntos:
+        return None
+    eje = profundidad % 3
+    puntos.sort(key=lambda punto: punto[0][eje])
+    medio = len(puntos) // 2
+    punto, pais = puntos[medio]
+    return {
+        'punto': punto,
+        'pais': pais,
+        'eje': eje,
+        'izquierdo': _construir(puntos[:medio], profundidad + 1),
+        'derecho': _construir(puntos[medio + 1:], profundidad + 1),
+    }
+
+
+def crear_indice_geografico(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Crea un árbol k-d con los países que tienen coordenadas.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países; los que no tienen
+            latitud y longitud se omiten
+
+    Returns:
+        Dict[str, Any]: Índice con la raíz del árbol y la cantidad de países
+    """
+    puntos = [(_a_cartesianas(pais['latitud'], pais['longitud']), pais)
+              for pais in paises if tiene_coordenadas(pais)]
+    return {'raiz': _construir(puntos, 0), 'cantidad': len(puntos)}
+
+
+def buscar_mas_cercanos(indice: Dict[str, Any], latitud: float, longitud: float,
+                        cantidad: int) -> List[Tuple[Dict[str, Any], float]]:
+    """
+    Busca los países más cercanos a un punto.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_geografico
+        latitud (float): Latitud del punto (grados)
+        longitud (float): Longitud del punto (grados)
+        cantidad (int): Cantidad de países a retornar
+
+    Returns:
+        List[Tuple[Dict[str, Any], float]]: Pares (país, distancia en km),
+            del más cercano al más lejano
+    """
+    if cantidad <= 0:
+        return []
+    objetivo = _a_cartesianas(latitud, longitud)
+    mejores = []  # Heap de máximos: (-distancia², desempate, país)
+    desempate = count()
+
+    def visitar(nodo: Optional[Dict[str, Any]]):
+        if nodo is None:
+            return
+        distancia = _distancia_cuadrada(objetivo, nodo['punto'])
+        if len(mejores) < cantidad:
+            heapq.heappush(mejores, (-distancia, -next(desempate), nodo['pais']))
+        elif distancia < -mejores[0][0]:
+            heapq.heapreplace(mejores, (-distancia, -next(desempate), nodo['pais']))
+
+        diferencia = objetivo[nodo['eje']] - nodo['punto'][nodo['eje']]
+        cercano, lejano = ((nodo['izquierdo'], nodo['derecho']) if diferencia < 0
+                           else (nodo['derecho'], nodo['izquierdo']))
+        visitar(cercano)
+        # La otra rama solo puede mejorar si el plano de corte está más cerca que el peor elegido
+        if len(mejores) < cantidad or diferencia * diferencia < -mejores[0][0]:
+            visitar(lejano)
+
+    visitar(indice['raiz'])
+    ordenados = sorted(mejores, key=lambda elemento: (-elemento[0], -elemento[1]))
+    return [(pais, _cuerda_a_km(-distancia)) for distancia, _, pais in ordenados]
+
+
+def buscar_en_radio(indice: Dict[str, Any], latitud: float, longitud: float,
+                    radio_km: float) -> List[Tuple[Dict[str, Any], float]]:
+    """
+    Busca los países que están a una distancia máxima de un punto.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_geografico
+        latitud (float): Latitud del punto (grados)
+        longitud (float): Longitud del punto (grados)
+        radio_km (float): Distancia máxima en kilómetros (incluida)
+
+    Returns:
+        List[Tuple[Dict[str, Any], float]]: Pares (país, distancia en km),
+            del más cercano al más lejano
+    """
+    if radio_km < 0:
+        return []
+    objetivo = _a_cartesianas(latitud, longitud)
+    # Cuerda que corresponde al radio (todo el globo si el radio supera media vuelta)
+    cuerda = 2 * math.sin(min(radio_km / RADIO_TIERRA_KM, math.pi) / 2)
+    limite = cuerda * cuerda + TOLERANCIA
+    encontrados = []
+
+    def visitar(nodo: Optional[Dict[str, Any]]):
+        if nodo is None:
+            return
+        if _distancia_cuadrada(objetivo, nodo['punto']) <= limite:
+            pais = nodo['pais']
+            distancia = distancia_km(latitud, longitud, pais['latitud'], pais['longitud'])
+            if distancia <= radio_km:
+                encontrados.append((pais, distancia))
+        diferencia = objetivo[nodo['eje']] - nodo['punto'][nodo['eje']]
+        if diferencia < 0 or diferencia * diferencia <= limite:
+            visitar(nodo['izquierdo'])
+        if diferencia >= 0 or diferencia * diferencia <= limite:
+            visitar(nodo['derecho'])
+
+    visitar(indice['raiz'])
+    encontrados.sort(key=lambda par: par[1])
+    return encontrados
+
+
+def _rango_trigonometrico(minimo: float, maximo: float,
+                          funcion) -> Tuple[float, float]:
+    """Valores mínimo y máximo de cos o sin en un intervalo de ángulos (radianes)."""
+    valores = [funcion(minimo), funcion(maximo)]
+    # Los extremos interiores están en los múltiplos de pi/2
+    paso = math.pi / 2
+    angulo = math.ceil(minimo / paso) * paso
+    while angulo <= maximo:
+        valores.append(funcion(angulo))
+        angulo += paso
+    return min(valores), max(valores)
+
+
+def buscar_en_rectangulo(indice: Dict[str, Any], latitud_min: float, latitud_max: float,
+                         longitud_min: float, longitud_max: float) -> List[Dict[str, Any]]:
+    """
+    Busca los países dentro de un rectángulo de latitudes y longitudes.
+
+    El rectángulo se convierte en la caja (x, y, z) que lo contiene; el
+    árbol descarta las ramas fuera de la caja y los candidatos se confirman
+    con esta_en_rectangulo.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_geografico
+        latitud_min (float): Latitud mínima (grados, incluida)
+        latitud_max (float): Latitud máxima (grados, incluida)
+        longitud_min (float): Longitud oeste (grados, incluida)
+        longitud_max (float): Longitud este (grados, incluida); si es menor
+            que longitud_min, el rectángulo cruza el antimeridiano
+
+    Returns:
+        List[Dict[str, Any]]: Países dentro del rectángulo, sin un orden particular
+    """
+    if latitud_min > latitud_max:
+        return []
+    fi_min = math.radians(max(-90.0, latitud_min))
+    fi_max = math.radians(min(90.0, latitud_max))
+    landa_min = math.radians(longitud_min)
+    landa_max = math.radians(longitud_max if longitud_min <= longitud_max else longitud_max + 360)
+
+    radio_min, radio_max = _rango_trigonometrico(fi_min, fi_max, math.cos)
+    coseno_min, coseno_max = _rango_trigonometrico(landa_min, landa_max, math.cos)
+    seno_min, seno_max = _rango_trigonometrico(landa_min, landa_max, math.sin)
+    # x = r·cos(λ) e y = r·sin(λ) con r >= 0: los extremos están en las esquinas
+    caja = [
+        (min(radio_min * coseno_min, radio_max * coseno_min) - TOLERANCIA,
+         max(radio_min * coseno_max, radio_max * coseno_max) + TOLERANCIA),
+        (min(radio_min * seno_min, radio_max * seno_min) - TOLERANCIA,
+         max(radio_min * seno_max, radio_max * seno_max) + TOLERANCIA),
+        (math.sin(fi_min) - TOLERANCIA, math.sin(fi_max) + TOLERANCIA),
+    ]
+    encontrados = []
+
+    def visitar(nodo: Optional[Dict[str, Any]]):
+        if nodo is None:
+            return
+        punto = nodo['punto']
+        if all(minimo <= valor <= maximo for valor, (minimo, maximo) in zip(punto, caja)):
+            if esta_en_rectangulo(nodo['pais'], latitud_min, latitud_max, longitud_min, longitud_max):
+                encontrados.append(nodo['pais'])
+        minimo, maximo = caja[nodo['eje']]
+        if minimo <= punto[nodo['eje']]:
+            visitar(nodo['izquierdo'])
+        if punto[nodo['eje']] <= maximo:
+            visitar(nodo['derecho'])
+
+    visitar(indice['raiz'])
+    return encontrados
@@ -0,0 +1,329 @@
+"""
+Módulo de Historial de Población
+================================
+Este módulo guarda la población de cada país año por año, para no perder
+los valores anteriores cuando se actualiza un país.
+
+Cada serie guarda sus años y valores en dos columnas array codificadas por
+diferencias (cada elemento es la diferencia con el anterior), que ocupan
+mucho menos que una lista de enteros de Python. Cada INTERVALO_CONTROL
+registros se guarda además un punto de control con el año y el valor
+absolutos: para consultar un año se busca el punto de control con bisect y
+solo se acumulan las diferencias que siguen, como máximo INTERVALO_CONTROL.
+
+La población de un país en un año es el último valor registrado en ese año
+o antes.
+"""
+
+import csv
+import heapq
+import os
+from array import array
+from bisect import bisect_right
+from collections import ChainMap
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Mapping
+from .validacion import normalizar_texto_busqueda
+from .estadisticas import calcular_estadisticas_generales
+
+# Cada cuántos registros se guarda un punto de control con valores absolutos
+INTERVALO_CONTROL = 32
+
+# Columnas del archivo de historial (un registro por país y año)
+COLUMNAS_HISTORIAL = ['nombre', 'anio', 'poblacion']
+
+
+def crear_historial() -> Dict[str, Any]:
+    """
+    Crea un historial de población vacío.
+
+    Returns:
+        Dict[str, Any]: Historial con las series por nombre normalizado
+    """
+    return {'series': {}}
+
+
+def _crear_serie(nombre: str) -> Dict[str, Any]:
+    """Crea una serie vacía para un país."""
+    return {
+        'nombre': nombre,
+        'anios': array('i'),          # Diferencias entre años consecutivos
+        'valores': array('q'),        # Diferencias entre valores consecutivos
+        'control_anios': array('i'),  # Año absoluto cada INTERVALO_CONTROL registros
+        'control_valores': array('q'),
+        'ultimo_anio': None,
+        'ultimo_valor': 0,
+    }
+
+
+def _decodificar(serie: Dict[str, Any]) -> Iterator[Tuple[int, int]]:
+    """Recorre los pares (año, valor) absolutos de una serie."""
+    anio = valor = 0
+    for diferencia_anio, diferencia_valor in zip(serie['anios'], serie['valores']):
+        anio += diferencia_anio
+        valor += diferencia_valor
+        yield anio, valor
+
+
+def _agregar_al_final(serie: Dict[str, Any], anio: int, valor: int):
+    """Agrega un registro posterior al último de la serie."""
+    posicion = len(serie['anios'])
+    anterior_anio = serie['ultimo_anio'] if posicion else 0
+    serie['anios'].append(anio - anterior_anio)
+    serie['valores'].append(valor - serie['ultimo_valor'])
+    if posicion % INTERVALO_CONTROL == 0:
+        serie['control_anios'].append(anio)
+        serie['control_valores'].append(valor)
+    serie['ultimo_anio'] = anio
+    serie['ultimo_valor'] = valor
+
+
+def registrar_poblacion(historial: Dict[str, Any], nombre: str, anio: int, poblacion: int):
+    """
+    Registra la población de un país en un año.
+
+    Si el año ya estaba registrado se reemplaza su valor. Agregar años
+    posteriores al último es O(1); un año intermedio obliga a recodificar
+    la serie de ese país.
+
+    Args:
+        historial (Dict[str, Any]): Historial creado con crear_historial
+        nombre (str): Nombre del país
+        anio (int): Año del registro
+        poblacion (int): Población en ese año
+    """
+    clave = normalizar_texto_busqueda(nombre)
+    serie = historial['series'].get(clave)
+    if serie is None:
+        serie = historial['series'][clave] = _crear_serie(nombre.strip())
+
+    if serie['ultimo_anio'] is None or anio > serie['ultimo_anio']:
+        _agregar_al_final(serie, anio, poblacion)
+        return
+
+    if anio == serie['ultimo_anio']:
+        # Solo cambia la última diferencia (y el punto de control si es el último registro)
+        serie['valores'][-1] += poblacion - serie['ultimo_valor']
+        serie['ultimo_valor'] = poblacion
+        if (len(serie['anios']) - 1) % INTERVALO_CONTROL == 0:
+            serie['control_valores'][-1] = poblacion
+        return
+
+    registros = dict(_decodificar(serie))
+    registros[anio] = poblacion
+    nueva = _crear_serie(serie['nombre'])
+    for anio_registro in sorted(registros):
+        _agregar_al_final(nueva, anio_registro, registros[anio_registro])
+    historial['series'][clave] = nueva
+
+
+def tiene_registros(historial: Dict[str, Any], nombre: str) -> bool:
+    """
+    Indica si el historial tiene algún registro de un país.
+
+    Args:
+        historial (Dict[str, Any]): Historial de población
+        nombre (str): Nombre del país
+
+    Returns:
+        bool: True si el país tiene una serie en el historial
+    """
+    return normalizar_texto_busqueda(nombre) in historial['series']
+
+
+def _valor_en_serie(serie: Dict[str, Any], anio: int) -> Optional[int]:
+    """Último valor registrado en el año indicado o antes."""
+    bloque = bisect_right(serie['control_anios'], anio) - 1
+    if bloque < 0:
+        return None
+
+    inicio = bloque * INTERVALO_CONTROL
+    anio_actual = serie['control_anios'][bloque]
+    valor = serie['control_valores'][bloque]
+    anios = serie['anios']
+    valores = serie['valores']
+    for posicion in range(inicio + 1, min(inicio + INTERVALO_CONTROL, len(anios))):
+        anio_actual += anios[posicion]
+        if anio_actual > anio:
+            break
+        valor += valores[posicion]
+    return valor
+
+
+def poblacion_en_anio(historial: Dict[str, Any], nombre: str, anio: int) -> Optional[int]:
+    """
+    Obtiene la población de un país en un año.
+
+    Args:
+        historial (Dict[str, Any]): Historial de población
+        nombre (str): Nombre del país
+        anio (int): Año consultado
+
+    Returns:
+        Optional[int]: Último valor registrado en ese año o antes, o None si
+            no hay registros hasta ese año
+    """
+    serie = historial['series'].get(normalizar_texto_busqueda(nombre))
+    if serie is None:
+        return None
+    return _valor_en_serie(serie, anio)
+
+
+def _crecimiento(serie: Dict[str, Any], anio_inicio: int, anio_fin: int) -> Optional[Dict[str, Any]]:
+    """Crecimiento de una serie entre dos años."""
+    inicio = _valor_en_serie(serie, anio_inicio)
+    fin = _valor_en_serie(serie, anio_fin)
+    if inicio is None or fin is None:
+        return None
+    return {
+        'nombre': serie['nombre'],
+        'inicio': inicio,
+        'fin': fin,
+        'diferencia': fin - inicio,
+        'porcentaje': (fin - inicio) * 100 / inicio if inicio else 0.0,
+    }
+
+
+def crecimiento_entre_anios(historial: Dict[str, Any], nombre: str,
+                            anio_inicio: int, anio_fin: int) -> Optional[Dict[str, Any]]:
+    """
+    Calcula el crecimiento de la población de un país entre dos años.
+
+    Args:
+        historial (Dict[str, Any]): Historial de población
+        nombre (str): Nombre del país
+        anio_inicio (int): Año inicial
+        anio_fin (int): Año final
+
+    Returns:
+        Optional[Dict[str, Any]]: 'nombre', 'inicio', 'fin', 'diferencia' y
+            'porcentaje', o None si falta alguno de los dos valores
+    """
+    serie = historial['series'].get(normalizar_texto_busqueda(nombre))
+    if serie is None:
+        return None
+    return _crecimiento(serie, anio_inicio, anio_fin)
+
+
+def top_crecimiento(historial: Dict[str, Any], anio_inicio: int, anio_fin: int,
+                    cantidad: int, relativo: bool = True) -> List[Dict[str, Any]]:
+    """
+    Obtiene los países que más crecieron entre dos años.
+
+    Args:
+        historial (Dict[str, Any]): Historial de población
+        anio_inicio (int): Año inicial
+        anio_fin (int): Año final
+        cantidad (int): Cantidad de países a retornar
+        relativo (bool): Ordenar por porcentaje (True) o por diferencia absoluta
+
+    Returns:
+        List[Dict[str, Any]]: Crecimientos como en crecimiento_entre_anios,
+            de mayor a menor
+    """
+    if cantidad <= 0:
+        return []
+    criterio = 'porcentaje' if relativo else 'diferencia'
+    crecimientos = (_crecimiento(serie, anio_inicio, anio_fin)
+                    for serie in historial['series'].values())
+    return heapq.nlargest(cantidad, (c for c in crecimientos if c is not None),
+                          key=lambda c: c[criterio])
+
+
+def paises_en_anio(historial: Dict[str, Any], paises: List[Dict[str, Any]],
+                   anio: int) -> List[Mapping[str, Any]]:
+    """
+    Obtiene la lista de países con la población que tenían en un año.
+
+    Los países no se copian: cada uno se envuelve en un ChainMap que solo
+    reemplaza 'poblacion' (y 'densidad', si el país la tiene).
+
+    Args:
+        historial (Dict[str, Any]): Historial de población
+        paises (List[Dict[str, Any]]): Lista de países
+        anio (int): Año consultado
+
+    Returns:
+        List[Mapping[str, Any]]: Países con registros hasta ese año
+    """
+    series = historial['series']
+    resultado = []
+    for pais in paises:
+        serie = series.get(normalizar_texto_busqueda(pais['nombre']))
+        valor = _valor_en_serie(serie, anio) if serie is not None else None
+        if valor is None:
+            continue
+        cambios = {'poblacion': valor}
+        if 'densidad' in pais:
+            cambios['densidad'] = valor / pais['superficie'] if pais['superficie'] else 0.0
+        resultado.append(ChainMap(cambios, pais))
+    return resultado
+
+
+def estadisticas_en_anio(historial: Dict[str, Any], paises: List[Dict[str, Any]],
+                         anio: int) -> Dict[str, Any]:
+    """
+    Calcula las estadísticas generales con la población de un año.
+
+    Args:
+        historial (Dict[str, Any]): Historial de población
+        paises (List[Dict[str, Any]]): Lista de países
+        anio (int): Año consultado
+
+    Returns:
+        Dict[str, Any]: Estadísticas como en calcular_estadisticas_generales,
+            sobre los países con registros hasta ese año
+    """
+    return calcular_estadisticas_generales(paises_en_anio(historial, paises, anio))
+
+
+def cargar_historial_csv(ruta_archivo: str) -> Dict[str, Any]:
+    """
+    Carga un historial desde un CSV con las columnas nombre, anio y poblacion.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo; si no existe se devuelve un historial vacío
+
+    Returns:
+        Dict[str, Any]: Historial de población
+    """
+    historial = crear_historial()
+    if not os.path.exists(ruta_archivo):
+        return historial
+
+    with open(ruta_archivo, 'r', encoding='utf-8', newline='') as archivo:
+        for numero_fila, fila in enumerate(csv.DictReader(archivo), start=2):
+            try:
+                registrar_poblacion(historial, fila['nombre'], int(fila['anio']),
+                                    int(fila['poblacion'].replace(',', '')))
+            except (ValueError, AttributeError, KeyError):
+                print(f"⚠️ Fila {numero_fila} del historial inválida, se omite")
+    return historial
+
+
+def guardar_historial_csv(historial: Dict[str, Any], ruta_archivo: str) -> bool:
+    """
+    Guarda el historial en un CSV con un registro por país y año.
+
+    Args:
+        historial (Dict[str, Any]): Historial de población
+        ruta_archivo (str): Ruta al archivo
+
+    Returns:
+        bool: True si el guardado fue exitoso, False en caso contrario
+    """
+    try:
+        directorio = os.path.dirname(ruta_archivo)
+        if directorio and not os.path.exists(directorio):
+            os.makedirs(directorio)
+
+        with open(ruta_archivo, 'w', encoding='utf-8', newline='') as archivo:
+            escritor_csv = csv.writer(archivo)
+            escritor_csv.writerow(COLUMNAS_HISTORIAL)
+            for serie in historial['series'].values():
+                for anio, valor in _decodificar(serie):
+                    escritor_csv.writerow([serie['nombre'], anio, valor])
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al guardar el historial: {e}")
+        return False
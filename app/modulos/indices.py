@@ -0,0 +1,367 @@
+"""
+Módulo de Índices
+=================
+Este módulo contiene estructuras auxiliares que indexan los nombres de los
+países para acelerar las búsquedas sin recorrer toda la lista.
+"""
+
+from typing import List, Dict, Any, Optional
+from .validacion import normalizar_texto_busqueda
+
+
+def distancia_edicion(texto_a: str, texto_b: str) -> int:
+    """
+    Calcula la distancia de Levenshtein entre dos textos.
+
+    Args:
+        texto_a (str): Primer texto
+        texto_b (str): Segundo texto
+
+    Returns:
+        int: Cantidad mínima de inserciones, borrados o reemplazos
+    """
+    if texto_a == texto_b:
+        return 0
+    if len(texto_a) < len(texto_b):
+        texto_a, texto_b = texto_b, texto_a
+    if not texto_b:
+        return len(texto_a)
+
+    # Solo se mantiene la fila anterior de la matriz de distancias
+    fila_anterior = list(range(len(texto_b) + 1))
+    for i, caracter_a in enumerate(texto_a, 1):
+        fila_actual = [i]
+        for j, caracter_b in enumerate(texto_b, 1):
+            costo = 0 if caracter_a == caracter_b else 1
+            fila_actual.append(min(
+                fila_anterior[j] + 1,          # Borrado
+                fila_actual[j - 1] + 1,        # Inserción
+                fila_anterior[j - 1] + costo,  # Reemplazo
+            ))
+        fila_anterior = fila_actual
+
+    return fila_anterior[-1]
+
+
+def crear_indice_difuso(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Crea un árbol BK sobre los nombres normalizados de los países.
+
+    Cada nodo guarda un nombre normalizado y sus hijos indexados por la
+    distancia de edición al nodo, lo que permite descartar ramas enteras
+    durante la búsqueda gracias a la desigualdad triangular.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+
+    Returns:
+        Dict[str, Any]: Índice con la raíz del árbol y los países por nombre
+    """
+    indice = {'raiz': None, 'paises': {}}
+    for pais in paises:
+        agregar_a_indice_difuso(indice, pais)
+    return indice
+
+
+def agregar_a_indice_difuso(indice: Dict[str, Any], pais: Dict[str, Any]):
+    """
+    Agrega un país al árbol BK de forma incremental.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_difuso
+        pais (Dict[str, Any]): País a agregar
+    """
+    nombre = normalizar_texto_busqueda(pais['nombre'])
+    if not nombre:
+        return
+
+    # Varios países pueden compartir el mismo nombre normalizado (y un nombre
+    # eliminado conserva su nodo en el árbol con la lista vacía)
+    if nombre in indice['paises']:
+        indice['paises'][nombre].append(pais)
+        return
+    indice['paises'][nombre] = [pais]
+
+    nuevo_nodo = {'nombre': nombre, 'hijos': {}}
+    if indice['raiz'] is None:
+        indice['raiz'] = nuevo_nodo
+        return
+
+    nodo = indice['raiz']
+    while True:
+        distancia = distancia_edicion(nombre, nodo['nombre'])
+        hijo = nodo['hijos'].get(distancia)
+        if hijo is None:
+            nodo['hijos'][distancia] = nuevo_nodo
+            return
+        nodo = hijo
+
+
+def eliminar_de_indice_difuso(indice: Dict[str, Any], pais: Dict[str, Any]) -> bool:
+    """
+    Quita un país del árbol BK.
+
+    El nodo del nombre permanece en el árbol (quitarlo obligaría a reinsertar
+    todo su subárbol) y las búsquedas lo ignoran mientras no tenga países.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_difuso
+        pais (Dict[str, Any]): País a quitar
+
+    Returns:
+        bool: True si el país estaba en el índice
+    """
+    lista = indice['paises'].get(normalizar_texto_busqueda(pais['nombre']), [])
+    for posicion, existente in enumerate(lista):
+        if existente is pais:
+            del lista[posicion]
+            return True
+    return False
+
+
+def buscar_similares(indice: Dict[str, Any], nombre: str, cantidad: int = 5,
+                     distancia_maxima: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Busca los países cuyo nombre es más parecido al texto ingresado.
+
+    Args:
+        indice (Dict[str, Any]): Índice creado con crear_indice_difuso
+        nombre (str): Nombre a buscar (puede contener errores de tipeo)
+        cantidad (int): Cantidad máxima de resultados
+        distancia_maxima (int, optional): Distancia de edición tolerada.
+            Por defecto se admite un error cada cuatro caracteres.
+
+    Returns:
+        List[Dict[str, Any]]: Países encontrados, del más al menos parecido
+    """
+    nombre_busqueda = normalizar_texto_busqueda(nombre)
+    if not nombre_busqueda or indice['raiz'] is None or cantidad <= 0:
+        return []
+
+    if distancia_maxima is None:
+        distancia_maxima = max(1, len(nombre_busqueda) // 4)
+
+    candidatos = []  # Tuplas (distancia, nombre normalizado)
+    radio = distancia_maxima
+    pendientes = [indice['raiz']]
+
+    while pendientes:
+        nodo = pendientes.pop()
+        distancia = distancia_edicion(nombre_busqueda, nodo['nombre'])
+
+        if distancia <= radio and indice['paises'][nodo['nombre']]:
+            candidatos.append((distancia, nodo['nombre']))
+            # Con suficientes candidatos el radio se achica al peor de ellos
+            if len(candidatos) >= cantidad:
+                candidatos.sort()
+                del candidatos[cantidad:]
+                radio = candidatos[-1][0]
+
+        # Solo pueden contener coincidencias los hijos en [d - radio, d + radio]
+        for distancia_hijo, hijo in nodo['hijos'].items():
+            if distancia - radio <= distancia_hijo <= distancia + radio:
+                pendientes.append(hijo)
+
+    candidatos.sort()
+    resultados = []
+    for _, nombre_normalizado in candidatos:
+        resultados.extend(indice['paises'][nombre_normalizado])
+
+    return resultados[:cantidad]
+
+
+# Cantidad de sugerencias que cada nodo del trie mantiene precalculadas
+MAX_SUGERENCIAS_POR_NODO = 10
+
+
+def _crear_nodo_trie(etiqueta: str = '') -> Dict[str, Any]:
+    """Crea un nodo vacío del trie de nombres."""
+    return {'etiqueta': etiqueta, 'hijos': {}, 'paises': [], 'top': []}
+
+
+def _recalcular_top(nodo: Dict[str, Any]):
+    """
+    Recalcula los países más poblados del subárbol de un nodo.
+
+    Solo combina los países que terminan en el nodo con los 'top' ya
+    calculados de sus hijos, sin recorrer el subárbol completo.
+    """
+    candidatos = list(nodo['paises'])
+    for hijo in nodo['hijos'].values():
+        candidatos.extend(hijo['top'])
+    candidatos.sort(key=lambda p: p['poblacion'], reverse=True)
+    nodo['top'] = candidatos[:MAX_SUGERENCIAS_POR_NODO]
+
+
+def _camino_en_trie(trie: Dict[str, Any], nombre: str) -> List[Dict[str, Any]]:
+    """
+    Obtiene los nodos recorridos desde la raíz hasta un nombre completo.
+
+    Returns:
+        List[Dict[str, Any]]: Nodos del camino o lista vacía si no existe
+    """
+    nodo = trie['raiz']
+    camino = [nodo]
+    resto = nombre
+    while resto:
+        hijo = nodo['hijos'].get(resto[0])
+        if hijo is None or not resto.startswith(hijo['etiqueta']):
+            return []
+        resto = resto[len(hijo['etiqueta']):]
+        nodo = hijo
+        camino.append(nodo)
+    return camino
+
+
+def crear_trie_nombres(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Crea un trie compacto (radix) sobre los nombres normalizados.
+
+    Cada arista guarda una cadena completa en lugar de un único carácter y
+    cada nodo conserva los países más poblados de su subárbol, de modo que
+    autocompletar un prefijo no necesita recorrer las hojas.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+
+    Returns:
+        Dict[str, Any]: Trie con su nodo raíz
+    """
+    trie = {'raiz': _crear_nodo_trie()}
+    for pais in paises:
+        agregar_a_trie(trie, pais)
+    return trie
+
+
+def agregar_a_trie(trie: Dict[str, Any], pais: Dict[str, Any]):
+    """
+    Agrega un país al trie de nombres de forma incremental.
+
+    Args:
+        trie (Dict[str, Any]): Trie creado con crear_trie_nombres
+        pais (Dict[str, Any]): País a agregar
+    """
+    nombre = normalizar_texto_busqueda(pais['nombre'])
+    if not nombre:
+        return
+
+    nodo = trie['raiz']
+    camino = [nodo]
+    resto = nombre
+
+    while resto:
+        hijo = nodo['hijos'].get(resto[0])
+        if hijo is None:
+            hoja = _crear_nodo_trie(resto)
+            nodo['hijos'][resto[0]] = hoja
+            nodo = hoja
+            camino.append(nodo)
+            break
+
+        etiqueta = hijo['etiqueta']
+        comun = 0
+        while comun < min(len(etiqueta), len(resto)) and etiqueta[comun] == resto[comun]:
+            comun += 1
+
+        if comun < len(etiqueta):
+            # Dividir la arista en el punto donde los nombres se separan
+            intermedio = _crear_nodo_trie(etiqueta[:comun])
+            hijo['etiqueta'] = etiqueta[comun:]
+            intermedio['hijos'][hijo['etiqueta'][0]] = hijo
+            intermedio['top'] = list(hijo['top'])
+            nodo['hijos'][resto[0]] = intermedio
+            hijo = intermedio
+
+        nodo = hijo
+        camino.append(nodo)
+        resto = resto[comun:]
+
+    nodo['paises'].append(pais)
+    for nodo_camino in reversed(camino):
+        _recalcular_top(nodo_camino)
+
+
+def actualizar_en_trie(trie: Dict[str, Any], pais: Dict[str, Any]):
+    """
+    Reordena las sugerencias del trie luego de cambiar la población de un país.
+
+    Args:
+        trie (Dict[str, Any]): Trie creado con crear_trie_nombres
+        pais (Dict[str, Any]): País cuya población fue modificada
+    """
+    camino = _camino_en_trie(trie, normalizar_texto_busqueda(pais['nombre']))
+    for nodo in reversed(camino):
+        _recalcular_top(nodo)
+
+
+def eliminar_de_trie(trie: Dict[str, Any], pais: Dict[str, Any]) -> bool:
+    """
+    Quita un país del trie y actualiza las sugerencias de su camino.
+
+    Args:
+        trie (Dict[str, Any]): Trie creado con crear_trie_nombres
+        pais (Dict[str, Any]): País a quitar
+
+    Returns:
+        bool: True si el país estaba en el trie
+    """
+    camino = _camino_en_trie(trie, normalizar_texto_busqueda(pais['nombre']))
+    if not camino:
+        return False
+
+    paises_nodo = camino[-1]['paises']
+    for posicion, existente in enumerate(paises_nodo):
+        if existente is pais:
+            del paises_nodo[posicion]
+            break
+    else:
+        return False
+
+    for nodo in reversed(camino):
+        _recalcular_top(nodo)
+    return True
+
+
+def autocompletar_nombre(trie: Dict[str, Any], prefijo: str,
+                         cantidad: int = MAX_SUGERENCIAS_POR_NODO) -> List[Dict[str, Any]]:
+    """
+    Obtiene los países cuyo nombre comienza con un prefijo.
+
+    Args:
+        trie (Dict[str, Any]): Trie creado con crear_trie_nombres
+        prefijo (str): Comienzo del nombre (sin importar acentos ni mayúsculas)
+        cantidad (int): Cantidad máxima de sugerencias
+
+    Returns:
+        List[Dict[str, Any]]: Países ordenados de mayor a menor población
+    """
+    if cantidad <= 0:
+        return []
+
+    nodo = trie['raiz']
+    resto = normalizar_texto_busqueda(prefijo)
+    while resto:
+        hijo = nodo['hijos'].get(resto[0])
+        if hijo is None:
+            return []
+        etiqueta = hijo['etiqueta']
+        if resto.startswith(etiqueta):
+            resto = resto[len(etiqueta):]
+        elif not etiqueta.startswith(resto):
+            return []
+        else:
+            resto = ''
+        nodo = hijo
+
+    if cantidad <= MAX_SUGERENCIAS_POR_NODO:
+        return nodo['top'][:cantidad]
+
+    # Se piden más sugerencias de las precalculadas: recorrer el subárbol
+    encontrados = []
+    pendientes = [nodo]
+    while pendientes:
+        actual = pendientes.pop()
+        encontrados.extend(actual['paises'])
+        pendientes.extend(actual['hijos'].values())
+    encontrados.sort(key=lambda p: p['poblacion'], reverse=True)
+    return encontrados[:cantidad]
@@ -0,0 +1,477 @@
+"""
+Módulo de Muestreo
+==================
+Este módulo estima estadísticas sobre conjuntos de datos muy grandes a
+partir de una muestra aleatoria, con intervalos de confianza, en lugar de
+recorrer todos los países.
+
+La muestra se arma en la misma pasada de la carga: hay un reservorio por
+estrato (por defecto, por continente) y cada uno guarda a lo sumo `tamano`
+países elegidos al azar de forma uniforme, sin conocer de antemano cuántos
+hay (algoritmo L de reservorio, que solo sortea cuando toca reemplazar).
+Los estimadores ponderan cada estrato por la cantidad de países que tiene
+(estimador estratificado, con corrección por población finita):
+
+- Media y total: intervalo normal con el error estándar estratificado.
+- Desviación estándar: media estratificada de los desvíos al cuadrado,
+  intervalo por método delta en escala logarítmica.
+- Correlación de Pearson: error por linealización, intervalo en la escala
+  z de Fisher.
+- Percentiles: cuantil de la muestra ponderada e intervalo de Woodruff.
+
+Si todos los estratos entran completos en la muestra, las estimaciones
+coinciden con los valores exactos y los intervalos se reducen al valor.
+Los intervalos de medias, totales y percentiles se acercan al nivel pedido.
+Los de la desviación y la correlación se apoyan en momentos de cuarto orden,
+que con distribuciones de colas pesadas (como la población) la muestra
+subestima: cubren el valor exacto con menos frecuencia que el nivel nominal
+(ver benchmarks/benchmark_muestreo.py). Para esos valores conviene pedir el
+modo exacto.
+
+Uso desde la línea de comandos (la muestra se arma leyendo el archivo de a
+bloques; --exacto, en cambio, lo carga completo):
+    python -m modulos.muestreo data/paises.csv --tamano 2000
+    python -m modulos.muestreo data/paises.csv --exacto
+"""
+
+import math
+import random
+import argparse
+from bisect import bisect_left
+from statistics import NormalDist
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from .carga_datos import iterar_paises_csv
+from .estadisticas import calcular_estadisticas_generales, calcular_correlacion_poblacion_superficie
+from .cuantiles import calcular_percentiles
+
+# Países por estrato que se guardan en la muestra
+TAMANO_MUESTRA = 1000
+
+# Nivel de confianza de los intervalos
+NIVEL_CONFIANZA = 0.95
+
+# Percentiles de población que se estiman en el resumen general
+PERCENTILES_RESUMEN = (10, 50, 90)
+
+Estimacion = Dict[str, float]
+
+
+def crear_muestra(tamano: int = TAMANO_MUESTRA, estratificar: Optional[str] = 'continente',
+                  semilla: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Crea una muestra vacía.
+
+    Args:
+        tamano (int): Países que guarda como máximo cada estrato
+        estratificar (str, optional): Campo que define los estratos, o None
+            para un único reservorio con todos los países
+        semilla (int, optional): Semilla del sorteo, para repetir la muestra
+
+    Returns:
+        Dict[str, Any]: Muestra con sus estratos ({valor: reservorio})
+    """
+    if tamano < 2:
+        raise ValueError(f"La muestra necesita al menos 2 países por estrato: {tamano}")
+    return {
+        'tamano': tamano,
+        'estratificar': estratificar,
+        'estratos': {},
+        'aleatorio': random.Random(semilla),
+    }
+
+
+def _uniforme_abierto(aleatorio: random.Random) -> float:
+    """Número al azar en el intervalo abierto (0, 1)."""
+    valor = aleatorio.random()
+    while valor == 0.0:
+        valor = aleatorio.random()
+    return valor
+
+
+def _sortear_salto(estrato: Dict[str, Any], aleatorio: random.Random, tamano: int):
+    """Actualiza el peso del reservorio y la posición del próximo reemplazo (algoritmo L)."""
+    estrato['peso'] *= math.exp(math.log(_uniforme_abierto(aleatorio)) / tamano)
+    salto = math.floor(math.log(_uniforme_abierto(aleatorio)) / math.log(1 - estrato['peso']))
+    estrato['siguiente'] = estrato['vistos'] + salto + 1
+
+
+def _estrato(muestra: Dict[str, Any], pais: Dict[str, Any]) -> Dict[str, Any]:
+    """Reservorio del estrato al que pertenece un país (se crea si no existe)."""
+    clave = pais[muestra['estratificar']] if muestra['estratificar'] else None
+    estrato = muestra['estratos'].get(clave)
+    if estrato is None:
+        estrato = muestra['estratos'][clave] = {'paises': [], 'vistos': 0, 'peso': 1.0, 'siguiente': 0}
+    return estrato
+
+
+def _ubicar_en_estrato(muestra: Dict[str, Any], estrato: Dict[str, Any], pais: Dict[str, Any]):
+    """Guarda en el reservorio un país ya contado, si le toca entrar."""
+    tamano = muestra['tamano']
+    if estrato['vistos'] <= tamano:
+        estrato['paises'].append(pais)
+        if estrato['vistos'] == tamano:
+            _sortear_salto(estrato, muestra['aleatorio'], tamano)
+    elif estrato['vistos'] == estrato['siguiente']:
+        estrato['paises'][muestra['aleatorio'].randrange(tamano)] = pais
+        _sortear_salto(estrato, muestra['aleatorio'], tamano)
+
+
+def agregar_a_muestra(muestra: Dict[str, Any], pais: Dict[str, Any]):
+    """
+    Considera un país para la muestra.
+
+    Cada país visto (incluidos los que no quedan en la muestra) se cuenta en
+    su estrato, porque esa cantidad pondera las estimaciones.
+
+    Args:
+        muestra (Dict[str, Any]): Muestra creada con crear_muestra
+        pais (Dict[str, Any]): País a considerar
+    """
+    estrato = _estrato(muestra, pais)
+    estrato['vistos'] += 1
+    _ubicar_en_estrato(muestra, estrato, pais)
+
+
+def muestrear_paises(paises: Iterable[Dict[str, Any]], tamano: int = TAMANO_MUESTRA,
+                     estratificar: Optional[str] = 'continente',
+                     semilla: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Arma una muestra recorriendo los países una sola vez.
+
+    Acepta cualquier iterable (por ejemplo iterar_paises_csv), de modo que
+    solo los países de la muestra quedan en memoria.
+    """
+    muestra = crear_muestra(tamano, estratificar, semilla)
+    estratos = muestra['estratos']
+    for pais in paises:
+        estrato = estratos.get(pais[estratificar] if estratificar else None) or _estrato(muestra, pais)
+        estrato['vistos'] = vistos = estrato['vistos'] + 1
+        # Con el reservorio lleno, la mayoría de los países se saltea sin sortear
+        if vistos > tamano and vistos != estrato['siguiente']:
+            continue
+        _ubicar_en_estrato(muestra, estrato, pais)
+    return muestra
+
+
+def muestrear_csv(ruta_archivo: str, tamano: int = TAMANO_MUESTRA,
+                  estratificar: Optional[str] = 'continente', semilla: Optional[int] = None,
+                  errores: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Arma una muestra leyendo un CSV de a bloques, sin cargarlo completo.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo CSV
+        tamano (int): Países que guarda como máximo cada estrato
+        estratificar (str, optional): Campo que define los estratos, o None
+        semilla (int, optional): Semilla del sorteo
+        errores (List[Dict[str, Any]], optional): Lista donde se agregan las
+            filas inválidas (ver iterar_paises_csv)
+
+    Returns:
+        Dict[str, Any]: Muestra de los países válidos del archivo
+    """
+    return muestrear_paises(iterar_paises_csv(ruta_archivo, errores), tamano, estratificar, semilla)
+
+
+def contar_muestra(muestra: Dict[str, Any]) -> Tuple[int, int]:
+    """Devuelve (países en la muestra, países vistos en total)."""
+    estratos = muestra['estratos'].values()
+    return sum(len(estrato['paises']) for estrato in estratos), sum(estrato['vistos'] for estrato in estratos)
+
+
+def es_exacta(muestra: Dict[str, Any]) -> bool:
+    """Indica si la muestra contiene a todos los países vistos."""
+    return all(len(estrato['paises']) == estrato['vistos'] for estrato in muestra['estratos'].values())
+
+
+def _valor_critico(nivel: float) -> float:
+    """Valor z de la normal para un intervalo de confianza bilateral."""
+    if not 0 < nivel < 1:
+        raise ValueError(f"El nivel de confianza debe estar entre 0 y 1: {nivel}")
+    return NormalDist().inv_cdf(0.5 + nivel / 2)
+
+
+def _media_estratificada(estratos: List[Tuple[int, List[float]]]) -> Tuple[float, float]:
+    """
+    Estimador estratificado de la media poblacional.
+
+    Args:
+        estratos (List[Tuple[int, List[float]]]): (países en el estrato,
+            valores de la muestra del estrato) por estrato
+
+    Returns:
+        Tuple[float, float]: (media estimada, varianza de la estimación)
+    """
+    total = sum(vistos for vistos, _ in estratos)
+    media = varianza = 0.0
+    for vistos, valores in estratos:
+        n = len(valores)
+        fraccion = vistos / total
+        media_estrato = sum(valores) / n
+        media += fraccion * media_estrato
+        if n < vistos:  # Un estrato completo no aporta error
+            cuasivarianza = sum((valor - media_estrato) ** 2 for valor in valores) / (n - 1)
+            varianza += fraccion ** 2 * (1 - n / vistos) * cuasivarianza / n
+    return media, varianza
+
+
+def _valores(muestra: Dict[str, Any], campo: str) -> List[Tuple[int, List[float]]]:
+    """Valores de un campo en cada estrato, con la cantidad de países del estrato."""
+    return [(estrato['vistos'], [pais[campo] for pais in estrato['paises']])
+            for estrato in muestra['estratos'].values()]
+
+
+def _intervalo(valor: float, varianza: float, z: float) -> Estimacion:
+    """Estimación con su intervalo normal."""
+    margen = z * math.sqrt(varianza)
+    return {'valor': valor, 'inferior': valor - margen, 'superior': valor + margen}
+
+
+def estimar_media(muestra: Dict[str, Any], campo: str,
+                  nivel: float = NIVEL_CONFIANZA) -> Optional[Estimacion]:
+    """
+    Estima la media de un campo numérico.
+
+    Returns:
+        Optional[Estimacion]: {'valor', 'inferior', 'superior'}, o None si
+            la muestra está vacía
+    """
+    if not muestra['estratos']:
+        return None
+    return _intervalo(*_media_estratificada(_valores(muestra, campo)), _valor_critico(nivel))
+
+
+def estimar_total(muestra: Dict[str, Any], campo: str,
+                  nivel: float = NIVEL_CONFIANZA) -> Optional[Estimacion]:
+    """Estima la suma de un campo numérico sobre todos los países."""
+    media = estimar_media(muestra, campo, nivel)
+    if media is None:
+        return None
+    vistos = contar_muestra(muestra)[1]
+    return {clave: valor * vistos for clave, valor in media.items()}
+
+
+def _desvios_cuadrados(estratos: List[Tuple[int, List[float]]], media: float) -> List[Tuple[int, List[float]]]:
+    """Reemplaza cada valor por su desvío al cuadrado respecto de la media."""
+    return [(vistos, [(valor - media) ** 2 for valor in valores]) for vistos, valores in estratos]
+
+
+def estimar_desviacion(muestra: Dict[str, Any], campo: str,
+                       nivel: float = NIVEL_CONFIANZA) -> Optional[Estimacion]:
+    """
+    Estima la desviación estándar poblacional de un campo numérico.
+
+    La varianza es la media de los desvíos al cuadrado, por lo que se estima
+    (con su error) como una media más. El intervalo sale del método delta en
+    escala logarítmica, Var(log s) ≈ Var(s²) / (4 s⁴): queda asimétrico, como
+    la distribución de s, y nunca incluye valores negativos.
+    """
+    if not muestra['estratos']:
+        return None
+    estratos = _valores(muestra, campo)
+    media, _ = _media_estratificada(estratos)
+    varianza, varianza_estimacion = _media_estratificada(_desvios_cuadrados(estratos, media))
+    if varianza <= 0:
+        return {'valor': 0.0, 'inferior': 0.0, 'superior': 0.0}
+    desviacion = math.sqrt(varianza)
+    margen = _valor_critico(nivel) * math.sqrt(varianza_estimacion) / (2 * varianza)
+    return {'valor': desviacion, 'inferior': desviacion * math.exp(-margen),
+            'superior': desviacion * math.exp(margen)}
+
+
+def estimar_correlacion(muestra: Dict[str, Any], campo_x: str = 'poblacion',
+                        campo_y: str = 'superficie',
+                        nivel: float = NIVEL_CONFIANZA) -> Optional[Estimacion]:
+    """
+    Estima el coeficiente de correlación de Pearson entre dos campos.
+
+    El error se obtiene linealizando r (cada país aporta su término de la
+    derivada de r respecto de las medias, varianzas y covarianza), de modo
+    que no supone datos normales; el intervalo se arma en la escala z de
+    Fisher para que quede dentro de [-1, 1].
+    """
+    if contar_muestra(muestra)[0] < 2:
+        return None
+    x = _valores(muestra, campo_x)
+    y = _valores(muestra, campo_y)
+    media_x, _ = _media_estratificada(x)
+    media_y, _ = _media_estratificada(y)
+    desvios = [(vistos, [a - media_x for a in valores_x], [b - media_y for b in valores_y])
+               for (vistos, valores_x), (_, valores_y) in zip(x, y)]
+    covarianza, _ = _media_estratificada([(vistos, [a * b for a, b in zip(dx, dy)]) for vistos, dx, dy in desvios])
+    varianza_x, _ = _media_estratificada([(vistos, [a * a for a in dx]) for vistos, dx, _ in desvios])
+    varianza_y, _ = _media_estratificada([(vistos, [b * b for b in dy]) for vistos, _, dy in desvios])
+    if varianza_x <= 0 or varianza_y <= 0:
+        return {'valor': 0.0, 'inferior': 0.0, 'superior': 0.0}
+
+    desviacion_x, desviacion_y = math.sqrt(varianza_x), math.sqrt(varianza_y)
+    correlacion = max(-1.0, min(1.0, covarianza / (desviacion_x * desviacion_y)))
+    _, varianza = _media_estratificada([
+        (vistos, [(a * b - correlacion / 2 * (a * a * desviacion_y / desviacion_x
+                                               + b * b * desviacion_x / desviacion_y))
+                  / (desviacion_x * desviacion_y) for a, b in zip(dx, dy)])
+        for vistos, dx, dy in desvios
+    ])
+    acotada = max(-0.999999, min(0.999999, correlacion))
+    margen = _valor_critico(nivel) * math.sqrt(varianza) / (1 - acotada ** 2)
+    z = math.atanh(acotada)
+    return {'valor': correlacion, 'inferior': math.tanh(z - margen), 'superior': math.tanh(z + margen)}
+
+
+def _muestra_ponderada(muestra: Dict[str, Any], campo: str) -> Tuple[List[float], List[float], List[Tuple[int, List[float]]]]:
+    """
+    Ordena los valores de la muestra y ubica cada uno en el orden de la población.
+
+    Cada país de la muestra representa a vistos / muestreados países de su
+    estrato; se lo ubica en el centro de las posiciones que representa, de
+    modo que con pesos 1 las posiciones son 0, 1, ..., n - 1.
+
+    Returns:
+        Tuple: (valores ordenados, posición de cada uno, valores por estrato)
+    """
+    estratos = _valores(muestra, campo)
+    ponderados = sorted((valor, vistos / len(valores)) for vistos, valores in estratos for valor in valores)
+    valores, posiciones = [], []
+    acumulado = 0.0
+    for valor, peso in ponderados:
+        valores.append(valor)
+        posiciones.append(acumulado + (peso - 1) / 2)
+        acumulado += peso
+    return valores, posiciones, estratos
+
+
+def _cuantil_ponderado(valores: List[float], posiciones: List[float], objetivo: float) -> float:
+    """Interpola linealmente el valor que ocupa una posición de la población."""
+    j = bisect_left(posiciones, objetivo)
+    if j == 0:
+        return valores[0]
+    if j == len(valores):
+        return valores[-1]
+    inferior, superior = posiciones[j - 1], posiciones[j]
+    return valores[j - 1] + (valores[j] - valores[j - 1]) * (objetivo - inferior) / (superior - inferior)
+
+
+def estimar_percentiles(muestra: Dict[str, Any], campo: str, percentiles: Iterable[float],
+                        nivel: float = NIVEL_CONFIANZA) -> Dict[float, Estimacion]:
+    """
+    Estima percentiles de un campo numérico (entre 0 y 100).
+
+    Con pesos iguales coincide con calcular_percentiles (interpolación
+    lineal). El intervalo es el de Woodruff: se estima el error de la
+    proporción de países por debajo del percentil y se traduce a valores.
+
+    Returns:
+        Dict[float, Estimacion]: Estimación de cada percentil pedido
+    """
+    if not muestra['estratos']:
+        return {}
+    valores, posiciones, estratos = _muestra_ponderada(muestra, campo)
+    ultima = contar_muestra(muestra)[1] - 1
+    z = _valor_critico(nivel)
+
+    resultado = {}
+    for percentil in percentiles:
+        proporcion = percentil / 100
+        valor = _cuantil_ponderado(valores, posiciones, proporcion * ultima)
+        _, varianza = _media_estratificada([
+            (vistos, [1.0 if dato <= valor else 0.0 for dato in datos]) for vistos, datos in estratos
+        ])
+        margen = z * math.sqrt(varianza)
+        resultado[percentil] = {
+            'valor': valor,
+            'inferior': _cuantil_ponderado(valores, posiciones, max(proporcion - margen, 0.0) * ultima),
+            'superior': _cuantil_ponderado(valores, posiciones, min(proporcion + margen, 1.0) * ultima),
+        }
+    return resultado
+
+
+def estimar_estadisticas_generales(muestra: Dict[str, Any],
+                                   nivel: float = NIVEL_CONFIANZA) -> Dict[str, Any]:
+    """
+    Estima las estadísticas generales de calcular_estadisticas_generales.
+
+    Los totales, promedios y desviaciones son estimaciones con intervalo;
+    la cantidad de países es exacta. Se agregan la correlación entre
+    población y superficie y los PERCENTILES_RESUMEN de población.
+
+    Returns:
+        Dict[str, Any]: Estimaciones, o un diccionario vacío si no hay países
+    """
+    if not muestra['estratos']:
+        return {}
+    muestreados, vistos = contar_muestra(muestra)
+    return {
+        'total_paises': vistos,
+        'tamano_muestra': muestreados,
+        'nivel': nivel,
+        'exacta': es_exacta(muestra),
+        'poblacion_total': estimar_total(muestra, 'poblacion', nivel),
+        'superficie_total': estimar_total(muestra, 'superficie', nivel),
+        'poblacion_promedio': estimar_media(muestra, 'poblacion', nivel),
+        'superficie_promedio': estimar_media(muestra, 'superficie', nivel),
+        'desviacion_poblacion': estimar_desviacion(muestra, 'poblacion', nivel),
+        'desviacion_superficie': estimar_desviacion(muestra, 'superficie', nivel),
+        'correlacion_poblacion_superficie': estimar_correlacion(muestra, 'poblacion', 'superficie', nivel),
+        'percentiles_poblacion': estimar_percentiles(muestra, 'poblacion', PERCENTILES_RESUMEN, nivel),
+    }
+
+
+def calcular_estadisticas_exactas(paises: List[Dict[str, Any]],
+                                  nivel: float = NIVEL_CONFIANZA) -> Dict[str, Any]:
+    """
+    Calcula con todos los países las estadísticas de estimar_estadisticas_generales.
+
+    Es el modo exacto: devuelve la misma estructura, con intervalos de ancho
+    cero, para poder mostrar ambos resultados de la misma manera.
+    """
+    estadisticas = calcular_estadisticas_generales(paises)
+    if not estadisticas:
+        return {}
+
+    def exacta(valor: float) -> Estimacion:
+        return {'valor': valor, 'inferior': valor, 'superior': valor}
+
+    percentiles = calcular_percentiles([pais['poblacion'] for pais in paises], list(PERCENTILES_RESUMEN))
+    resultado = {
+        'total_paises': len(paises),
+        'tamano_muestra': len(paises),
+        'nivel': nivel,
+        'exacta': True,
+        'correlacion_poblacion_superficie': exacta(calcular_correlacion_poblacion_superficie(paises)),
+        'percentiles_poblacion': {percentil: exacta(valor) for percentil, valor in percentiles.items()},
+    }
+    for clave in ('poblacion_total', 'superficie_total', 'poblacion_promedio', 'superficie_promedio',
+                  'desviacion_poblacion', 'desviacion_superficie'):
+        resultado[clave] = exacta(estadisticas[clave])
+    return resultado
+
+
+if __name__ == '__main__':
+    from .presentacion import mostrar_estimaciones
+
+    parser = argparse.ArgumentParser(
+        description="Estadísticas aproximadas de un CSV de países a partir de una muestra")
+    parser.add_argument('archivo', help="CSV de países")
+    parser.add_argument('--tamano', type=int, default=TAMANO_MUESTRA,
+                        help=f"Países por estrato en la muestra (por defecto {TAMANO_MUESTRA})")
+    parser.add_argument('--sin-estratos', action='store_true', dest='sin_estratos',
+                        help="Usar un único reservorio en lugar de uno por continente")
+    parser.add_argument('--nivel', type=float, default=NIVEL_CONFIANZA,
+                        help=f"Nivel de confianza de los intervalos (por defecto {NIVEL_CONFIANZA})")
+    parser.add_argument('--semilla', type=int, help="Semilla del sorteo, para repetir la muestra")
+    parser.add_argument('--exacto', action='store_true',
+                        help="Cargar todo el archivo y calcular los valores exactos")
+    argumentos = parser.parse_args()
+
+    errores = []
+    if argumentos.exacto:
+        estimaciones = calcular_estadisticas_exactas(list(iterar_paises_csv(argumentos.archivo, errores)),
+                                                     argumentos.nivel)
+    else:
+        estimaciones = estimar_estadisticas_generales(
+            muestrear_csv(argumentos.archivo, argumentos.tamano,
+                          None if argumentos.sin_estratos else 'continente', argumentos.semilla, errores),
+            argumentos.nivel)
+    for error in errores:
+        print(f"⚠️ Fila {error['fila']} inválida, se omite: {error['mensaje']}")
+    mostrar_estimaciones(estimaciones)
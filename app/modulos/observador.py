@@ -0,0 +1,147 @@
+"""
+Módulo de Observación del Archivo de Datos
+==========================================
+Este módulo detecta cambios externos en el CSV de países (por ejemplo, un
+proceso que lo actualiza mientras el programa está abierto) consultando
+periódicamente su inodo, fecha de modificación y tamaño.
+
+Cuando el archivo cambia no se vuelve a cargar completo: se guarda la
+huella (hash) de cada línea y solo se convierten las líneas nuevas. El
+resultado es un conjunto de cambios por nombre normalizado que el programa
+aplica a la lista en memoria y a sus índices de forma incremental. Se
+asume una fila por línea, como escribe guardar_datos_csv.
+"""
+
+import io
+import os
+from typing import List, Dict, Any, Optional, Tuple
+from .validacion import normalizar_texto_busqueda
+from .carga_datos import leer_filas_csv, validar_filas_paises
+
+
+def firma_archivo(ruta_archivo: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Obtiene la firma de un archivo: inodo, fecha de modificación y tamaño.
+
+    El inodo cambia cuando el archivo se reemplaza (por ejemplo, al escribir
+    uno temporal y renombrarlo), y la fecha y el tamaño cuando se reescribe.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo
+
+    Returns:
+        Optional[Tuple[int, int, int]]: Firma del archivo o None si no existe
+    """
+    try:
+        estado = os.stat(ruta_archivo)
+    except OSError:
+        return None
+    return (estado.st_ino, estado.st_mtime_ns, estado.st_size)
+
+
+def _leer_lineas(ruta_archivo: str) -> Tuple[bytes, List[bytes]]:
+    """Lee el encabezado y las líneas de datos no vacías de un CSV."""
+    with open(ruta_archivo, 'rb') as archivo:
+        lineas = archivo.read().splitlines()
+    if not lineas:
+        return b'', []
+    # csv.reader omite las líneas vacías, así que aquí también se descartan
+    return lineas[0], [linea for linea in lineas[1:] if linea.strip()]
+
+
+def crear_observador(ruta_archivo: str) -> Dict[str, Any]:
+    """
+    Registra el estado actual de un CSV para detectar cambios posteriores.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo CSV observado
+
+    Returns:
+        Dict[str, Any]: Observador con la firma del archivo y la huella de cada línea
+    """
+    firma = firma_archivo(ruta_archivo)
+    encabezado, lineas = _leer_lineas(ruta_archivo)
+    filas = leer_filas_csv(io.StringIO(b'\n'.join([encabezado] + lineas).decode('utf-8')))
+
+    huellas = {}
+    for linea, fila in zip(lineas, filas):
+        if fila and fila[0]:
+            huellas[hash(linea)] = normalizar_texto_busqueda(fila[0].strip())
+
+    return {
+        'ruta': ruta_archivo,
+        'firma': firma,
+        'encabezado': encabezado,
+        'huellas': huellas,
+    }
+
+
+def detectar_cambios(observador: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Compara el archivo con el último estado registrado.
+
+    Solo se convierten las líneas cuya huella no existía antes; las demás
+    corresponden a países que no cambiaron. El observador queda actualizado
+    con el nuevo estado del archivo.
+
+    Args:
+        observador (Dict[str, Any]): Observador creado con crear_observador
+
+    Returns:
+        Optional[Dict[str, Any]]: None si el archivo no cambió; si cambió, un
+            diccionario con 'actualizados' (países nuevos o modificados, ya
+            validados), 'eliminados' (nombres normalizados que ya no están en
+            el archivo) y 'errores' (líneas nuevas inválidas, como en
+            validar_filas_paises)
+    """
+    firma = firma_archivo(observador['ruta'])
+    if firma is None or firma == observador['firma']:
+        return None
+
+    encabezado, lineas = _leer_lineas(observador['ruta'])
+    if encabezado != observador['encabezado']:
+        raise ValueError("El encabezado del archivo cambió: es necesario volver a cargarlo")
+
+    anteriores = observador['huellas']
+    huellas = {}
+    nuevas = []  # Tuplas (número de fila, huella, línea)
+    for numero_fila, linea in enumerate(lineas, start=2):
+        huella = hash(linea)
+        if huella in anteriores:
+            huellas[huella] = anteriores[huella]
+        else:
+            nuevas.append((numero_fila, huella, linea))
+
+    # Convertir solo las líneas nuevas y recuperar su número de fila real
+    columnas = []
+    filas = leer_filas_csv(io.StringIO(
+        b'\n'.join([encabezado] + [linea for _, _, linea in nuevas]).decode('utf-8')
+    ), columnas)
+    mascara, validos, errores = validar_filas_paises(filas, primera_fila=0, columnas=columnas)
+    for error in errores:
+        error['fila'] = nuevas[error['fila']][0]
+
+    actualizados = []
+    conservados = set()  # Nombres con una línea nueva inválida: se mantiene el valor en memoria
+    validos = iter(validos)
+    for (_, huella, _), fila, valida in zip(nuevas, filas, mascara):
+        if valida:
+            pais = next(validos)
+            huellas[huella] = normalizar_texto_busqueda(pais['nombre'])
+            actualizados.append(pais)
+        elif fila and fila[0]:
+            conservados.add(normalizar_texto_busqueda(fila[0].strip()))
+
+    # Nombres cuyas líneas desaparecieron y no volvieron a aparecer
+    presentes = set(huellas.values()) | conservados
+    eliminados = {nombre for huella, nombre in anteriores.items()
+                  if huella not in huellas and nombre not in presentes}
+
+    observador['firma'] = firma
+    observador['huellas'] = huellas
+
+    return {
+        'actualizados': actualizados,
+        'eliminados': sorted(eliminados),
+        'errores': errores,
+    }
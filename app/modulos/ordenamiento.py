@@ -5,12 +5,99 @@ Este módulo contiene funciones para ordenar países según diferentes criterios
 usando algoritmos de ordenamiento implementados desde cero.
 """
 
-from typing import List, Dict, Any
+import unicodedata
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Tuple
+
+# Cantidad de nombres distintos cuya clave de colación se conserva entre ordenamientos
+TAMANO_CACHE_COLACION = 65536
+
+
+@lru_cache(maxsize=TAMANO_CACHE_COLACION)
+def clave_colacion(texto: str) -> Tuple[str, str]:
+    """
+    Calcula la clave de orden alfabético en español de un texto.
+    
+    Los acentos y la diéresis se ignoran (Perú se ordena como Peru) y la ñ
+    es una letra propia entre la n y la o. Si dos textos solo difieren en
+    los acentos, el segundo elemento de la clave los desempata. La clave se
+    calcula una vez por texto y se reutiliza en los ordenamientos siguientes.
+    
+    Args:
+        texto (str): Texto a ordenar (por ejemplo, el nombre de un país)
+        
+    Returns:
+        Tuple[str, str]: Clave principal (sin acentos) y clave de desempate
+    """
+    descompuesto = unicodedata.normalize('NFD', texto.strip().lower())
+    # La ñ se descompone en n + tilde: se cambia por una n seguida del mayor
+    # carácter posible, así queda después de toda palabra que siga con n
+    descompuesto = descompuesto.replace('n\u0303', 'n\U0010ffff')
+    principal = ''.join(c for c in descompuesto if not unicodedata.combining(c))
+    return principal, descompuesto
+
+
+def obtener_clave_ordenamiento(criterio: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Obtiene la función que extrae el valor de comparación de un país.
+    
+    Args:
+        criterio (str): Criterio de ordenamiento ('nombre', 'poblacion', 'superficie'
+            o una columna derivada: 'densidad', 'porcentaje_poblacion')
+        
+    Returns:
+        Callable: Función que recibe un país y devuelve su clave de orden
+    """
+    if criterio == 'nombre':
+        return lambda pais: clave_colacion(pais['nombre'])
+    if criterio == 'porcentaje_poblacion':
+        # Es proporcional a la población: mismo orden, y la clave no cambia
+        # cuando solo cambia la población total
+        criterio = 'poblacion'
+    return lambda pais: pais[criterio]
+
+
+def _ordenar_por_mezcla(entradas: List[tuple], descendente: bool) -> List[tuple]:
+    """
+    Ordena pares (clave, país) por su clave usando ordenamiento por mezcla.
+    
+    Es estable en ambos sentidos: los países con la misma clave conservan
+    su orden original.
+    """
+    if len(entradas) <= 1:
+        return entradas
+    
+    mitad = len(entradas) // 2
+    izquierda = _ordenar_por_mezcla(entradas[:mitad], descendente)
+    derecha = _ordenar_por_mezcla(entradas[mitad:], descendente)
+    
+    # Mezclar las dos mitades ordenadas
+    mezcla = []
+    i = j = 0
+    while i < len(izquierda) and j < len(derecha):
+        if descendente:
+            tomar_izquierda = izquierda[i][0] >= derecha[j][0]
+        else:
+            tomar_izquierda = izquierda[i][0] <= derecha[j][0]
+        
+        if tomar_izquierda:
+            mezcla.append(izquierda[i])
+            i += 1
+        else:
+            mezcla.append(derecha[j])
+            j += 1
+    
+    mezcla.extend(izquierda[i:])
+    mezcla.extend(derecha[j:])
+    return mezcla
 
 
 def ordenar_por_nombre(paises: List[Dict[str, Any]], descendente: bool = False) -> List[Dict[str, Any]]:
     """
-    Ordena países por nombre usando ordenamiento por selección.
+    Ordena países por nombre usando ordenamiento por mezcla.
+    
+    Se usa el orden alfabético en español (ver clave_colacion), con la clave
+    de cada país calculada una sola vez antes de ordenar.
     
     Args:
         paises (List[Dict[str, Any]]): Lista de países
@@ -22,29 +109,8 @@ def ordenar_por_nombre(paises: List[Dict[str, Any]], descendente: bool = False)
     if not paises:
         return []
     
-    # Crear copia para no modificar la lista original
-    paises_ordenados = paises.copy()
-    
-    # Ordenamiento por selección
-    n = len(paises_ordenados)
-    for i in range(n):
-        indice_extremo = i
-        for j in range(i + 1, n):
-            nombre_actual = paises_ordenados[j]['nombre'].lower()
-            nombre_extremo = paises_ordenados[indice_extremo]['nombre'].lower()
-            
-            if descendente:
-                if nombre_actual > nombre_extremo:
-                    indice_extremo = j
-            else:
-                if nombre_actual < nombre_extremo:
-                    indice_extremo = j
-        
-        # Intercambiar elementos
-        paises_ordenados[i], paises_ordenados[indice_extremo] = \
-            paises_ordenados[indice_extremo], paises_ordenados[i]
-    
-    return paises_ordenados
+    entradas = [(clave_colacion(pais['nombre']), pais) for pais in paises]
+    return [pais for _, pais in _ordenar_por_mezcla(entradas, descendente)]
 
 
 def ordenar_por_poblacion(paises: List[Dict[str, Any]], descendente: bool = False) -> List[Dict[str, Any]]:
@@ -89,12 +155,14 @@ def ordenar_por_poblacion(paises: List[Dict[str, Any]], descendente: bool = Fals
     return paises_ordenados
 
 
-def ordenar_por_superficie(paises: List[Dict[str, Any]], descendente: bool = False) -> List[Dict[str, Any]]:
+def _ordenar_por_insercion(paises: List[Dict[str, Any]], campo: str,
+                           descendente: bool = False) -> List[Dict[str, Any]]:
     """
-    Ordena países por superficie usando ordenamiento por inserción.
+    Ordena países por un campo numérico usando ordenamiento por inserción.
     
     Args:
         paises (List[Dict[str, Any]]): Lista de países
+        campo (str): Campo numérico por el que ordenar
         descendente (bool): Si debe ordenar de forma descendente
         
     Returns:
@@ -109,17 +177,17 @@ def ordenar_por_superficie(paises: List[Dict[str, Any]], descendente: bool = Fal
     # Ordenamiento por inserción
     for i in range(1, n):
         pais_actual = paises_ordenados[i]
-        superficie_actual = pais_actual['superficie']
+        valor_actual = pais_actual[campo]
         j = i - 1
         
         while j >= 0:
-            superficie_comparar = paises_ordenados[j]['superficie']
+            valor_comparar = paises_ordenados[j][campo]
             
             debe_mover = False
             if descendente:
-                debe_mover = superficie_actual > superficie_comparar
+                debe_mover = valor_actual > valor_comparar
             else:
-                debe_mover = superficie_actual < superficie_comparar
+                debe_mover = valor_actual < valor_comparar
             
             if debe_mover:
                 paises_ordenados[j + 1] = paises_ordenados[j]
@@ -132,6 +200,36 @@ def ordenar_por_superficie(paises: List[Dict[str, Any]], descendente: bool = Fal
     return paises_ordenados
 
 
+def ordenar_por_superficie(paises: List[Dict[str, Any]], descendente: bool = False) -> List[Dict[str, Any]]:
+    """
+    Ordena países por superficie usando ordenamiento por inserción.
+    
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        descendente (bool): Si debe ordenar de forma descendente
+        
+    Returns:
+        List[Dict[str, Any]]: Lista de países ordenada
+    """
+    return _ordenar_por_insercion(paises, 'superficie', descendente)
+
+
+def ordenar_por_densidad(paises: List[Dict[str, Any]], descendente: bool = False) -> List[Dict[str, Any]]:
+    """
+    Ordena países por densidad de población usando ordenamiento por inserción.
+    
+    Requiere que los países tengan la columna derivada 'densidad'
+    (ver crear_columnas_derivadas).
+    
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        descendente (bool): Si debe ordenar de forma descendente
+        
+    Returns:
+        List[Dict[str, Any]]: Lista de países ordenada
+    """
+    return _ordenar_por_insercion(paises, 'densidad', descendente)
+
 
 def ordenar_personalizado(paises: List[Dict[str, Any]], criterio: str, 
                          descendente: bool = False) -> List[Dict[str, Any]]:
@@ -150,6 +248,9 @@ def ordenar_personalizado(paises: List[Dict[str, Any]], criterio: str,
         'nombre': ordenar_por_nombre,
         'poblacion': ordenar_por_poblacion,
         'superficie': ordenar_por_superficie,
+        'densidad': ordenar_por_densidad,
+        # El porcentaje es proporcional a la población: el orden es el mismo
+        'porcentaje_poblacion': ordenar_por_poblacion,
     }
     
     if criterio not in criterios_validos:
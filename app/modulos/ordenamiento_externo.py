@@ -0,0 +1,203 @@
+"""
+Módulo de Ordenamiento Externo
+==============================
+Este módulo ordena archivos CSV de países que no entran en memoria, con un
+ordenamiento por mezcla externo:
+
+1. El archivo se lee de a tramos que respetan el límite de memoria; cada
+   tramo se ordena en memoria y se guarda en un archivo temporal.
+2. Los tramos se mezclan con heapq.merge, que solo mantiene en memoria la
+   fila actual de cada tramo. Si hay más tramos que MAXIMO_TRAMOS_ABIERTOS,
+   se mezclan primero por grupos para no agotar los archivos abiertos.
+
+El resultado puede escribirse en otro CSV o recorrerse como un generador.
+Como ambos pasos son estables, los países con la misma clave conservan el
+orden que tenían en el archivo.
+
+También puede usarse desde la terminal:
+    python -m modulos.ordenamiento_externo entrada.csv salida.csv --criterio poblacion --descendente
+"""
+
+import csv
+import heapq
+import os
+import argparse
+import tempfile
+from contextlib import ExitStack
+from typing import List, Dict, Any, Optional, Iterator, Callable
+from .carga_datos import iterar_paises_csv, COLUMNAS_REQUERIDAS
+from .ordenamiento import obtener_clave_ordenamiento
+
+# Memoria máxima (en bytes) que ocupan los países de un tramo
+LIMITE_MEMORIA_POR_DEFECTO = 256 * 1024 * 1024
+
+# Memoria aproximada de un país en un tramo (diccionario, textos, números y su clave)
+BYTES_POR_PAIS = 400
+
+# Cantidad máxima de tramos que se mezclan a la vez
+MAXIMO_TRAMOS_ABIERTOS = 64
+
+# Criterios por los que se puede ordenar (los mismos que ordenar_personalizado)
+CRITERIOS_VALIDOS = ('nombre', 'poblacion', 'superficie', 'densidad', 'porcentaje_poblacion')
+
+
+def _clave_externa(criterio: str) -> Callable[[Dict[str, Any]], Any]:
+    """Clave de orden; la densidad se calcula porque los tramos no la guardan."""
+    if criterio not in CRITERIOS_VALIDOS:
+        raise ValueError(f"Criterio de ordenamiento inválido: {criterio}. "
+                         f"Criterios válidos: {', '.join(CRITERIOS_VALIDOS)}")
+    if criterio == 'densidad':
+        return lambda pais: pais['poblacion'] / pais['superficie']
+    return obtener_clave_ordenamiento(criterio)
+
+
+def _escribir_tramo(paises: List[Dict[str, Any]], directorio: str) -> str:
+    """Guarda un tramo ya ordenado en un archivo temporal."""
+    descriptor, ruta = tempfile.mkstemp(dir=directorio, suffix='.csv')
+    with os.fdopen(descriptor, 'w', encoding='utf-8', newline='') as archivo:
+        csv.writer(archivo).writerows(
+            (pais['nombre'], pais['poblacion'], pais['superficie'], pais['continente'])
+            for pais in paises
+        )
+    return ruta
+
+
+def _leer_tramo(archivo) -> Iterator[Dict[str, Any]]:
+    """Recorre un tramo temporal (sus filas ya fueron validadas)."""
+    for nombre, poblacion, superficie, continente in csv.reader(archivo):
+        yield {'nombre': nombre, 'poblacion': int(poblacion),
+               'superficie': int(superficie), 'continente': continente}
+
+
+def _mezclar(rutas: List[str], clave: Callable, descendente: bool) -> Iterator[Dict[str, Any]]:
+    """Mezcla tramos ordenados; los archivos se cierran al terminar el recorrido."""
+    with ExitStack() as pila:
+        tramos = [_leer_tramo(pila.enter_context(open(ruta, 'r', encoding='utf-8', newline='')))
+                  for ruta in rutas]
+        yield from heapq.merge(*tramos, key=clave, reverse=descendente)
+
+
+def iterar_csv_ordenado(ruta_archivo: str, criterio: str, descendente: bool = False,
+                        limite_memoria: int = LIMITE_MEMORIA_POR_DEFECTO,
+                        directorio_temporal: Optional[str] = None,
+                        errores: Optional[List[Dict[str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre los países de un CSV ordenados, sin cargar el archivo completo.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo CSV
+        criterio (str): Criterio de ordenamiento (ver CRITERIOS_VALIDOS)
+        descendente (bool): Si debe ordenar de forma descendente
+        limite_memoria (int): Memoria máxima (en bytes) de cada tramo
+        directorio_temporal (str, optional): Dónde guardar los tramos (por
+            defecto, el directorio temporal del sistema)
+        errores (List[Dict[str, Any]], optional): Lista donde se agregan las
+            filas inválidas, que se omiten
+
+    Yields:
+        Dict[str, Any]: Cada país, en orden
+
+    Raises:
+        ValueError: Si el criterio no es válido
+    """
+    clave = _clave_externa(criterio)
+    paises_por_tramo = max(1, limite_memoria // BYTES_POR_PAIS)
+
+    with tempfile.TemporaryDirectory(prefix='ordenamiento_', dir=directorio_temporal) as directorio:
+        tramos = []
+        tramo = []
+        for pais in iterar_paises_csv(ruta_archivo, errores):
+            tramo.append(pais)
+            if len(tramo) >= paises_por_tramo:
+                tramo.sort(key=clave, reverse=descendente)
+                tramos.append(_escribir_tramo(tramo, directorio))
+                tramo = []
+
+        # Todo el archivo entró en un solo tramo: no hace falta pasar por disco
+        if not tramos:
+            tramo.sort(key=clave, reverse=descendente)
+            yield from tramo
+            return
+
+        if tramo:
+            tramo.sort(key=clave, reverse=descendente)
+            tramos.append(_escribir_tramo(tramo, directorio))
+            tramo = []
+
+        # Mezclas intermedias por grupos consecutivos (mantienen la estabilidad)
+        while len(tramos) > MAXIMO_TRAMOS_ABIERTOS:
+            mezclados = []
+            for inicio in range(0, len(tramos), MAXIMO_TRAMOS_ABIERTOS):
+                grupo = tramos[inicio:inicio + MAXIMO_TRAMOS_ABIERTOS]
+                mezclados.append(_escribir_tramo(_mezclar(grupo, clave, descendente), directorio))
+                for ruta in grupo:
+                    os.remove(ruta)
+            tramos = mezclados
+
+        yield from _mezclar(tramos, clave, descendente)
+
+
+def ordenar_csv_externo(ruta_entrada: str, ruta_salida: str, criterio: str,
+                        descendente: bool = False,
+                        limite_memoria: int = LIMITE_MEMORIA_POR_DEFECTO,
+                        directorio_temporal: Optional[str] = None,
+                        errores: Optional[List[Dict[str, Any]]] = None) -> int:
+    """
+    Ordena un CSV de países y escribe el resultado en otro archivo.
+
+    Args:
+        ruta_entrada (str): Ruta al archivo CSV de entrada
+        ruta_salida (str): Ruta al archivo CSV ordenado (no debe ser la misma)
+        criterio (str): Criterio de ordenamiento (ver CRITERIOS_VALIDOS)
+        descendente (bool): Si debe ordenar de forma descendente
+        limite_memoria (int): Memoria máxima (en bytes) de cada tramo
+        directorio_temporal (str, optional): Dónde guardar los tramos
+        errores (List[Dict[str, Any]], optional): Lista donde se agregan las
+            filas inválidas, que se omiten
+
+    Returns:
+        int: Cantidad de países escritos
+
+    Raises:
+        ValueError: Si el criterio no es válido o la salida es el mismo archivo
+    """
+    if os.path.abspath(ruta_entrada) == os.path.abspath(ruta_salida):
+        raise ValueError("El archivo de salida debe ser distinto del de entrada")
+
+    directorio = os.path.dirname(ruta_salida)
+    if directorio and not os.path.exists(directorio):
+        os.makedirs(directorio)
+
+    cantidad = 0
+    with open(ruta_salida, 'w', encoding='utf-8', newline='') as archivo:
+        escritor_csv = csv.writer(archivo)
+        escritor_csv.writerow(COLUMNAS_REQUERIDAS)
+        for pais in iterar_csv_ordenado(ruta_entrada, criterio, descendente,
+                                        limite_memoria, directorio_temporal, errores):
+            escritor_csv.writerow((pais['nombre'], pais['poblacion'],
+                                   pais['superficie'], pais['continente']))
+            cantidad += 1
+    return cantidad
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Ordena un CSV de países que no entra en memoria")
+    parser.add_argument('entrada', help="Archivo CSV de entrada")
+    parser.add_argument('salida', help="Archivo CSV ordenado")
+    parser.add_argument('--criterio', choices=CRITERIOS_VALIDOS, default='nombre',
+                        help="Criterio de ordenamiento (por defecto nombre)")
+    parser.add_argument('--descendente', action='store_true', help="Orden descendente")
+    parser.add_argument('--limite-memoria', type=int, default=LIMITE_MEMORIA_POR_DEFECTO // (1024 * 1024),
+                        dest='limite_memoria', metavar='MB',
+                        help="Memoria máxima de cada tramo en MB (por defecto 256)")
+    parser.add_argument('--directorio-temporal', dest='directorio_temporal', metavar='RUTA',
+                        help="Directorio donde guardar los tramos temporales")
+    argumentos = parser.parse_args()
+
+    errores = []
+    escritos = ordenar_csv_externo(argumentos.entrada, argumentos.salida, argumentos.criterio,
+                                   argumentos.descendente, argumentos.limite_memoria * 1024 * 1024,
+                                   argumentos.directorio_temporal, errores)
+    for error in errores:
+        print(f"⚠️ Fila {error['fila']} inválida, se omite: {error['mensaje']}")
+    print(f"✅ {escritos} países ordenados por {argumentos.criterio} en {argumentos.salida}")
@@ -0,0 +1,284 @@
+"""
+Módulo de Ejecución Paralela
+============================
+Este módulo permite calcular estadísticas y filtrar conjuntos de datos muy
+grandes usando varios núcleos. Las columnas numéricas se copian una única
+vez a memoria compartida (multiprocessing.shared_memory), cada proceso de
+un ProcessPoolExecutor trabaja sobre un fragmento de filas y los
+resultados parciales se combinan en el proceso principal.
+
+Para conjuntos chicos el costo de crear procesos supera la ganancia, por lo
+que por debajo de MINIMO_FILAS_PARALELO todo se calcula en el proceso actual.
+"""
+
+import os
+import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Dict, Any, Optional, Tuple
+from .validacion import normalizar_texto_busqueda
+
+# Cantidad de procesos por defecto (uno por núcleo disponible)
+TRABAJADORES_POR_DEFECTO = os.cpu_count() or 1
+
+# Por debajo de esta cantidad de filas no conviene repartir el trabajo
+MINIMO_FILAS_PARALELO = 200000
+
+
+def crear_columnas_compartidas(paises: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Copia las columnas numéricas y el continente a memoria compartida.
+
+    Las columnas pueden reutilizarse en varias llamadas y deben liberarse con
+    liberar_columnas_compartidas.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+
+    Returns:
+        Dict[str, Any]: Nombres de los bloques de memoria y metadatos
+    """
+    codigos_continente = {}
+    columnas = {
+        'poblacion': array('q', (p['poblacion'] for p in paises)),
+        'superficie': array('q', (p['superficie'] for p in paises)),
+        'continente': array('i', (
+            codigos_continente.setdefault(normalizar_texto_busqueda(p['continente']),
+                                          len(codigos_continente))
+            for p in paises
+        )),
+    }
+
+    bloques = {}
+    for nombre, valores in columnas.items():
+        datos = valores.tobytes()
+        bloque = shared_memory.SharedMemory(create=True, size=max(1, len(datos)))
+        bloque.buf[:len(datos)] = datos
+        bloques[nombre] = bloque
+
+    return {
+        'total': len(paises),
+        'bloques': bloques,
+        'nombres': {nombre: bloque.name for nombre, bloque in bloques.items()},
+        'codigos_continente': codigos_continente,
+    }
+
+
+def liberar_columnas_compartidas(columnas: Dict[str, Any]):
+    """
+    Libera la memoria compartida creada por crear_columnas_compartidas.
+
+    Args:
+        columnas (Dict[str, Any]): Columnas a liberar
+    """
+    for bloque in columnas['bloques'].values():
+        bloque.close()
+        bloque.unlink()
+    columnas['bloques'] = {}
+
+
+def _abrir_columna(nombre_bloque: str, tipo: str, total: int) -> Tuple[Any, memoryview]:
+    """Abre un bloque de memoria compartida desde un proceso trabajador."""
+    bloque = shared_memory.SharedMemory(name=nombre_bloque)
+    return bloque, bloque.buf.cast(tipo)[:total]
+
+
+def _resumen_columna(valores: memoryview, inicio: int, fin: int) -> Dict[str, Any]:
+    """Calcula los agregados parciales de un fragmento de una columna."""
+    fragmento = valores[inicio:fin]
+    cantidad = len(fragmento)
+    suma = sum(fragmento)
+    media = suma / cantidad
+    m2 = sum((valor - media) ** 2 for valor in fragmento)
+    posicion_maximo = max(range(cantidad), key=fragmento.__getitem__)
+    posicion_minimo = min(range(cantidad), key=fragmento.__getitem__)
+    resumen = {
+        'cantidad': cantidad, 'suma': suma, 'media': media, 'm2': m2,
+        'maximo': (fragmento[posicion_maximo], inicio + posicion_maximo),
+        'minimo': (fragmento[posicion_minimo], inicio + posicion_minimo),
+    }
+    fragmento.release()
+    return resumen
+
+
+def _agregados_fragmento(nombres: Dict[str, str], total: int,
+                         inicio: int, fin: int) -> Dict[str, Dict[str, Any]]:
+    """Tarea de un trabajador: agregados parciales de población y superficie."""
+    resultado = {}
+    for campo in ('poblacion', 'superficie'):
+        bloque, valores = _abrir_columna(nombres[campo], 'q', total)
+        try:
+            resultado[campo] = _resumen_columna(valores, inicio, fin)
+        finally:
+            valores.release()
+            bloque.close()
+    return resultado
+
+
+def _filtrar_fragmento(nombres: Dict[str, str], total: int, inicio: int, fin: int,
+                       codigo_continente: Optional[int],
+                       rango_poblacion: Tuple[float, float],
+                       rango_superficie: Tuple[float, float]) -> bytes:
+    """Tarea de un trabajador: posiciones de las filas que cumplen los criterios."""
+    abiertos = [_abrir_columna(nombres[campo], tipo, total)
+                for campo, tipo in (('poblacion', 'q'), ('superficie', 'q'), ('continente', 'i'))]
+    try:
+        poblaciones, superficies, continentes = (valores for _, valores in abiertos)
+        min_pob, max_pob = rango_poblacion
+        min_sup, max_sup = rango_superficie
+        posiciones = array('q', (
+            fila for fila in range(inicio, fin)
+            if (codigo_continente is None or continentes[fila] == codigo_continente)
+            and min_pob <= poblaciones[fila] <= max_pob
+            and min_sup <= superficies[fila] <= max_sup
+        ))
+        return posiciones.tobytes()
+    finally:
+        for bloque, valores in abiertos:
+            valores.release()
+            bloque.close()
+
+
+def _fragmentos(total: int, partes: int) -> List[Tuple[int, int]]:
+    """Divide el rango [0, total) en fragmentos contiguos de tamaño similar."""
+    partes = max(1, min(partes, total))
+    tamano = math.ceil(total / partes)
+    return [(inicio, min(inicio + tamano, total)) for inicio in range(0, total, tamano)]
+
+
+def _ejecutar(funcion, columnas: Dict[str, Any], trabajadores: int, *argumentos) -> List[Any]:
+    """Ejecuta una tarea sobre cada fragmento, en paralelo si corresponde."""
+    total = columnas['total']
+    if trabajadores <= 1 or total < MINIMO_FILAS_PARALELO:
+        return [funcion(columnas['nombres'], total, 0, total, *argumentos)]
+
+    with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+        futuros = [
+            ejecutor.submit(funcion, columnas['nombres'], total, inicio, fin, *argumentos)
+            for inicio, fin in _fragmentos(total, trabajadores)
+        ]
+        return [futuro.result() for futuro in futuros]
+
+
+def _combinar_resumenes(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """Combina dos agregados parciales (media y varianza con el método de Chan)."""
+    cantidad = a['cantidad'] + b['cantidad']
+    delta = b['media'] - a['media']
+    return {
+        'cantidad': cantidad,
+        'suma': a['suma'] + b['suma'],
+        'media': a['media'] + delta * b['cantidad'] / cantidad,
+        'm2': a['m2'] + b['m2'] + delta ** 2 * a['cantidad'] * b['cantidad'] / cantidad,
+        # Ante empates gana la primera fila, como en max()/min() secuenciales
+        'maximo': max(a['maximo'], b['maximo'], key=lambda par: (par[0], -par[1])),
+        'minimo': min(a['minimo'], b['minimo'], key=lambda par: (par[0], par[1])),
+    }
+
+
+def calcular_estadisticas_paralelo(paises: List[Dict[str, Any]],
+                                   trabajadores: int = TRABAJADORES_POR_DEFECTO,
+                                   columnas: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Calcula las mismas estadísticas que calcular_estadisticas_generales usando varios procesos.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        trabajadores (int): Cantidad de procesos a utilizar
+        columnas (Dict[str, Any], optional): Columnas compartidas ya creadas
+            para la misma lista; si no se indican se crean y liberan aquí
+
+    Returns:
+        Dict[str, Any]: Diccionario con estadísticas generales
+    """
+    if not paises:
+        return {}
+
+    propias = columnas is None
+    if propias:
+        columnas = crear_columnas_compartidas(paises)
+    try:
+        parciales = _ejecutar(_agregados_fragmento, columnas, trabajadores)
+    finally:
+        if propias:
+            liberar_columnas_compartidas(columnas)
+
+    resumen = parciales[0]
+    for parcial in parciales[1:]:
+        resumen = {campo: _combinar_resumenes(resumen[campo], parcial[campo]) for campo in resumen}
+
+    poblacion = resumen['poblacion']
+    superficie = resumen['superficie']
+    total = poblacion['cantidad']
+
+    return {
+        'total_paises': total,
+        'poblacion_total': poblacion['suma'],
+        'superficie_total': superficie['suma'],
+        'poblacion_promedio': round(poblacion['suma'] / total, 2),
+        'superficie_promedio': round(superficie['suma'] / total, 2),
+        'pais_mayor_poblacion': paises[poblacion['maximo'][1]],
+        'pais_menor_poblacion': paises[poblacion['minimo'][1]],
+        'pais_mayor_superficie': paises[superficie['maximo'][1]],
+        'pais_menor_superficie': paises[superficie['minimo'][1]],
+        'desviacion_poblacion': round(math.sqrt(poblacion['m2'] / total), 2),
+        'desviacion_superficie': round(math.sqrt(superficie['m2'] / total), 2),
+    }
+
+
+def filtrar_paralelo(paises: List[Dict[str, Any]],
+                     continente: Optional[str] = None,
+                     poblacion_min: Optional[int] = None,
+                     poblacion_max: Optional[int] = None,
+                     superficie_min: Optional[int] = None,
+                     superficie_max: Optional[int] = None,
+                     trabajadores: int = TRABAJADORES_POR_DEFECTO,
+                     columnas: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Filtra países por continente y rangos numéricos usando varios procesos.
+
+    Args:
+        paises (List[Dict[str, Any]]): Lista de países
+        continente (str, optional): Continente a filtrar
+        poblacion_min (int, optional): Población mínima
+        poblacion_max (int, optional): Población máxima
+        superficie_min (int, optional): Superficie mínima
+        superficie_max (int, optional): Superficie máxima
+        trabajadores (int): Cantidad de procesos a utilizar
+        columnas (Dict[str, Any], optional): Columnas compartidas ya creadas
+            para la misma lista; si no se indican se crean y liberan aquí
+
+    Returns:
+        List[Dict[str, Any]]: Países que cumplen los criterios, en el orden original
+    """
+    if not paises:
+        return []
+
+    propias = columnas is None
+    if propias:
+        columnas = crear_columnas_compartidas(paises)
+    try:
+        codigo_continente = None
+        if continente:
+            codigo_continente = columnas['codigos_continente'].get(
+                normalizar_texto_busqueda(continente))
+            if codigo_continente is None:
+                return []
+
+        rango_poblacion = (poblacion_min if poblacion_min is not None else 0,
+                           poblacion_max if poblacion_max is not None else math.inf)
+        rango_superficie = (superficie_min if superficie_min is not None else 0,
+                            superficie_max if superficie_max is not None else math.inf)
+
+        parciales = _ejecutar(_filtrar_fragmento, columnas, trabajadores,
+                              codigo_continente, rango_poblacion, rango_superficie)
+    finally:
+        if propias:
+            liberar_columnas_compartidas(columnas)
+
+    resultados = []
+    for datos in parciales:
+        posiciones = array('q')
+        posiciones.frombytes(datos)
+        resultados.extend(paises[fila] for fila in posiciones)
+    return resultados
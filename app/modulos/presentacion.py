@@ -3,10 +3,67 @@ Módulo de Presentación
 =====================
 Este módulo contiene funciones para mostrar información de manera clara
 y formateada al usuario.
+
+Cada vista se arma primero como una lista de líneas y se escribe en la
+salida con una única operación, lo que evita miles de llamadas a print al
+mostrar listas grandes o redirigir la salida a un archivo. El modo plano
+(ver establecer_modo_plano) quita los emojis para obtener una salida apta
+para otros programas.
 """
 
-from typing import List, Dict, Any, Optional
-from .validacion import formatear_numero, mostrar_separador, pausar_ejecucion
+import csv
+import re
+import sys
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from .validacion import formatear_numero, pausar_ejecucion
+
+# Emojis (y el espacio que los sigue) que se quitan en el modo plano
+PATRON_EMOJI = re.compile('[\U0001F000-\U0001FAFF\u2300-\u23FF\u2600-\u27BF\u2B00-\u2BFF]\uFE0F? *|\uFE0F')
+
+# Si es True la salida se escribe sin emojis
+_modo_plano = False
+
+
+def establecer_modo_plano(activo: bool):
+    """
+    Activa o desactiva el modo plano (salida sin emojis).
+    
+    Args:
+        activo (bool): True para quitar los emojis de la salida
+    """
+    global _modo_plano
+    _modo_plano = activo
+
+
+def _escribir(lineas: List[str]):
+    """Escribe un bloque de líneas en la salida estándar con una sola operación."""
+    texto = "\n".join(lineas) + "\n"
+    if _modo_plano:
+        texto = PATRON_EMOJI.sub('', texto)
+    sys.stdout.write(texto)
+
+
+def _lineas_pais(pais: Dict[str, Any], mostrar_indice: bool = False, indice: int = 0) -> List[str]:
+    """Líneas de la ficha de un país (ver mostrar_pais)."""
+    if not pais:
+        return ["❌ No hay datos del país para mostrar"]
+    
+    prefijo = f"{indice:3d}. " if mostrar_indice else ""
+    lineas = [
+        f"{prefijo}🌍 {pais['nombre']}",
+        f"   📍 Continente: {pais['continente']}",
+        f"   👥 Población: {formatear_numero(pais['poblacion'])} habitantes",
+        f"   📏 Superficie: {formatear_numero(pais['superficie'])} km²",
+    ]
+    if 'densidad' in pais:
+        lineas.append(f"   🏙️ Densidad: {pais['densidad']:.1f} hab/km² "
+                      f"({pais['porcentaje_poblacion']:.2f}% de la población total)")
+    if pais.get('latitud') is not None and pais.get('longitud') is not None:
+        latitud = f"{abs(pais['latitud']):.2f}° {'N' if pais['latitud'] >= 0 else 'S'}"
+        longitud = f"{abs(pais['longitud']):.2f}° {'E' if pais['longitud'] >= 0 else 'O'}"
+        lineas.append(f"   🧭 Coordenadas: {latitud}, {longitud}")
+    lineas.append("")
+    return lineas
 
 
 def mostrar_pais(pais: Dict[str, Any], mostrar_indice: bool = False, indice: int = 0):
@@ -18,23 +75,28 @@ def mostrar_pais(pais: Dict[str, Any], mostrar_indice: bool = False, indice: int
         mostrar_indice (bool): Si debe mostrar el índice
         indice (int): Número de índice
     """
-    if not pais:
-        print("❌ No hay datos del país para mostrar")
-        return
+    _escribir(_lineas_pais(pais, mostrar_indice, indice))
+
+
+def _lineas_lista_paises(paises: List[Dict[str, Any]], titulo: str = "Países",
+                         mostrar_indices: bool = True, max_paises: Optional[int] = None) -> List[str]:
+    """Líneas de una lista de países (ver mostrar_lista_paises)."""
+    if not paises:
+        return [f"❌ No se encontraron países para mostrar en: {titulo}"]
     
-    # Formatear números
-    poblacion = formatear_numero(pais['poblacion'])
-    superficie = formatear_numero(pais['superficie'])
+    # Limitar cantidad si se especifica
+    paises_a_mostrar = paises[:max_paises] if max_paises else paises
+    
+    lineas = [f"\n📋 {titulo} ({len(paises_a_mostrar)} países)", "-" * 50]
+    for i, pais in enumerate(paises_a_mostrar, 1):
+        lineas.extend(_lineas_pais(pais, mostrar_indices, i))
     
-    # Mostrar información
-    if mostrar_indice:
-        print(f"{indice:3d}. ", end="")
+    # Mostrar información adicional si se limitó la lista
+    if max_paises and len(paises) > max_paises:
+        lineas.append(f"... y {len(paises) - max_paises} países más")
     
-    print(f"🌍 {pais['nombre']}")
-    print(f"   📍 Continente: {pais['continente']}")
-    print(f"   👥 Población: {poblacion} habitantes")
-    print(f"   📏 Superficie: {superficie} km²")
-    print()
+    lineas.append(f"Total: {len(paises)} países")
+    return lineas
 
 
 def mostrar_lista_paises(paises: List[Dict[str, Any]], titulo: str = "Países", 
@@ -48,24 +110,7 @@ def mostrar_lista_paises(paises: List[Dict[str, Any]], titulo: str = "Países",
         mostrar_indices (bool): Si debe mostrar índices
         max_paises (int, optional): Máximo número de países a mostrar
     """
-    if not paises:
-        print(f"❌ No se encontraron países para mostrar en: {titulo}")
-        return
-    
-    # Limitar cantidad si se especifica
-    paises_a_mostrar = paises[:max_paises] if max_paises else paises
-    
-    print(f"\n📋 {titulo} ({len(paises_a_mostrar)} países)")
-    mostrar_separador("-", 50)
-    
-    for i, pais in enumerate(paises_a_mostrar, 1):
-        mostrar_pais(pais, mostrar_indices, i)
-    
-    # Mostrar información adicional si se limitó la lista
-    if max_paises and len(paises) > max_paises:
-        print(f"... y {len(paises) - max_paises} países más")
-    
-    print(f"Total: {len(paises)} países")
+    _escribir(_lineas_lista_paises(paises, titulo, mostrar_indices, max_paises))
 
 
 def mostrar_estadisticas_generales(estadisticas: Dict[str, Any]):
@@ -76,31 +121,29 @@ def mostrar_estadisticas_generales(estadisticas: Dict[str, Any]):
         estadisticas (Dict[str, Any]): Estadísticas a mostrar
     """
     if not estadisticas:
-        print("❌ No hay estadísticas para mostrar")
+        _escribir(["❌ No hay estadísticas para mostrar"])
         return
     
-    print("\n📊 ESTADÍSTICAS GENERALES")
-    mostrar_separador("=", 60)
-    
-    # Estadísticas básicas
-    print(f"📈 Total de países: {estadisticas['total_paises']}")
-    print(f"👥 Población mundial: {formatear_numero(estadisticas['poblacion_total'])} habitantes")
-    print(f"📏 Superficie mundial: {formatear_numero(estadisticas['superficie_total'])} km²")
-
-    
-    print(f"\n📊 Población promedio: {formatear_numero(estadisticas['poblacion_promedio'])} habitantes")
-    print(f"📊 Superficie promedio: {formatear_numero(estadisticas['superficie_promedio'])} km²")
-    
-    # Países extremos
-    print(f"\n🏆 EXTREMOS:")
-    print(f"   Mayor población: {estadisticas['pais_mayor_poblacion']['nombre']} "
-          f"({formatear_numero(estadisticas['pais_mayor_poblacion']['poblacion'])} hab)")
-    print(f"   Menor población: {estadisticas['pais_menor_poblacion']['nombre']} "
-          f"({formatear_numero(estadisticas['pais_menor_poblacion']['poblacion'])} hab)")
-    print(f"   Mayor superficie: {estadisticas['pais_mayor_superficie']['nombre']} "
-          f"({formatear_numero(estadisticas['pais_mayor_superficie']['superficie'])} km²)")
-    print(f"   Menor superficie: {estadisticas['pais_menor_superficie']['nombre']} "
-          f"({formatear_numero(estadisticas['pais_menor_superficie']['superficie'])} km²)")
+    _escribir([
+        "\n📊 ESTADÍSTICAS GENERALES",
+        "=" * 60,
+        # Estadísticas básicas
+        f"📈 Total de países: {estadisticas['total_paises']}",
+        f"👥 Población mundial: {formatear_numero(estadisticas['poblacion_total'])} habitantes",
+        f"📏 Superficie mundial: {formatear_numero(estadisticas['superficie_total'])} km²",
+        f"\n📊 Población promedio: {formatear_numero(estadisticas['poblacion_promedio'])} habitantes",
+        f"📊 Superficie promedio: {formatear_numero(estadisticas['superficie_promedio'])} km²",
+        # Países extremos
+        f"\n🏆 EXTREMOS:",
+        f"   Mayor población: {estadisticas['pais_mayor_poblacion']['nombre']} "
+        f"({formatear_numero(estadisticas['pais_mayor_poblacion']['poblacion'])} hab)",
+        f"   Menor población: {estadisticas['pais_menor_poblacion']['nombre']} "
+        f"({formatear_numero(estadisticas['pais_menor_poblacion']['poblacion'])} hab)",
+        f"   Mayor superficie: {estadisticas['pais_mayor_superficie']['nombre']} "
+        f"({formatear_numero(estadisticas['pais_mayor_superficie']['superficie'])} km²)",
+        f"   Menor superficie: {estadisticas['pais_menor_superficie']['nombre']} "
+        f"({formatear_numero(estadisticas['pais_menor_superficie']['superficie'])} km²)",
+    ])
 
 
 def mostrar_estadisticas_continente(estadisticas: Dict[str, Any], continente: str):
@@ -112,63 +155,228 @@ def mostrar_estadisticas_continente(estadisticas: Dict[str, Any], continente: st
         continente (str): Nombre del continente
     """
     if not estadisticas:
-        print(f"❌ No hay estadísticas para el continente: {continente}")
+        _escribir([f"❌ No hay estadísticas para el continente: {continente}"])
         return
     
-    print(f"\n🌍 ESTADÍSTICAS DE {continente.upper()}")
-    mostrar_separador("=", 50)
-    
-    print(f"📈 Total de países: {estadisticas['total_paises']}")
-    print(f"👥 Población total: {formatear_numero(estadisticas['poblacion_total'])} habitantes")
-    print(f"📏 Superficie total: {formatear_numero(estadisticas['superficie_total'])} km²")
+    _escribir([
+        f"\n🌍 ESTADÍSTICAS DE {continente.upper()}",
+        "=" * 50,
+        f"📈 Total de países: {estadisticas['total_paises']}",
+        f"👥 Población total: {formatear_numero(estadisticas['poblacion_total'])} habitantes",
+        f"📏 Superficie total: {formatear_numero(estadisticas['superficie_total'])} km²",
+        # Países extremos del continente
+        f"\n🏆 EXTREMOS EN {continente.upper()}:",
+        f"   Mayor población: {estadisticas['pais_mayor_poblacion']['nombre']} "
+        f"({formatear_numero(estadisticas['pais_mayor_poblacion']['poblacion'])} hab)",
+        f"   Menor población: {estadisticas['pais_menor_poblacion']['nombre']} "
+        f"({formatear_numero(estadisticas['pais_menor_poblacion']['poblacion'])} hab)",
+    ])
+
+
+def _formatear_estimacion(estimacion: Dict[str, float], formato: Callable[[float], str]) -> str:
+    """Formatea una estimación con su intervalo (si no es exacta)."""
+    valor = formato(estimacion['valor'])
+    if estimacion['inferior'] == estimacion['superior']:
+        return valor
+    return f"{valor} [{formato(estimacion['inferior'])} - {formato(estimacion['superior'])}]"
 
+
+def mostrar_estimaciones(estimaciones: Dict[str, Any]):
+    """
+    Muestra las estadísticas estimadas con una muestra (ver muestreo.py).
+
+    Cada valor aproximado va acompañado de su intervalo de confianza.
+
+    Args:
+        estimaciones (Dict[str, Any]): Resultado de estimar_estadisticas_generales
+            o de calcular_estadisticas_exactas
+    """
+    if not estimaciones:
+        _escribir(["❌ No hay estadísticas para mostrar"])
+        return
+
+    def entero(valor: float) -> str:
+        return formatear_numero(round(valor))
+
+    if estimaciones['exacta']:
+        titulo = f"📊 ESTADÍSTICAS EXACTAS ({estimaciones['total_paises']} países)"
+    else:
+        titulo = (f"📊 ESTADÍSTICAS APROXIMADAS (muestra de {formatear_numero(estimaciones['tamano_muestra'])} "
+                  f"de {formatear_numero(estimaciones['total_paises'])} países, "
+                  f"intervalos al {estimaciones['nivel']:.0%})")
+    lineas = [
+        f"\n{titulo}",
+        "=" * 60,
+        f"👥 Población mundial: {_formatear_estimacion(estimaciones['poblacion_total'], entero)} habitantes",
+        f"📏 Superficie mundial: {_formatear_estimacion(estimaciones['superficie_total'], entero)} km²",
+        f"\n📊 Población promedio: {_formatear_estimacion(estimaciones['poblacion_promedio'], entero)} habitantes",
+        f"📊 Superficie promedio: {_formatear_estimacion(estimaciones['superficie_promedio'], entero)} km²",
+        f"📐 Desviación de la población: {_formatear_estimacion(estimaciones['desviacion_poblacion'], entero)}",
+        f"📐 Desviación de la superficie: {_formatear_estimacion(estimaciones['desviacion_superficie'], entero)}",
+        f"🔗 Correlación población-superficie: "
+        f"{_formatear_estimacion(estimaciones['correlacion_poblacion_superficie'], lambda valor: f'{valor:.4f}')}",
+        "\n📈 PERCENTILES DE POBLACIÓN:",
+    ]
+    lineas.extend(f"   Percentil {percentil:g}: {_formatear_estimacion(estimacion, entero)} habitantes"
+                  for percentil, estimacion in estimaciones['percentiles_poblacion'].items())
+    _escribir(lineas)
+
+
+def mostrar_reporte_integridad(reporte: Dict[str, Any], max_detalles: int = 10):
+    """
+    Muestra el reporte de integridad generado durante la carga de datos.
+    
+    Args:
+        reporte (Dict[str, Any]): Reporte de integridad
+        max_detalles (int): Cantidad máxima de problemas a detallar por tipo
+    """
+    if not reporte.get('verificado', True):
+        _escribir(["⏩ Verificación omitida: el archivo coincide con uno ya verificado"])
+        return
+    
+    errores = reporte['errores']
+    duplicados = reporte['duplicados']
+    if not errores and not duplicados:
+        _escribir([f"✓ Integridad verificada: {reporte['filas_validas']} de "
+                   f"{reporte['total_filas']} filas válidas"])
+        return
     
-    # Países extremos del continente
-    print(f"\n🏆 EXTREMOS EN {continente.upper()}:")
-    print(f"   Mayor población: {estadisticas['pais_mayor_poblacion']['nombre']} "
-          f"({formatear_numero(estadisticas['pais_mayor_poblacion']['poblacion'])} hab)")
-    print(f"   Menor población: {estadisticas['pais_menor_poblacion']['nombre']} "
-          f"({formatear_numero(estadisticas['pais_menor_poblacion']['poblacion'])} hab)")
+    lineas = [f"\n🔍 REPORTE DE INTEGRIDAD: {reporte['filas_validas']} de "
+              f"{reporte['total_filas']} filas válidas", "-" * 50]
+    
+    if errores:
+        lineas.append(f"❌ Filas descartadas: {len(errores)}")
+        lineas.extend(f"   Fila {error['fila']}: {error['mensaje']}" for error in errores[:max_detalles])
+        if len(errores) > max_detalles:
+            lineas.append(f"   ... y {len(errores) - max_detalles} más")
+    
+    if duplicados:
+        lineas.append(f"⚠️ Nombres repetidos: {len(duplicados)}")
+        lineas.extend(f"   Fila {duplicado['fila']}: '{duplicado['nombre']}' "
+                      f"(ya aparece en la fila {duplicado['fila_original']})"
+                      for duplicado in duplicados[:max_detalles])
+        if len(duplicados) > max_detalles:
+            lineas.append(f"   ... y {len(duplicados) - max_detalles} más")
+    
+    _escribir(lineas)
 
 
 def mostrar_menu_principal():
     """Muestra el menú principal de la aplicación."""
-    print("\n" + "="*60)
-    print("🌍 SISTEMA DE GESTIÓN DE DATOS DE PAÍSES")
-    print("="*60)
-    print("1. ➕ Agregar un país")
-    print("2. ✏️  Actualizar datos de un país")
-    print("3. 🔍 Buscar país por nombre")
-    print("4. 🌎 Filtrar países por continente")
-    print("5. 📊 Filtrar países por rango de población")
-    print("6. 📏 Filtrar países por rango de superficie")
-    print("7. 📈 Ordenar países por criterio")
-    print("8. 📊 Mostrar estadísticas generales")
-    print("9. 🌍 Mostrar estadísticas por continente")
-    print("0. 🚪 Salir")
-    print("="*60)
+    _escribir([
+        "\n" + "="*60,
+        "🌍 SISTEMA DE GESTIÓN DE DATOS DE PAÍSES",
+        "="*60,
+        "1. ➕ Agregar un país",
+        "2. ✏️  Actualizar datos de un país",
+        "3. 🔍 Buscar país por nombre",
+        "4. 🌎 Filtrar países por continente",
+        "5. 📊 Filtrar países por rango de población",
+        "6. 📏 Filtrar países por rango de superficie",
+        "7. 📈 Ordenar países por criterio",
+        "8. 📊 Mostrar estadísticas generales",
+        "9. 🌍 Mostrar estadísticas por continente",
+        "10. 📜 Historial de población",
+        "11. 🔎 Búsqueda avanzada",
+        "12. 📍 Búsqueda geográfica",
+        "0. 🚪 Salir",
+        "="*60,
+    ])
 
 
 def mostrar_submenu_ordenamiento():
     """Muestra el submenú de ordenamiento."""
-    print("\n📈 ORDENAR PAÍSES POR:")
-    print("1. Nombre (A-Z)")
-    print("2. Nombre (Z-A)")
-    print("3. Población (Mayor a menor)")
-    print("4. Población (Menor a mayor)")
-    print("5. Superficie (Mayor a menor)")
-    print("6. Superficie (Menor a mayor)")
-    print("0. Volver al menú principal")
+    _escribir([
+        "\n📈 ORDENAR PAÍSES POR:",
+        "1. Nombre (A-Z)",
+        "2. Nombre (Z-A)",
+        "3. Población (Mayor a menor)",
+        "4. Población (Menor a mayor)",
+        "5. Superficie (Mayor a menor)",
+        "6. Superficie (Menor a mayor)",
+        "7. Densidad (Mayor a menor)",
+        "8. Densidad (Menor a mayor)",
+        "0. Volver al menú principal",
+    ])
+
+
+def mostrar_submenu_historial():
+    """Muestra el submenú del historial de población."""
+    _escribir([
+        "\n📜 CONSULTAR EL HISTORIAL:",
+        "1. Población de un país en un año",
+        "2. Crecimiento de un país entre dos años",
+        "3. Países que más crecieron entre dos años",
+        "4. Estadísticas generales en un año",
+        "0. Volver al menú principal",
+    ])
+
+
+def mostrar_submenu_geografia():
+    """Muestra el submenú de búsquedas geográficas."""
+    _escribir([
+        "\n📍 BUSCAR PAÍSES POR UBICACIÓN:",
+        "1. Los más cercanos a un punto",
+        "2. Dentro de un radio",
+        "3. Dentro de un rectángulo de latitudes y longitudes",
+        "0. Volver al menú principal",
+    ])
+
+
+def mostrar_paises_con_distancia(pares: List[Tuple[Dict[str, Any], float]], titulo: str):
+    """
+    Muestra países junto con su distancia a un punto.
+    
+    Args:
+        pares (List[Tuple[Dict[str, Any], float]]): Pares (país, distancia en
+            km), como los devuelven geografia.buscar_mas_cercanos y buscar_en_radio
+        titulo (str): Título de la lista
+    """
+    if not pares:
+        _escribir([f"❌ No se encontraron países: {titulo.lower()}"])
+        return
+    
+    lineas = [f"\n📍 {titulo}", "-" * 50]
+    for posicion, (pais, distancia) in enumerate(pares, start=1):
+        lineas.append(f"{posicion:3d}. {pais['nombre']} ({pais['continente']}): "
+                      f"{formatear_numero(round(distancia))} km")
+    _escribir(lineas)
+
+
+def mostrar_crecimientos(crecimientos: List[Dict[str, Any]], titulo: str):
+    """
+    Muestra el crecimiento de población de uno o más países.
+    
+    Args:
+        crecimientos (List[Dict[str, Any]]): Crecimientos como los devuelve
+            historial.crecimiento_entre_anios
+        titulo (str): Título de la lista
+    """
+    if not crecimientos:
+        _escribir([f"❌ No hay países con registros para: {titulo.lower()}"])
+        return
+    
+    lineas = [f"\n📈 {titulo}", "-" * 50]
+    for posicion, crecimiento in enumerate(crecimientos, start=1):
+        signo = "+" if crecimiento['diferencia'] >= 0 else "-"
+        lineas.append(
+            f"{posicion:3d}. {crecimiento['nombre']}: {formatear_numero(crecimiento['inicio'])} → "
+            f"{formatear_numero(crecimiento['fin'])} hab "
+            f"({signo}{formatear_numero(abs(crecimiento['diferencia']))}, {crecimiento['porcentaje']:+.2f}%)"
+        )
+    _escribir(lineas)
 
 
 def mostrar_submenu_top():
     """Muestra el submenú de top países."""
-    print("\n🏆 MOSTRAR TOP PAÍSES POR:")
-    print("1. Población (Mayor a menor)")
-    print("2. Superficie (Mayor a menor)")
-    print("3. Población (Menor a mayor)")
-    print("4. Superficie (Menor a mayor)")
-    print("0. Volver al menú principal")
+    _escribir([
+        "\n🏆 MOSTRAR TOP PAÍSES POR:",
+        "1. Población (Mayor a menor)",
+        "2. Superficie (Mayor a menor)",
+        "3. Población (Menor a mayor)",
+        "4. Superficie (Menor a mayor)",
+        "0. Volver al menú principal",
+    ])
 
 
 def mostrar_continentes_disponibles(continentes: List[str]):
@@ -178,10 +386,9 @@ def mostrar_continentes_disponibles(continentes: List[str]):
     Args:
         continentes (List[str]): Lista de continentes
     """
-    print("\n🌍 CONTINENTES DISPONIBLES:")
-    mostrar_separador("-", 30)
-    for i, continente in enumerate(continentes, 1):
-        print(f"{i:2d}. {continente}")
+    lineas = ["\n🌍 CONTINENTES DISPONIBLES:", "-" * 30]
+    lineas.extend(f"{i:2d}. {continente}" for i, continente in enumerate(continentes, 1))
+    _escribir(lineas)
 
 
 def mostrar_resultados_busqueda(paises: List[Dict[str, Any]], tipo_busqueda: str):
@@ -193,19 +400,19 @@ def mostrar_resultados_busqueda(paises: List[Dict[str, Any]], tipo_busqueda: str
         tipo_busqueda (str): Tipo de búsqueda realizada
     """
     if not paises:
-        print(f"❌ No se encontraron países con la búsqueda: {tipo_busqueda}")
+        _escribir([f"❌ No se encontraron países con la búsqueda: {tipo_busqueda}"])
         return
     
-    print(f"\n✅ Búsqueda exitosa: {tipo_busqueda}")
-    print(f"📊 Se encontraron {len(paises)} países")
+    lineas = [f"\n✅ Búsqueda exitosa: {tipo_busqueda}", f"📊 Se encontraron {len(paises)} países"]
     
     # Mostrar solo los primeros 10 países
     paises_a_mostrar = paises[:10]
-    mostrar_lista_paises(paises_a_mostrar, f"Resultados de: {tipo_busqueda}")
+    lineas.extend(_lineas_lista_paises(paises_a_mostrar, f"Resultados de: {tipo_busqueda}"))
     
     if len(paises) > 10:
-        print(f"\n💡 Se encontraron {len(paises)} países. Mostrando los primeros 10.")
-        print("   Use la opción 'Mostrar todos los países' para ver la lista completa.")
+        lineas.append(f"\n💡 Se encontraron {len(paises)} países. Mostrando los primeros 10.")
+        lineas.append("   Use la opción 'Mostrar todos los países' para ver la lista completa.")
+    _escribir(lineas)
 
 
 def mostrar_distribucion_poblacion(distribucion: Dict[str, Any]):
@@ -216,25 +423,56 @@ def mostrar_distribucion_poblacion(distribucion: Dict[str, Any]):
         distribucion (Dict[str, Any]): Análisis de distribución
     """
     if not distribucion:
-        print("❌ No hay datos de distribución para mostrar")
+        _escribir(["❌ No hay datos de distribución para mostrar"])
         return
     
-    print("\n📊 DISTRIBUCIÓN DE POBLACIÓN")
-    mostrar_separador("=", 50)
-    
-    print(f"📈 Distribución de población:")
-    print(f"   Percentil 90: {formatear_numero(distribucion['percentil_90'])} habitantes")
-    print(f"   Mediana: {formatear_numero(distribucion['mediana'])} habitantes")
+    lineas = [
+        "\n📊 DISTRIBUCIÓN DE POBLACIÓN",
+        "=" * 50,
+        f"📈 Distribución de población:",
+        f"   Percentil 90: {formatear_numero(distribucion['percentil_90'])} habitantes",
+        f"   Mediana: {formatear_numero(distribucion['mediana'])} habitantes",
+    ]
+    lineas.extend(f"   Percentil {percentil:g}: {formatear_numero(round(valor))} habitantes"
+                  for percentil, valor in distribucion.get('percentiles', {}).items())
     
-    print(f"\n📊 Clasificación por tamaño:")
-    print(f"   🌟 Países grandes (top 10%): {distribucion['paises_grandes']} países")
-    print(f"   📉 Países pequeños (bottom 50%): {distribucion['paises_pequeños']} países")
+    lineas.append(f"\n📊 Clasificación por tamaño:")
+    lineas.append(f"   🌟 Países grandes (top 10%): {distribucion['paises_grandes']} países")
+    lineas.append(f"   📉 Países pequeños (bottom 50%): {distribucion['paises_pequeños']} países")
     
     # Mostrar algunos ejemplos
     if distribucion['lista_grandes']:
-        print(f"\n🏆 Top 5 países más poblados:")
-        for i, pais in enumerate(distribucion['lista_grandes'][:5], 1):
-            print(f"   {i}. {pais['nombre']}: {formatear_numero(pais['poblacion'])} habitantes")
+        lineas.append(f"\n🏆 Top 5 países más poblados:")
+        lineas.extend(f"   {i}. {pais['nombre']}: {formatear_numero(pais['poblacion'])} habitantes"
+                      for i, pais in enumerate(distribucion['lista_grandes'][:5], 1))
+    _escribir(lineas)
+
+
+def mostrar_histograma(histograma: List[Tuple[Any, int]], titulo: str,
+                       formatear_grupo: Optional[Callable[[Any], str]] = None, ancho: int = 30):
+    """
+    Muestra un histograma de barras horizontales.
+    
+    Args:
+        histograma (List[Tuple[Any, int]]): Pares (grupo, cantidad)
+        titulo (str): Título del histograma
+        formatear_grupo (Callable, optional): Función para mostrar cada grupo
+        ancho (int): Largo de la barra más larga
+    """
+    if not histograma:
+        _escribir([f"❌ No hay datos para el histograma: {titulo}"])
+        return
+    
+    lineas = [f"\n📊 {titulo}", "-" * 50]
+    
+    etiquetas = [formatear_grupo(g) if formatear_grupo else str(g) for g, _ in histograma]
+    ancho_etiqueta = max(len(etiqueta) for etiqueta in etiquetas)
+    maximo = max(cantidad for _, cantidad in histograma)
+    
+    for etiqueta, (_, cantidad) in zip(etiquetas, histograma):
+        barra = "█" * max(1, round(cantidad / maximo * ancho)) if cantidad else ""
+        lineas.append(f"   {etiqueta:<{ancho_etiqueta}} | {barra} {cantidad}")
+    _escribir(lineas)
 
 
 def mostrar_correlacion(correlacion: float):
@@ -244,11 +482,6 @@ def mostrar_correlacion(correlacion: float):
     Args:
         correlacion (float): Coeficiente de correlación
     """
-    print(f"\n📊 CORRELACIÓN POBLACIÓN-SUPERFICIE")
-    mostrar_separador("-", 40)
-    
-    print(f"🔗 Coeficiente de correlación: {correlacion}")
-    
     if correlacion > 0.7:
         interpretacion = "Correlación fuerte positiva"
     elif correlacion > 0.3:
@@ -260,7 +493,12 @@ def mostrar_correlacion(correlacion: float):
     else:
         interpretacion = "Correlación fuerte negativa"
     
-    print(f"📝 Interpretación: {interpretacion}")
+    _escribir([
+        f"\n📊 CORRELACIÓN POBLACIÓN-SUPERFICIE",
+        "-" * 40,
+        f"🔗 Coeficiente de correlación: {correlacion}",
+        f"📝 Interpretación: {interpretacion}",
+    ])
 
 
 
@@ -279,18 +517,16 @@ def exportar_a_archivo(paises: List[Dict[str, Any]], nombre_archivo: str,
     """
     try:
         if formato == 'txt':
+            lineas = ["LISTA DE PAÍSES", "=" * 50, ""]
+            for i, pais in enumerate(paises, 1):
+                lineas.append(f"{i}. {pais['nombre']}")
+                lineas.append(f"   Continente: {pais['continente']}")
+                lineas.append(f"   Población: {formatear_numero(pais['poblacion'])} habitantes")
+                lineas.append(f"   Superficie: {formatear_numero(pais['superficie'])} km²")
             with open(nombre_archivo, 'w', encoding='utf-8') as archivo:
-                archivo.write("LISTA DE PAÍSES\n")
-                archivo.write("=" * 50 + "\n\n")
-                
-                for i, pais in enumerate(paises, 1):
-                    archivo.write(f"{i}. {pais['nombre']}\n")
-                    archivo.write(f"   Continente: {pais['continente']}\n")
-                    archivo.write(f"   Población: {formatear_numero(pais['poblacion'])} habitantes\n")
-                    archivo.write(f"   Superficie: {formatear_numero(pais['superficie'])} km²\n")
+                archivo.write("\n".join(lineas) + "\n")
         
         elif formato == 'csv':
-            import csv
             with open(nombre_archivo, 'w', encoding='utf-8', newline='') as archivo:
                 if paises:
                     campos = paises[0].keys()
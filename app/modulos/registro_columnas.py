@@ -0,0 +1,206 @@
+"""
+Módulo de Registro de Columnas
+==============================
+Este módulo describe las columnas que puede tener un CSV de países. Cada
+columna registrada declara:
+
+- 'tipo': 'texto', 'entero' o 'decimal', que define cómo se convierte la celda
+- 'validar': función que recibe el valor convertido y devuelve si es válido
+- 'mensaje': mensaje de error para las celdas inválidas ({valor} es la celda)
+- 'requerida': si la celda no puede quedar vacía
+- 'indice': qué índice la usa ('nombres', 'bitmap', 'rangos', 'geografico'
+  o 'ninguno')
+
+Las columnas que el CSV trae y no están registradas (por ejemplo 'capital')
+se conservan como texto sin modificar, de modo que sobreviven a una carga y
+un guardado. Para convertir una de ellas basta con registrarla:
+
+    registrar_columna('pib', 'decimal', validar=lambda valor: valor >= 0)
+
+Por cada encabezado distinto, compilar_conversor arma una sola vez la
+función que convierte las columnas adicionales de una fila, con las
+posiciones y conversiones ya resueltas.
+"""
+
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Sequence, Tuple
+from .columnas_derivadas import COLUMNAS_DERIVADAS
+
+
+def _convertir_entero(texto: str) -> int:
+    """Convierte un entero que puede tener separadores de miles."""
+    return int(texto.replace(',', '').replace('.', ''))
+
+
+# Conversión de la celda según el tipo de la columna
+TIPOS_COLUMNA: Dict[str, Callable[[str], Any]] = {
+    'texto': str.strip,
+    'entero': _convertir_entero,
+    'decimal': float,
+}
+
+# Índices que pueden declarar las columnas
+POLITICAS_INDICE = ('ninguno', 'nombres', 'bitmap', 'rangos', 'geografico')
+
+# Columnas registradas, por nombre
+REGISTRO_COLUMNAS: Dict[str, Dict[str, Any]] = {}
+
+
+def registrar_columna(nombre: str, tipo: str = 'texto',
+                      validar: Optional[Callable[[Any], bool]] = None,
+                      mensaje: Optional[str] = None, requerida: bool = False,
+                      indice: str = 'ninguno', integrada: bool = False,
+                      derivada: bool = False) -> Dict[str, Any]:
+    """
+    Registra (o reemplaza) la definición de una columna.
+
+    Args:
+        nombre (str): Nombre de la columna en el encabezado del CSV
+        tipo (str): Tipo de la columna (ver TIPOS_COLUMNA)
+        validar (Callable, optional): Función que recibe el valor convertido
+            y devuelve True si es válido
+        mensaje (str, optional): Mensaje de error; puede usar {valor}
+        requerida (bool): Si la celda no puede quedar vacía
+        indice (str): Índice que usa la columna (ver POLITICAS_INDICE)
+        integrada (bool): Si la carga la convierte por su cuenta (las columnas
+            requeridas y las coordenadas)
+        derivada (bool): Si se calcula al cargar y no se lee ni se guarda
+
+    Returns:
+        Dict[str, Any]: Definición registrada
+
+    Raises:
+        ValueError: Si el tipo o la política de índice no son válidos
+    """
+    if tipo not in TIPOS_COLUMNA:
+        raise ValueError(f"Tipo de columna inválido: {tipo}. "
+                         f"Tipos válidos: {', '.join(TIPOS_COLUMNA)}")
+    if indice not in POLITICAS_INDICE:
+        raise ValueError(f"Política de índice inválida: {indice}. "
+                         f"Políticas válidas: {', '.join(POLITICAS_INDICE)}")
+
+    definicion = {
+        'nombre': nombre,
+        'tipo': tipo,
+        'convertir': TIPOS_COLUMNA[tipo],
+        'validar': validar,
+        'mensaje': mensaje or f"Valor inválido en la columna {nombre}: '{{valor}}'",
+        'requerida': requerida,
+        'indice': indice,
+        'integrada': integrada,
+        'derivada': derivada,
+    }
+    REGISTRO_COLUMNAS[nombre] = definicion
+    # Los conversores ya compilados pueden usar la definición anterior
+    compilar_conversor.cache_clear()
+    return definicion
+
+
+def convertir_valor(definicion: Dict[str, Any], texto: Optional[str]) -> Any:
+    """
+    Convierte y valida una celda según la definición de su columna.
+
+    Raises:
+        ValueError: Si la celda no se puede convertir o no es válida
+    """
+    try:
+        valor = definicion['convertir'](texto)
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError(definicion['mensaje'].format(valor=texto))
+    if definicion['validar'] is not None and not definicion['validar'](valor):
+        raise ValueError(definicion['mensaje'].format(valor=texto))
+    return valor
+
+
+def columnas_con_indice(politica: str) -> List[str]:
+    """Nombres de las columnas registradas que usan un índice."""
+    return [nombre for nombre, definicion in REGISTRO_COLUMNAS.items()
+            if definicion['indice'] == politica]
+
+
+def columnas_adicionales(encabezado: Sequence[str]) -> List[str]:
+    """
+    Columnas de un encabezado que la carga no convierte por su cuenta.
+
+    Se omiten las columnas integradas, las derivadas (se recalculan), las
+    que no tienen nombre y las repetidas (vale la primera).
+    """
+    adicionales = []
+    for columna in encabezado:
+        definicion = REGISTRO_COLUMNAS.get(columna)
+        if (not columna or columna in adicionales
+                or (definicion is not None and (definicion['integrada'] or definicion['derivada']))):
+            continue
+        adicionales.append(columna)
+    return adicionales
+
+
+def es_columna_adicional(columna: Any) -> bool:
+    """Indica si una clave de un país corresponde a una columna adicional."""
+    if not isinstance(columna, str) or not columna:
+        return False
+    definicion = REGISTRO_COLUMNAS.get(columna)
+    return definicion is None or not (definicion['integrada'] or definicion['derivada'])
+
+
+@lru_cache(maxsize=None)
+def compilar_conversor(columnas: Tuple[str, ...]) -> Callable[[Sequence[Optional[str]]], Dict[str, Any]]:
+    """
+    Arma la función que convierte las columnas adicionales de una fila.
+
+    Args:
+        columnas (Tuple[str, ...]): Columnas adicionales, en el orden de la fila
+
+    Returns:
+        Callable: Función que recibe las celdas de esas columnas (puede
+            recibir menos si la fila es corta) y devuelve un diccionario con
+            sus valores; las celdas que faltan y las vacías de columnas
+            registradas se omiten
+
+    Raises:
+        ValueError: (la función devuelta) si una celda de una columna
+            registrada no es válida
+    """
+    registradas = tuple(REGISTRO_COLUMNAS[columna] for columna in columnas
+                        if columna in REGISTRO_COLUMNAS)
+
+    if not registradas:
+        # Solo columnas desconocidas: las celdas se guardan tal como están
+        def convertir(celdas: Sequence[Optional[str]]) -> Dict[str, Any]:
+            return {columna: celda for columna, celda in zip(columnas, celdas) if celda is not None}
+        return convertir
+
+    def convertir(celdas: Sequence[Optional[str]]) -> Dict[str, Any]:
+        valores = {columna: celda for columna, celda in zip(columnas, celdas) if celda is not None}
+        for definicion in registradas:
+            columna = definicion['nombre']
+            texto = valores.get(columna)
+            if texto is None or not texto.strip():
+                if definicion['requerida']:
+                    raise ValueError(definicion['mensaje'].format(valor=texto))
+                valores.pop(columna, None)
+                continue
+            valores[columna] = convertir_valor(definicion, texto)
+        return valores
+    return convertir
+
+
+# Columnas requeridas del CSV, que la carga convierte directamente
+registrar_columna('nombre', 'texto', validar=bool, requerida=True, indice='nombres', integrada=True,
+                  mensaje="El nombre del país no puede estar vacío")
+registrar_columna('poblacion', 'entero', validar=lambda valor: valor > 0, requerida=True,
+                  indice='rangos', integrada=True, mensaje="Población inválida: '{valor}'")
+registrar_columna('superficie', 'entero', validar=lambda valor: valor > 0, requerida=True,
+                  indice='rangos', integrada=True, mensaje="Superficie inválida: '{valor}'")
+registrar_columna('continente', 'texto', validar=bool, requerida=True, indice='bitmap', integrada=True,
+                  mensaje="El continente no puede estar vacío")
+
+# Coordenadas opcionales (se validan de a pares al cargar)
+registrar_columna('latitud', 'decimal', validar=lambda valor: -90 <= valor <= 90,
+                  indice='geografico', integrada=True)
+registrar_columna('longitud', 'decimal', validar=lambda valor: -180 <= valor <= 180,
+                  indice='geografico', integrada=True)
+
+# Columnas calculadas al cargar
+for _columna in COLUMNAS_DERIVADAS:
+    registrar_columna(_columna, 'decimal', derivada=True)
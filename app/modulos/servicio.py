@@ -0,0 +1,194 @@
+"""
+Módulo de Servicio Asíncrono
+============================
+Este módulo ofrece la clase ServicioPaises para resolver muchas búsquedas
+y filtros a la vez desde código asyncio (por ejemplo, al procesar registros
+que llegan de otro sistema), sin bloquear el bucle de eventos:
+
+    servicio = ServicioPaises(paises, indice_difuso['paises'], indice_bitmap)
+    resultados = await servicio.buscar_muchos(['Argentina', 'Chile', 'argentina'])
+
+- Las solicitudes repetidas se resuelven una sola vez, tanto dentro de una
+  misma llamada como entre llamadas concurrentes: si otra tarea ya pidió el
+  mismo nombre o filtro, se espera su resultado en lugar de repetir el trabajo.
+- Las solicitudes nuevas se agrupan en lotes y cada lote se resuelve en un
+  ejecutor (por defecto, el de hilos del bucle), con una pasada por lote
+  sobre el índice de nombres.
+
+El servicio lee la lista y los índices sin copiarlos: no deben modificarse
+mientras haya solicitudes en curso.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import List, Dict, Any, Optional, Iterable, Callable, Tuple
+from .validacion import normalizar_texto_busqueda
+from .consultas import buscar_paises_multiples_criterios
+
+# Cantidad de solicitudes distintas que se resuelven en cada tarea del ejecutor
+TAMANO_LOTE_POR_DEFECTO = 256
+
+
+class _FiltroNoCompartido:
+    """Criterios de un filtro que no pueden usarse como clave: se comparan por identidad."""
+
+    __slots__ = ('criterios',)
+
+    def __init__(self, criterios: Tuple):
+        self.criterios = criterios
+
+
+def _clave_filtro(consulta: Dict[str, Any]) -> Tuple:
+    """
+    Arma la clave con la que se reconocen los filtros repetidos.
+
+    Las listas (por ejemplo cerca_de=[latitud, longitud, radio]) se pasan a
+    tuplas. Si aun así algún valor no puede usarse como clave, el filtro se
+    resuelve igual pero sin compartirse con otras solicitudes.
+    """
+    criterios = tuple(sorted(
+        (criterio, tuple(valor) if isinstance(valor, list) else valor)
+        for criterio, valor in consulta.items()
+    ))
+    try:
+        hash(criterios)
+    except TypeError:
+        return ('filtro', _FiltroNoCompartido(criterios))
+    return ('filtro', criterios)
+
+
+class ServicioPaises:
+    """Búsquedas y filtros concurrentes sobre una lista de países."""
+
+    def __init__(self, paises: List[Dict[str, Any]],
+                 indice_nombres: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 indice_bitmap: Optional[Dict[str, Any]] = None,
+                 ejecutor: Optional[Executor] = None,
+                 tamano_lote: int = TAMANO_LOTE_POR_DEFECTO):
+        """
+        Args:
+            paises (List[Dict[str, Any]]): Lista de países
+            indice_nombres (Dict[str, List[Dict[str, Any]]], optional): Países por
+                nombre normalizado, como indice_difuso['paises']; si no se
+                recibe, se construye a partir de la lista
+            indice_bitmap (Dict[str, Any], optional): Índice creado con
+                crear_indice_bitmap, usado por filtrar_muchos
+            ejecutor (Executor, optional): Ejecutor basado en hilos; None usa
+                el ejecutor por defecto del bucle de eventos
+            tamano_lote (int): Solicitudes distintas por tarea del ejecutor
+        """
+        if indice_nombres is None:
+            indice_nombres = {}
+            for pais in paises:
+                indice_nombres.setdefault(normalizar_texto_busqueda(pais['nombre']), []).append(pais)
+
+        self._paises = paises
+        self._indice_nombres = indice_nombres
+        self._indice_bitmap = indice_bitmap
+        self._ejecutor = ejecutor
+        self._tamano_lote = max(1, tamano_lote)
+        # Solicitudes en curso: clave -> (futuro del lote, posición en el lote)
+        self._en_curso: Dict[Tuple, Tuple[asyncio.Future, int]] = {}
+
+    async def buscar_muchos(self, nombres: Iterable[str],
+                            busqueda_exacta: bool = True) -> List[List[Dict[str, Any]]]:
+        """
+        Busca varios países por nombre, como buscar_pais_por_nombre.
+
+        Args:
+            nombres (Iterable[str]): Nombres a buscar (pueden repetirse)
+            busqueda_exacta (bool): Si debe ser búsqueda exacta; si no, se
+                buscan los nombres que contienen el texto
+
+        Returns:
+            List[List[Dict[str, Any]]]: Países encontrados para cada nombre,
+                en el mismo orden en que se recibieron los nombres
+        """
+        claves = [('nombre', busqueda_exacta, normalizar_texto_busqueda(nombre or ''))
+                  for nombre in nombres]
+        return await self._resolver(claves, self._buscar_lote)
+
+    async def filtrar_muchos(self, consultas: Iterable[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Aplica varios filtros, como buscar_paises_multiples_criterios.
+
+        Args:
+            consultas (Iterable[Dict[str, Any]]): Criterios de cada filtro, con
+                los nombres de parámetros de buscar_paises_multiples_criterios
+                (por ejemplo {'continente': 'Asia', 'poblacion_min': 1000000})
+
+        Returns:
+            List[List[Dict[str, Any]]]: Países que cumplen cada filtro, en el
+                mismo orden en que se recibieron las consultas
+        """
+        claves = [_clave_filtro(consulta) for consulta in consultas]
+        return await self._resolver(claves, self._filtrar_lote)
+
+    async def _resolver(self, claves: List[Tuple],
+                        resolver_lote: Callable[[List[Tuple]], List[List[Dict[str, Any]]]]
+                        ) -> List[List[Dict[str, Any]]]:
+        """Resuelve las claves reutilizando las solicitudes en curso y agrupando las nuevas."""
+        bucle = asyncio.get_running_loop()
+
+        ubicaciones = {}
+        nuevas = []
+        for clave in dict.fromkeys(claves):
+            if clave in self._en_curso:
+                ubicaciones[clave] = self._en_curso[clave]
+            else:
+                nuevas.append(clave)
+
+        for inicio in range(0, len(nuevas), self._tamano_lote):
+            lote = nuevas[inicio:inicio + self._tamano_lote]
+            futuro = bucle.run_in_executor(self._ejecutor, resolver_lote, lote)
+            for posicion, clave in enumerate(lote):
+                ubicaciones[clave] = self._en_curso[clave] = (futuro, posicion)
+            futuro.add_done_callback(partial(self._liberar, lote))
+
+        # shield: si esta tarea se cancela, otras pueden estar esperando el mismo lote
+        futuros = {futuro for futuro, _ in ubicaciones.values()}
+        await asyncio.gather(*(asyncio.shield(futuro) for futuro in futuros))
+
+        resultados = []
+        for clave in claves:
+            futuro, posicion = ubicaciones[clave]
+            resultados.append(list(futuro.result()[posicion]))
+        return resultados
+
+    def _liberar(self, lote: List[Tuple], futuro: asyncio.Future):
+        """Quita de las solicitudes en curso las claves de un lote terminado."""
+        for clave in lote:
+            if self._en_curso.get(clave, (None,))[0] is futuro:
+                del self._en_curso[clave]
+
+    def _buscar_lote(self, claves: List[Tuple]) -> List[List[Dict[str, Any]]]:
+        """Busca un lote de nombres normalizados en el índice de nombres."""
+        indice = self._indice_nombres
+        exactas = [clave[2] for clave in claves if clave[1]]
+        parciales = [clave[2] for clave in claves if not clave[1]]
+
+        encontrados = {}
+        for nombre in exactas:
+            encontrados[(True, nombre)] = indice.get(nombre, ()) if nombre else ()
+
+        if parciales:
+            # Una sola pasada por el índice para todos los textos del lote
+            coincidencias = {texto: [] for texto in parciales if texto}
+            for nombre_indexado, paises_nombre in indice.items():
+                for texto, lista in coincidencias.items():
+                    if texto in nombre_indexado:
+                        lista.extend(paises_nombre)
+            for texto in parciales:
+                encontrados[(False, texto)] = coincidencias.get(texto, ())
+
+        return [encontrados[(clave[1], clave[2])] for clave in claves]
+
+    def _filtrar_lote(self, claves: List[Tuple]) -> List[List[Dict[str, Any]]]:
+        """Resuelve un lote de filtros con buscar_paises_multiples_criterios."""
+        return [
+            buscar_paises_multiples_criterios(
+                self._paises, indice_bitmap=self._indice_bitmap,
+                **dict(clave[1].criterios if isinstance(clave[1], _FiltroNoCompartido) else clave[1]))
+            for clave in claves
+        ]
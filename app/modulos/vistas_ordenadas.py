@@ -0,0 +1,150 @@
+"""
+Módulo de Vistas Ordenadas
+==========================
+Este módulo mantiene listas de países ordenadas por un criterio que se
+actualizan de forma incremental: al modificar un país solo se reubica esa
+fila (búsqueda binaria) en lugar de volver a ordenar todo, y el orden
+descendente se obtiene recorriendo la misma vista al revés, grupo de
+empates por grupo de empates.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any, Iterator
+from .ordenamiento import obtener_clave_ordenamiento
+
+
+def crear_vista_ordenada(paises: List[Dict[str, Any]], criterio: str) -> Dict[str, Any]:
+    """
+    Crea una vista ordenada de países según un criterio.
+
+    Cada entrada se identifica por (clave, secuencia), donde la secuencia es
+    el orden de llegada: así los empates conservan el orden original y cada
+    país puede ubicarse con búsqueda binaria.
+
+    Args:
+        paises (List[Dict[str, Any]]): Países a incluir en la vista
+        criterio (str): Criterio de ordenamiento ('nombre', 'poblacion', 'superficie')
+
+    Returns:
+        Dict[str, Any]: Vista ordenada de menor a mayor
+    """
+    clave = obtener_clave_ordenamiento(criterio)
+    entradas = sorted(
+        (((clave(pais), secuencia), pais) for secuencia, pais in enumerate(paises)),
+        key=lambda entrada: entrada[0]
+    )
+
+    return {
+        'criterio': criterio,
+        'clave': clave,
+        'claves': [entrada for entrada, _ in entradas],
+        'paises': [pais for _, pais in entradas],
+        'entrada_por_id': {id(pais): entrada for entrada, pais in entradas},
+        'siguiente': len(paises),
+    }
+
+
+def contiene_pais(vista: Dict[str, Any], pais: Dict[str, Any]) -> bool:
+    """Indica si un país forma parte de la vista."""
+    return id(pais) in vista['entrada_por_id']
+
+
+def agregar_a_vista(vista: Dict[str, Any], pais: Dict[str, Any]):
+    """
+    Inserta un país en su posición dentro de la vista.
+
+    Args:
+        vista (Dict[str, Any]): Vista creada con crear_vista_ordenada
+        pais (Dict[str, Any]): País a insertar
+    """
+    entrada = (vista['clave'](pais), vista['siguiente'])
+    vista['siguiente'] += 1
+    posicion = bisect_right(vista['claves'], entrada)
+    vista['claves'].insert(posicion, entrada)
+    vista['paises'].insert(posicion, pais)
+    vista['entrada_por_id'][id(pais)] = entrada
+
+
+def eliminar_de_vista(vista: Dict[str, Any], pais: Dict[str, Any]) -> bool:
+    """
+    Quita un país de la vista.
+
+    Args:
+        vista (Dict[str, Any]): Vista creada con crear_vista_ordenada
+        pais (Dict[str, Any]): País a quitar
+
+    Returns:
+        bool: True si el país estaba en la vista
+    """
+    entrada = vista['entrada_por_id'].pop(id(pais), None)
+    if entrada is None:
+        return False
+    posicion = bisect_left(vista['claves'], entrada)
+    del vista['claves'][posicion]
+    del vista['paises'][posicion]
+    return True
+
+
+def reubicar_en_vista(vista: Dict[str, Any], pais: Dict[str, Any]) -> bool:
+    """
+    Mueve un país modificado a la posición que corresponde a su nuevo valor.
+
+    Args:
+        vista (Dict[str, Any]): Vista creada con crear_vista_ordenada
+        pais (Dict[str, Any]): País ya modificado
+
+    Returns:
+        bool: True si el país estaba en la vista
+    """
+    entrada = vista['entrada_por_id'].get(id(pais))
+    if entrada is None:
+        return False
+
+    nueva_entrada = (vista['clave'](pais), entrada[1])
+    if nueva_entrada == entrada:
+        return True
+
+    posicion = bisect_left(vista['claves'], entrada)
+    del vista['claves'][posicion]
+    del vista['paises'][posicion]
+
+    posicion = bisect_left(vista['claves'], nueva_entrada)
+    vista['claves'].insert(posicion, nueva_entrada)
+    vista['paises'].insert(posicion, pais)
+    vista['entrada_por_id'][id(pais)] = nueva_entrada
+    return True
+
+
+def recorrer_vista(vista: Dict[str, Any], descendente: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre la vista en orden ascendente o descendente sin reordenar.
+
+    Args:
+        vista (Dict[str, Any]): Vista creada con crear_vista_ordenada
+        descendente (bool): Si debe recorrerse de mayor a menor
+
+    Returns:
+        Iterator[Dict[str, Any]]: Países en el orden solicitado
+    """
+    if descendente:
+        return _recorrer_descendente(vista)
+    return iter(vista['paises'])
+
+
+def _recorrer_descendente(vista: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre la vista de mayor a menor dejando los empates en su orden de llegada.
+
+    Así el resultado coincide con ordenar_personalizado, que es estable en
+    ambos sentidos. Cada grupo de claves iguales se ubica con búsqueda binaria:
+    (clave,) es menor que cualquier entrada (clave, secuencia).
+    """
+    claves = vista['claves']
+    paises = vista['paises']
+    fin = len(claves)
+    while fin:
+        inicio = bisect_left(claves, (claves[fin - 1][0],), 0, fin)
+        # Por posición: islice volvería a recorrer la lista desde el principio
+        for posicion in range(inicio, fin):
+            yield paises[posicion]
+        fin = inicio